@@ -73,6 +73,13 @@ class DatabaseService:
         except Exception as e:
             print(f"❌ Seeding error: {e}")
     
+    @staticmethod
+    def revalidate_plates(restart=False, dry_run=False):
+        """Re-validate and normalize stored plate numbers (resumes an interrupted run)"""
+        from app.database.plate_revalidation import PlateRevalidationJob
+        
+        PlateRevalidationJob(dry_run=dry_run).run(restart=restart)
+    
     @staticmethod
     def fresh():
         """Drop and recreate database with fresh data"""
@@ -0,0 +1,193 @@
+"""
+Bulk Plate Re-validation Job
+Re-checks stored license_plates rows against the current PlateValidator
+rules. Rows are streamed in id order (keyset chunks, so memory stays
+bounded on millions of rows), validated in bulk, and corrections are
+written back with one UPDATE per batch. Progress is checkpointed after
+every chunk, so an interrupted run resumes where it stopped.
+
+Usage:
+    python migrate.py revalidate [--dry-run] [--restart]
+"""
+
+import json
+import os
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from app.utils.plate_validator import PlateValidator
+from app.utils.config import PLATE_REVALIDATION_CHUNK_SIZE, PLATE_REVALIDATION_CHECKPOINT
+
+# Separators older rows used between the plate groups (518-UOZ); read as the space
+LEGACY_SEPARATORS = str.maketrans('-_.', '   ')
+# Rows per UPDATE statement
+UPDATE_BATCH_SIZE = 1000
+FLAG_REASON = "Invalid plate format (re-validation)"
+
+
+class PlateRevalidationJob:
+    """Re-validates and normalizes stored plate numbers in resumable chunks"""
+
+    def __init__(self, chunk_size: int = PLATE_REVALIDATION_CHUNK_SIZE,
+                 checkpoint_path: str = PLATE_REVALIDATION_CHECKPOINT, flag_invalid: bool = True,
+                 dry_run: bool = False, connection_factory: Optional[Callable] = None, placeholder: str = '%s'):
+        """
+        Args:
+            chunk_size: Rows read (and committed) per chunk
+            checkpoint_path: JSON file holding the last committed id and totals
+            flag_invalid: Flag rows that stay invalid after normalization
+            dry_run: Count what would change without writing anything
+            connection_factory: Returns a DB-API connection (default: DatabaseService.get_connection)
+            placeholder: Parameter marker of the connection's driver ('%s' MySQL, '?' sqlite3)
+        """
+        self.chunk_size = max(1, chunk_size)
+        self.checkpoint_path = checkpoint_path
+        self.flag_invalid = flag_invalid
+        self.dry_run = dry_run
+        self.placeholder = placeholder
+        if connection_factory is None:
+            from app.database.database_service import DatabaseService
+            connection_factory = DatabaseService.get_connection
+        self.connection_factory = connection_factory
+
+    @staticmethod
+    def _fresh_state() -> Dict:
+        return {'last_id': 0, 'rows_scanned': 0, 'rows_corrected': 0, 'rows_flagged': 0, 'completed': False}
+
+    def load_checkpoint(self) -> Dict:
+        """Progress of the last run (a fresh state when there is none)"""
+        state = self._fresh_state()
+        if os.path.exists(self.checkpoint_path):
+            with open(self.checkpoint_path, 'r', encoding='utf-8') as f:
+                state.update(json.load(f))
+        return state
+
+    def save_checkpoint(self, state: Dict):
+        """Write the checkpoint atomically (a crash never leaves half a file)"""
+        directory = os.path.dirname(self.checkpoint_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        state['updated_at'] = datetime.now().isoformat(timespec='seconds')
+        temporary_path = self.checkpoint_path + '.tmp'
+        with open(temporary_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f, indent=2)
+        os.replace(temporary_path, self.checkpoint_path)
+
+    def revalidate(self, rows: Sequence[Tuple[int, str, Optional[str]]]) -> Tuple[List[Tuple[int, str]], List[int]]:
+        """
+        Validate one chunk of (id, plate_text, status) rows
+
+        Returns:
+            (corrections [(id, normalized_text)], ids of rows to flag)
+        """
+        texts = [text.translate(LEGACY_SEPARATORS) if isinstance(text, str) else text for _, text, _ in rows]
+        corrections = []
+        invalid_ids = []
+        for (row_id, text, status), (is_valid, normalized_text, _) in zip(rows, PlateValidator.validate_many(texts)):
+            if is_valid:
+                if normalized_text != text:
+                    corrections.append((row_id, normalized_text))
+            elif self.flag_invalid and status != 'flagged':
+                invalid_ids.append(row_id)
+        return corrections, invalid_ids
+
+    def _update_plate_texts(self, cursor, corrections: List[Tuple[int, str]]):
+        """One UPDATE ... CASE statement per UPDATE_BATCH_SIZE corrections"""
+        marker = self.placeholder
+        for start in range(0, len(corrections), UPDATE_BATCH_SIZE):
+            batch = corrections[start:start + UPDATE_BATCH_SIZE]
+            cases = ' '.join([f"WHEN {marker} THEN {marker}"] * len(batch))
+            ids = ', '.join([marker] * len(batch))
+            params = [value for correction in batch for value in correction] + [row_id for row_id, _ in batch]
+            cursor.execute(f"UPDATE license_plates SET plate_text = CASE id {cases} END WHERE id IN ({ids})", params)
+
+    def _flag_rows(self, cursor, row_ids: List[int]):
+        """Flag rows whose plate text cannot be normalized"""
+        marker = self.placeholder
+        for start in range(0, len(row_ids), UPDATE_BATCH_SIZE):
+            batch = row_ids[start:start + UPDATE_BATCH_SIZE]
+            ids = ', '.join([marker] * len(batch))
+            cursor.execute(
+                f"UPDATE license_plates SET status = 'flagged', flag_reason = {marker}, "
+                f"flagged_at = CURRENT_TIMESTAMP WHERE id IN ({ids})",
+                [FLAG_REASON] + batch
+            )
+
+    def run(self, restart: bool = False, max_chunks: Optional[int] = None, progress_every: int = 10) -> Dict:
+        """
+        Re-validate every row after the checkpoint
+
+        Args:
+            restart: Ignore the checkpoint and start from the first row (dry runs always do)
+            max_chunks: Stop after this many chunks (resume later); None = until done
+            progress_every: Print progress every N chunks
+
+        Returns:
+            Checkpoint state plus this run's rows and rows_per_second
+        """
+        state = self.load_checkpoint()
+        if restart or self.dry_run or state['completed']:
+            state = self._fresh_state()
+        elif state['last_id'] > 0:
+            print(f"⏩ Resuming plate re-validation after id {state['last_id']}")
+
+        conn = self.connection_factory()
+        cursor = conn.cursor()
+        marker = self.placeholder
+        run_rows = 0
+        chunks = 0
+        start_time = time.perf_counter()
+
+        try:
+            cursor.execute("SELECT MAX(id) FROM license_plates")
+            max_id = cursor.fetchone()[0] or 0
+
+            while max_chunks is None or chunks < max_chunks:
+                cursor.execute(
+                    f"SELECT id, plate_text, status FROM license_plates WHERE id > {marker} ORDER BY id LIMIT {marker}",
+                    (state['last_id'], self.chunk_size)
+                )
+                rows = cursor.fetchall()
+                if not rows:
+                    state['completed'] = True
+                    break
+
+                corrections, invalid_ids = self.revalidate(rows)
+                if not self.dry_run:
+                    self._update_plate_texts(cursor, corrections)
+                    self._flag_rows(cursor, invalid_ids)
+                    conn.commit()
+
+                state['last_id'] = rows[-1][0]
+                state['rows_scanned'] += len(rows)
+                state['rows_corrected'] += len(corrections)
+                state['rows_flagged'] += len(invalid_ids)
+                if not self.dry_run:
+                    self.save_checkpoint(state)
+
+                run_rows += len(rows)
+                chunks += 1
+                if chunks % progress_every == 0:
+                    elapsed = time.perf_counter() - start_time
+                    percent = state['last_id'] / max_id * 100 if max_id else 100.0
+                    print(f"🔁 {state['rows_scanned']} rows (~{percent:.0f}%), {run_rows / elapsed:,.0f} rows/sec - "
+                          f"{state['rows_corrected']} corrected, {state['rows_flagged']} flagged")
+
+            if state['completed'] and not self.dry_run:
+                self.save_checkpoint(state)
+        except Exception as e:
+            print(f"❌ Plate re-validation error: {e}")
+            conn.rollback()
+            raise
+        finally:
+            cursor.close()
+            conn.close()
+
+        elapsed = time.perf_counter() - start_time
+        result = dict(state, run_rows=run_rows, rows_per_second=round(run_rows / elapsed, 1) if elapsed > 0 else 0.0)
+        mode = " (dry run, nothing written)" if self.dry_run else ""
+        status = "completed" if state['completed'] else "paused"
+        print(f"✅ Plate re-validation {status}{mode}: {run_rows} rows in {elapsed:.1f} s "
+              f"({result['rows_per_second']:,.0f} rows/sec) - {state['rows_corrected']} corrected, "
+              f"{state['rows_flagged']} flagged")
+        return result
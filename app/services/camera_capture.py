@@ -0,0 +1,203 @@
+"""
+Latest-Frame Camera Capture
+Grabs frames from a cv2.VideoCapture on its own thread and keeps only the
+newest one. The driver's buffer is drained as fast as the camera delivers,
+so a consumer that was busy with detection and OCR gets the frame from now
+instead of one that waited seconds in the buffer.
+"""
+
+import collections
+import threading
+import time
+import cv2
+import numpy as np
+from typing import Optional, Tuple, Union
+from app.services.frame_sources import CapturedFrame, FrameSource
+from app.utils.config import CAPTURE_READ_TIMEOUT_SECONDS, CAPTURE_MAX_FAILED_READS, LATEST_FRAME_CAPTURE_ENABLED
+
+# Displayed frames kept for the latency percentiles
+LATENCY_WINDOW = 100
+
+
+class LatestFrameCapture(FrameSource):
+    """cv2.VideoCapture wrapper with a capture thread and a single-slot newest-frame buffer"""
+
+    def __init__(self, source: Union[int, str, cv2.VideoCapture] = 0, name: str = "Camera"):
+        """
+        Args:
+            source: Camera index, video file / stream URL, or an opened cv2.VideoCapture
+            name: Camera name for log lines
+        """
+        super().__init__(name)
+        self.capture = source if hasattr(source, 'read') else cv2.VideoCapture(source)
+        self.condition = threading.Condition()
+        self.latest: Optional[CapturedFrame] = None
+        self.last_read_id = 0
+        self.thread = None
+        self.running = False
+        self.ended = False
+
+        # Statistics
+        self.frames_grabbed = 0
+        self.grab_times = collections.deque(maxlen=30)
+
+    def isOpened(self) -> bool:
+        return self.capture.isOpened()
+
+    def start(self) -> "LatestFrameCapture":
+        """Start the capture thread (no-op if it is running)"""
+        if self.thread is None or not self.thread.is_alive():
+            self.running = True
+            self.ended = False
+            self.thread = threading.Thread(target=self._grab_loop, name=f"capture-{self.name}", daemon=True)
+            self.thread.start()
+        return self
+
+    def _grab_loop(self):
+        failed_reads = 0
+        try:
+            while self.running:
+                ret, frame = self.capture.read()
+                if not ret:
+                    # A few failed reads happen while a camera starts; many mean it is gone
+                    failed_reads += 1
+                    if failed_reads >= CAPTURE_MAX_FAILED_READS:
+                        print(f"📹 {self.name}: no frames from the camera - capture ended")
+                        break
+                    time.sleep(0.01)
+                    continue
+                failed_reads = 0
+
+                timestamp = time.perf_counter()
+                with self.condition:
+                    self.frames_grabbed += 1
+                    self.latest = CapturedFrame(self.frames_grabbed, timestamp, frame)
+                    self.grab_times.append(timestamp)
+                    self.condition.notify_all()
+        except Exception as e:
+            print(f"❌ {self.name} capture error: {e}")
+        finally:
+            with self.condition:
+                self.ended = True
+                self.condition.notify_all()
+
+    def get_latest(self) -> Optional[CapturedFrame]:
+        """Newest frame without waiting (None before the first frame); may repeat the previous one"""
+        with self.condition:
+            return self.latest
+
+    def read_latest(self, timeout: Optional[float] = CAPTURE_READ_TIMEOUT_SECONDS) -> Optional[CapturedFrame]:
+        """
+        Newest frame not returned by read_latest()/read() before, waiting up
+        to `timeout` for one
+
+        Returns:
+            None on timeout, or once the capture has ended or been stopped
+        """
+        if self.thread is None:
+            self.start()
+        with self.condition:
+            if not self.condition.wait_for(
+                    lambda: self.ended or not self.running or
+                    (self.latest is not None and self.latest.frame_id > self.last_read_id), timeout):
+                return None
+            latest = self.latest
+            if latest is None or latest.frame_id <= self.last_read_id:
+                return None
+            self.last_read_id = latest.frame_id
+            self.frames_read += 1
+            return latest
+
+    def read(self) -> Tuple[bool, Optional[np.ndarray]]:
+        """cv2.VideoCapture.read() replacement: the newest unread frame"""
+        latest = self.read_latest()
+        return (True, latest.frame) if latest is not None else (False, None)
+
+    def stop(self, timeout: Optional[float] = 1.0):
+        """Stop the capture thread; blocked readers return None"""
+        with self.condition:
+            self.running = False
+            self.condition.notify_all()
+        if self.thread is not None and self.thread is not threading.current_thread():
+            self.thread.join(timeout)
+
+    def release(self):
+        """Stop the capture thread, then release the camera"""
+        self.stop()
+        self.capture.release()
+
+    def get_statistics(self) -> dict:
+        """Grab rate and frames overwritten before anyone read them"""
+        with self.condition:
+            grab_times = list(self.grab_times)
+            grabbed, read = self.frames_grabbed, self.frames_read
+        span = grab_times[-1] - grab_times[0] if len(grab_times) > 1 else 0.0
+        return {
+            'frames_grabbed': grabbed,
+            'frames_read': read,
+            'frames_skipped': max(0, grabbed - read),
+            'grab_fps': round((len(grab_times) - 1) / span, 1) if span > 0 else 0.0
+        }
+
+
+class WebcamSource(LatestFrameCapture):
+    """Webcam or network stream (RTSP/HTTP) frame source"""
+
+    def __init__(self, source: Union[int, str] = 0, name: str = "Camera", width: Optional[int] = None,
+                 height: Optional[int] = None, threaded: bool = LATEST_FRAME_CAPTURE_ENABLED):
+        """
+        Args:
+            source: Camera index or stream URL
+            name: Camera location of the frames
+            width, height: Requested capture resolution (None = driver default)
+            threaded: Grab on a capture thread and hand out the newest frame;
+                False = read the camera in the reader's thread
+        """
+        capture = cv2.VideoCapture(source)
+        if width:
+            capture.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+        if height:
+            capture.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+        super().__init__(capture, name)
+        self.threaded = threaded
+
+    def read_latest(self, timeout: Optional[float] = CAPTURE_READ_TIMEOUT_SECONDS) -> Optional[CapturedFrame]:
+        if self.threaded:
+            return super().read_latest(timeout)
+        ret, frame = self.capture.read()
+        if not ret:
+            return None
+        self.frames_grabbed += 1
+        self.frames_read += 1
+        return CapturedFrame(self.frames_grabbed, time.perf_counter(), frame)
+
+
+class LatencyMeter:
+    """Capture-to-display latency of the frames shown on screen"""
+
+    def __init__(self, window: int = LATENCY_WINDOW):
+        self.lock = threading.Lock()
+        self.samples = collections.deque(maxlen=window)
+        self.frames = 0
+
+    def record(self, captured_at: float) -> float:
+        """Record a frame shown now that was captured at `captured_at` (perf_counter); returns ms"""
+        latency_ms = (time.perf_counter() - captured_at) * 1000.0
+        with self.lock:
+            self.samples.append(latency_ms)
+            self.frames += 1
+        return latency_ms
+
+    def get_statistics(self) -> dict:
+        """Median, 95th percentile and max over the last `window` frames (ms)"""
+        with self.lock:
+            samples = np.array(self.samples)
+            frames = self.frames
+        if not len(samples):
+            return {'frames': frames, 'median_ms': 0.0, 'p95_ms': 0.0, 'max_ms': 0.0}
+        return {
+            'frames': frames,
+            'median_ms': round(float(np.median(samples)), 1),
+            'p95_ms': round(float(np.percentile(samples, 95)), 1),
+            'max_ms': round(float(samples.max()), 1)
+        }
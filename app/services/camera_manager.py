@@ -0,0 +1,209 @@
+"""
+Camera Manager
+Serves several cameras (lanes) from one process. Every camera has its own
+capture thread, motion gate, tracker and location name; their frames are
+taken in turn by one shared pool of detect and OCR workers (see
+FairFrameQueue; with tracking, each camera's tracker stays on one detect
+worker and the trackers run in parallel), and every camera reports its own
+fps, latency and drops.
+
+Headless (no UI):
+    python -m app.services.camera_manager [--camera "0=Lane 1" --camera "clip.mp4=Gate"] [--duration 60]
+"""
+
+import time
+import numpy as np
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Union
+from app.services.frame_sources import open_frame_source
+from app.services.pipeline import CameraSource, PlateFrame, Pipeline, build_plate_pipeline
+from app.services.plate.detector import get_plate_detector
+from app.services.plate.motion import get_motion_gate
+from app.services.plate.tracker import PlateTracker, PlateTrackerSettings
+from app.utils.config import (CAMERAS, MOTION_GATE_ENABLED, PLATE_TRACKING_ENABLED, PLATE_TRACKER_SETTINGS,
+                              PIPELINE_DETECT_WORKERS, PIPELINE_OCR_WORKERS,
+                              PIPELINE_DETECT_PROCESSES, PIPELINE_QUEUE_SIZE)
+
+
+@dataclass
+class CameraConfig:
+    """One camera (lane)"""
+    source: Union[int, str]  # See open_frame_source: camera index, stream URL, video file, image directory, "synthetic"
+    location: str  # Camera location in the detection log
+
+
+def load_camera_configs(cameras: List[dict] = None) -> List[CameraConfig]:
+    """CameraConfigs from CAMERAS-style dictionaries (default: the configured cameras)"""
+    return [CameraConfig(**camera) for camera in (CAMERAS if cameras is None else cameras)]
+
+
+class CameraManager:
+    """Opens N cameras and runs them through one shared capture → detect → OCR → sink pipeline"""
+
+    def __init__(self, cameras: List[CameraConfig] = None,
+                 on_frame: Optional[Callable[[PlateFrame, np.ndarray], None]] = None,
+                 on_logged: Optional[Callable[[], None]] = None,
+                 detect_workers: Optional[int] = None, ocr_workers: int = PIPELINE_OCR_WORKERS,
+                 detect_processes: bool = PIPELINE_DETECT_PROCESSES, queue_size: int = PIPELINE_QUEUE_SIZE,
+                 log: bool = True, draw: bool = True):
+        """
+        Args:
+            cameras: Cameras to open (default: CAMERAS from the config)
+            on_frame, on_logged: See PlateSink; item.camera tells the cameras apart
+            detect_workers, ocr_workers: Workers shared by all cameras (detect_workers
+                None = one per camera with plate tracking, else PIPELINE_DETECT_WORKERS)
+            detect_processes: Detect in worker processes instead of threads
+            queue_size: Frames waiting per camera in front of the detect and OCR stages
+            log: Write valid plates to the detection log
+            draw: See build_plate_pipeline
+        """
+        self.cameras = cameras if cameras is not None else load_camera_configs()
+        self.on_frame = on_frame
+        self.on_logged = on_logged
+        self.detect_workers = detect_workers
+        self.ocr_workers = ocr_workers
+        self.detect_processes = detect_processes
+        self.queue_size = queue_size
+        self.log = log
+        self.draw = draw
+        self.captures: Dict[str, object] = {}  # Opened captures by location
+        self.pipeline: Optional[Pipeline] = None
+
+    def open(self) -> List[str]:
+        """
+        Open every camera (ones that fail are skipped)
+
+        Returns:
+            Locations of the cameras that opened
+        """
+        for camera in self.cameras:
+            if camera.location in self.captures:
+                continue
+            capture = open_frame_source(camera.source, camera.location)
+            if not capture.isOpened():
+                print(f"❌ Cannot open camera '{camera.location}' ({camera.source})")
+                capture.release()
+                continue
+            self.captures[camera.location] = capture
+            print(f"📹 Opened camera '{camera.location}' ({camera.source})")
+        return list(self.captures)
+
+    def start(self) -> int:
+        """Open the cameras and start the pipeline; returns the number of cameras running"""
+        if not self.captures:
+            self.open()
+        if not self.captures:
+            return 0
+
+        sources = []
+        trackers = {}
+        detector = get_plate_detector() if PLATE_TRACKING_ENABLED else None
+        for location, capture in self.captures.items():
+            motion_gate = get_motion_gate(location) if MOTION_GATE_ENABLED else None
+            if motion_gate:
+                motion_gate.reset()
+            sources.append(CameraSource(capture, location, motion_gate=motion_gate))
+            if detector is not None:
+                # Trackers run in parallel, so each gets its own cascades (sharing the gate and budget)
+                trackers[location] = PlateTracker(detector.worker_copy(),
+                                                  PlateTrackerSettings(**PLATE_TRACKER_SETTINGS), camera=location)
+
+        detect_workers = self.detect_workers
+        if detect_workers is None:
+            detect_workers = len(trackers) if trackers else PIPELINE_DETECT_WORKERS
+        self.pipeline = build_plate_pipeline(
+            sources, on_frame=self.on_frame, on_logged=self.on_logged, tracker=trackers or None,
+            detect_workers=detect_workers, ocr_workers=self.ocr_workers,
+            detect_processes=self.detect_processes, queue_size=self.queue_size, log=self.log,
+            draw=self.draw)
+        self.pipeline.start()
+        return len(sources)
+
+    def stop(self):
+        """Stop capturing and release the cameras; queued frames finish in the background"""
+        if self.pipeline:
+            self.pipeline.stop()
+        for capture in self.captures.values():
+            capture.release()
+        self.captures = {}
+
+    def join(self, timeout: Optional[float] = None):
+        if self.pipeline:
+            self.pipeline.join(timeout)
+
+    def is_alive(self) -> bool:
+        return bool(self.pipeline and self.pipeline.is_alive())
+
+    def get_camera_statistics(self) -> Dict[str, dict]:
+        """
+        Per camera: frames shown and fps, capture-to-sink latency, frames
+        dropped by the detect/OCR queues and frames the capture thread
+        overwrote before they were read
+        """
+        if not self.pipeline:
+            return {}
+        stages = {stage.name: stage for stage in self.pipeline.stages}
+        sink_stats = stages['sink'].handler.get_camera_statistics()
+        stats = {}
+        for camera in self.cameras:
+            location = camera.location
+            camera_stats = dict(sink_stats.get(location, {'frames': 0, 'fps': 0.0, 'latency_ms': 0.0,
+                                                          'stale_frames': 0, 'plates_logged': 0}))
+            camera_stats['dropped'] = sum(getattr(stages[name].queue, 'dropped_by_key', {}).get(location, 0)
+                                          for name in ('detect', 'ocr'))
+            capture = self.captures.get(location)
+            if capture is not None:
+                camera_stats['capture_skipped'] = capture.get_statistics().get('frames_skipped', 0)
+            stats[location] = camera_stats
+        return stats
+
+    def format_statistics(self) -> str:
+        """One status line: fps, latency and drops per camera"""
+        return " | ".join(f"{location} {stats['fps']:.1f} fps, {stats['latency_ms']:.0f} ms, "
+                          f"{stats['dropped']} dropped"
+                          for location, stats in self.get_camera_statistics().items())
+
+
+def parse_camera_argument(value: str) -> CameraConfig:
+    """'SOURCE=LOCATION' (or just SOURCE) from the command line"""
+    source, _, location = value.partition("=")
+    return CameraConfig(int(source) if source.isdigit() else source, location or f"Camera {source}")
+
+
+if __name__ == "__main__":
+    import argparse
+    from app.services.detection_logger import start_detection_logging, stop_detection_logging
+
+    parser = argparse.ArgumentParser(description="Run several cameras through one shared detection pipeline")
+    parser.add_argument("--camera", action="append", type=parse_camera_argument, default=None,
+                        help="SOURCE=LOCATION, repeatable (default: CAMERAS from the config)")
+    parser.add_argument("--duration", type=float, default=None, help="Stop after this many seconds")
+    parser.add_argument("--detect-workers", type=int, default=None,
+                        help="Default: one per camera with plate tracking, else PIPELINE_DETECT_WORKERS")
+    parser.add_argument("--ocr-workers", type=int, default=PIPELINE_OCR_WORKERS)
+    parser.add_argument("--no-log", action="store_true", help="Do not write plates to the detection log")
+    parser.add_argument("--stats-every", type=float, default=5.0, help="Seconds between statistics lines")
+    args = parser.parse_args()
+
+    manager = CameraManager(args.camera, detect_workers=args.detect_workers, ocr_workers=args.ocr_workers,
+                            log=not args.no_log)
+    if not args.no_log:
+        start_detection_logging()
+    started = time.perf_counter()
+    if not manager.start():
+        print("❌ No camera could be opened")
+        raise SystemExit(1)
+    try:
+        while manager.is_alive():
+            manager.join(args.stats_every)
+            print(f"📊 {manager.format_statistics()}")
+            if args.duration is not None and time.perf_counter() - started >= args.duration:
+                break
+    except KeyboardInterrupt:
+        pass
+    finally:
+        manager.stop()
+        manager.join(5.0)
+        if not args.no_log:
+            stop_detection_logging()
+    print(f"✅ Cameras finished: {manager.format_statistics()}")
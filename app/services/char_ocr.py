@@ -0,0 +1,272 @@
+"""
+Fast Character-Classifier OCR for License Plates
+Philippine plates use one fixed font, so most clean crops can be read by
+segmenting the binarized crop (preprocess_plate_image) into characters and
+classifying each with a k-nearest-neighbour search over HOG features. Reads
+that fail PlateValidator or score low confidence fall back to EasyOCR.
+
+Train offline from labelled plate crops (file name = plate text, e.g.
+ABC123_0001.png):
+    python -m app.services.char_ocr path/to/crops [--output app/models/plate_chars.npz]
+"""
+
+import os
+import cv2
+import numpy as np
+from typing import List, Optional, Sequence, Tuple
+
+# Normalized character image (width, height) the HOG features are computed on
+CHAR_SIZE = (24, 32)
+# Margin (pixels) kept around a character inside the normalized image
+CHAR_MARGIN = 2
+
+# Connected components kept as characters (fractions of the crop height / character height)
+MIN_CHAR_HEIGHT_RATIO = 0.3
+MAX_CHAR_HEIGHT_RATIO = 0.95
+MAX_CHAR_ASPECT = 1.2  # Widest character width / height
+MIN_CHAR_AREA = 12
+CHAR_HEIGHT_TOLERANCE = 0.25  # Allowed deviation from the median character height
+
+# Reject a character whose nearest training sample is this much further away
+# than the training set's own nearest-neighbour distances (99th percentile)
+MAX_DISTANCE_FACTOR = 1.5
+
+_hog = cv2.HOGDescriptor(CHAR_SIZE, (8, 8), (4, 4), (8, 8), 9)
+
+
+def segment_characters(binary: np.ndarray) -> List[Tuple[np.ndarray, Tuple[int, int, int, int]]]:
+    """
+    Split a binarized plate crop (dark characters on white) into characters
+
+    Returns:
+        [(character mask, (x, y, w, h)), ...] left to right; masks are 255 on the character
+    """
+    ink = cv2.bitwise_not(binary)
+    count, labels, stats, _ = cv2.connectedComponentsWithStats(ink, connectivity=8)
+    rows, columns = binary.shape[:2]
+
+    candidates = []
+    for label in range(1, count):
+        x, y, w, h, area = stats[label]
+        if not rows * MIN_CHAR_HEIGHT_RATIO <= h <= rows * MAX_CHAR_HEIGHT_RATIO:
+            continue
+        if w > h * MAX_CHAR_ASPECT or area < MIN_CHAR_AREA:
+            continue
+        # Components touching the crop edge are plate border or background
+        if x == 0 or y == 0 or x + w >= columns or y + h >= rows:
+            continue
+        candidates.append((label, int(x), int(y), int(w), int(h)))
+
+    if not candidates:
+        return []
+
+    median_height = float(np.median([h for _, _, _, _, h in candidates]))
+    characters = []
+    for label, x, y, w, h in sorted(candidates, key=lambda candidate: candidate[1]):
+        if abs(h - median_height) > median_height * CHAR_HEIGHT_TOLERANCE:
+            continue
+        mask = (labels[y:y + h, x:x + w] == label).astype(np.uint8) * 255
+        characters.append((mask, (x, y, w, h)))
+    return characters
+
+
+def normalize_character(mask: np.ndarray) -> np.ndarray:
+    """Scale a character mask into CHAR_SIZE keeping its aspect ratio, centered"""
+    width, height = CHAR_SIZE
+    scale = min((width - 2 * CHAR_MARGIN) / float(mask.shape[1]), (height - 2 * CHAR_MARGIN) / float(mask.shape[0]))
+    scaled_w = max(1, int(round(mask.shape[1] * scale)))
+    scaled_h = max(1, int(round(mask.shape[0] * scale)))
+    scaled = cv2.resize(mask, (scaled_w, scaled_h), interpolation=cv2.INTER_AREA)
+
+    canvas = np.zeros((height, width), dtype=np.uint8)
+    x, y = (width - scaled_w) // 2, (height - scaled_h) // 2
+    canvas[y:y + scaled_h, x:x + scaled_w] = scaled
+    return canvas
+
+
+def character_features(masks: Sequence[np.ndarray]) -> np.ndarray:
+    """L2-normalized HOG features of character masks, one row per character"""
+    features = np.array([_hog.compute(normalize_character(mask)).ravel() for mask in masks], dtype=np.float32)
+    norms = np.linalg.norm(features, axis=1, keepdims=True)
+    return features / np.maximum(norms, 1e-6)
+
+
+class CharacterClassifier:
+    """k-nearest-neighbour character classifier over HOG features"""
+
+    def __init__(self, features: np.ndarray, labels: np.ndarray, k: int = 5,
+                 max_distance: Optional[float] = None):
+        """
+        Args:
+            features: Training features (character_features)
+            labels: Character per training row
+            k: Neighbours that vote
+            max_distance: Characters further than this from every training
+                sample get zero confidence (None = no limit)
+        """
+        self.features = features.astype(np.float32)
+        self.labels = np.asarray(labels)
+        self.k = max(1, min(k, len(self.labels)))
+        self.max_distance = max_distance
+
+    @classmethod
+    def train(cls, masks: Sequence[np.ndarray], labels: Sequence[str], k: int = 5) -> 'CharacterClassifier':
+        """Build a classifier from character masks and their labels"""
+        features = character_features(masks)
+
+        # Leave-one-out nearest-neighbour distances set the rejection distance
+        nearest = np.empty(len(features), dtype=np.float32)
+        for start in range(0, len(features), 1024):
+            distances = cls._distances(features[start:start + 1024], features)
+            for row in range(distances.shape[0]):
+                distances[row, start + row] = np.inf
+            nearest[start:start + 1024] = distances.min(axis=1)
+        max_distance = float(np.percentile(nearest, 99)) * MAX_DISTANCE_FACTOR if len(features) > 1 else None
+
+        return cls(features, np.array(list(labels)), k, max_distance)
+
+    @staticmethod
+    def _distances(queries: np.ndarray, features: np.ndarray) -> np.ndarray:
+        """Euclidean distances between L2-normalized rows"""
+        return np.sqrt(np.maximum(2.0 - 2.0 * queries @ features.T, 0.0))
+
+    def classify(self, masks: Sequence[np.ndarray]) -> List[Tuple[str, float]]:
+        """
+        Classify character masks
+
+        Returns:
+            [(character, confidence), ...]; confidence is the share of the k
+            neighbours that agree (0 when the character is unlike any sample)
+        """
+        if not len(masks):
+            return []
+        distances = self._distances(character_features(masks), self.features)
+        neighbours = np.argpartition(distances, self.k - 1, axis=1)[:, :self.k]
+
+        results = []
+        for row, indices in enumerate(neighbours):
+            indices = indices[np.argsort(distances[row, indices])]
+            votes = {}
+            for index in indices:
+                votes[self.labels[index]] = votes.get(self.labels[index], 0) + 1
+            # Most votes wins; ties go to the label of the nearest neighbour
+            character = max(votes, key=lambda label: (votes[label], label == self.labels[indices[0]]))
+            confidence = votes[character] / float(self.k)
+            if self.max_distance is not None and distances[row, indices[0]] > self.max_distance:
+                confidence = 0.0
+            results.append((str(character), confidence))
+        return results
+
+    def save(self, path: str):
+        """Write the classifier to an .npz file"""
+        np.savez_compressed(path, features=self.features, labels=self.labels, k=self.k,
+                            max_distance=np.nan if self.max_distance is None else self.max_distance)
+
+    @classmethod
+    def load(cls, path: str) -> 'CharacterClassifier':
+        """Read a classifier written by save()"""
+        with np.load(path) as data:
+            max_distance = float(data['max_distance'])
+            return cls(data['features'], data['labels'], int(data['k']),
+                       None if np.isnan(max_distance) else max_distance)
+
+
+class FastPlateReader:
+    """Reads a binarized plate crop with the character classifier"""
+
+    def __init__(self, classifier: CharacterClassifier):
+        self.classifier = classifier
+
+    @classmethod
+    def load(cls, path: str) -> Optional['FastPlateReader']:
+        """Load a trained classifier (None when the model file is missing or unreadable)"""
+        if not os.path.exists(path):
+            print(f"⚠️ Character classifier not found: {path} - fast OCR path disabled")
+            return None
+        try:
+            classifier = CharacterClassifier.load(path)
+            print(f"✅ Loaded character classifier ({len(classifier.labels)} samples)")
+            return cls(classifier)
+        except Exception as e:
+            print(f"❌ Error loading character classifier: {e}")
+            return None
+
+    def read(self, binary: np.ndarray) -> Tuple[Optional[str], float]:
+        """
+        Read a binarized plate crop (enhance_plate_region output)
+
+        The two character groups are split at the widest gap between
+        neighbouring characters.
+
+        Returns:
+            (text, confidence of the weakest character); (None, 0.0) when the
+            crop does not segment into a plausible number of characters
+        """
+        characters = segment_characters(binary)
+        if not 5 <= len(characters) <= 8:
+            return None, 0.0
+
+        classified = self.classifier.classify([mask for mask, _ in characters])
+        boxes = [box for _, box in characters]
+        gaps = [boxes[i + 1][0] - (boxes[i][0] + boxes[i][2]) for i in range(len(boxes) - 1)]
+        split = int(np.argmax(gaps)) + 1
+
+        text = ''.join(character for character, _ in classified[:split]) + ' ' + \
+            ''.join(character for character, _ in classified[split:])
+        return text, min(confidence for _, confidence in classified)
+
+
+def collect_training_samples(crop_dir: str, ocr=None) -> Tuple[List[np.ndarray], List[str], int, int]:
+    """
+    Segment labelled plate crops into training characters
+
+    Each file in crop_dir is one plate crop named after its text (spaces,
+    dashes and anything after the first '_' are ignored: ABC123_0001.png,
+    ABC-123.jpg). Crops whose character count does not match the label are
+    skipped.
+
+    Returns:
+        (character masks, labels, crops used, crops skipped)
+    """
+    if ocr is None:
+        from app.services.ocr_service import LicensePlateOCR
+        ocr = LicensePlateOCR(process_pool=False, cache_size=0, fast_path=False, load_reader=False)
+
+    masks, labels = [], []
+    used = skipped = 0
+    for filename in sorted(os.listdir(crop_dir)):
+        label = os.path.splitext(filename)[0].split('_')[0].upper().replace(' ', '').replace('-', '')
+        crop = cv2.imread(os.path.join(crop_dir, filename))
+        if crop is None or not label:
+            continue
+
+        binary = ocr.preprocess_plate_image(crop, (0, 0, crop.shape[1], crop.shape[0]), camera="training")
+        characters = segment_characters(binary) if binary is not None else []
+        if len(characters) != len(label):
+            skipped += 1
+            continue
+        masks.extend(mask for mask, _ in characters)
+        labels.extend(label)
+        used += 1
+
+    return masks, labels, used, skipped
+
+
+if __name__ == "__main__":
+    import argparse
+    from app.utils.config import FAST_OCR_MODEL_PATH
+
+    parser = argparse.ArgumentParser(description="Train the fast character-classifier OCR from labelled plate crops")
+    parser.add_argument("crop_dir", help="Directory of plate crops named after their text (ABC123_0001.png)")
+    parser.add_argument("--output", default=FAST_OCR_MODEL_PATH)
+    parser.add_argument("--k", type=int, default=5, help="Neighbours that vote per character")
+    args = parser.parse_args()
+
+    masks, labels, used, skipped = collect_training_samples(args.crop_dir)
+    if not masks:
+        print(f"❌ No usable crops in {args.crop_dir} ({skipped} skipped)")
+        raise SystemExit(1)
+
+    CharacterClassifier.train(masks, labels, args.k).save(args.output)
+    print(f"✅ Trained on {len(masks)} characters from {used} crops ({skipped} skipped), "
+          f"{len(set(labels))} classes -> {args.output}")
@@ -0,0 +1,336 @@
+"""
+Frame Sources
+Everything the camera loop and the pipeline read frames from: webcams and
+streams (see camera_capture.WebcamSource), video files, directories of
+images and a synthetic plate generator. Every source hands out
+CapturedFrames stamped with time.perf_counter(), so latency is measured the
+same way in production, soak tests and benchmarks.
+
+    source = open_frame_source("clip.mp4")   # or 0, "rtsp://...", "frames/", "synthetic:15"
+"""
+
+import os
+import random
+import string
+import time
+import cv2
+import numpy as np
+from dataclasses import dataclass
+from typing import Iterator, List, Optional, Sequence, Tuple, Union
+from app.utils.plate_validator import PlateValidator
+
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".bmp")
+
+
+@dataclass
+class CapturedFrame:
+    """A frame and when it was captured"""
+    frame_id: int
+    timestamp: float  # time.perf_counter() when the frame was captured / produced
+    frame: np.ndarray
+    position: Optional[float] = None  # Seconds into a video file
+    labels: Optional[List[Tuple[str, Tuple[int, int, int, int]]]] = None  # Synthetic plates: (text, box)
+
+
+class FrameSource:
+    """
+    Source interface consumed by the camera loop (read_latest) and by code
+    written for cv2.VideoCapture (read, isOpened, release)
+    """
+
+    def __init__(self, name: str = "Camera", fps: Optional[float] = None):
+        """
+        Args:
+            name: Camera location of the frames
+            fps: Frames handed out per second at most (None = as fast as they are read)
+        """
+        self.name = name
+        self.min_interval = 1.0 / fps if fps else 0.0
+        self.next_time = None
+        self.frame_id = 0
+
+        # Statistics
+        self.frames_read = 0
+
+    def read_latest(self, timeout: Optional[float] = None) -> Optional[CapturedFrame]:
+        """Next frame; None at end of stream (or when no frame came within timeout)"""
+        raise NotImplementedError
+
+    def read(self) -> Tuple[bool, Optional[np.ndarray]]:
+        """cv2.VideoCapture.read() replacement"""
+        latest = self.read_latest()
+        return (True, latest.frame) if latest is not None else (False, None)
+
+    def isOpened(self) -> bool:
+        return True
+
+    def release(self):
+        pass
+
+    def __iter__(self) -> Iterator[CapturedFrame]:
+        while True:
+            item = self.read_latest()
+            if item is None:
+                return
+            yield item
+
+    def _wait_for_turn(self):
+        """Sleep until the next frame is due (fps pacing)"""
+        if not self.min_interval:
+            return
+        now = time.perf_counter()
+        if self.next_time is None:
+            self.next_time = now
+        if self.next_time > now:
+            time.sleep(self.next_time - now)
+        self.next_time = max(self.next_time + self.min_interval, time.perf_counter())
+
+    def _captured(self, frame: np.ndarray, **kwargs) -> CapturedFrame:
+        self.frame_id += 1
+        self.frames_read += 1
+        return CapturedFrame(self.frame_id, time.perf_counter(), frame, **kwargs)
+
+    def get_statistics(self) -> dict:
+        return {'frames_read': self.frames_read}
+
+
+class VideoFileSource(FrameSource):
+    """Frames of a video file, with seeking, frame skipping and optional real-time playback"""
+
+    def __init__(self, path: str, name: Optional[str] = None, skip: int = 0, start_seconds: float = 0.0,
+                 realtime: bool = False, loop: bool = False, fps: Optional[float] = None):
+        """
+        Args:
+            path: Video file
+            name: Camera location (default: the file name)
+            skip: Frames skipped after every frame read (decimation)
+            start_seconds: Seek here before the first frame
+            realtime: Play at the file's frame rate like a live camera; a reader
+                that falls behind skips the frames it missed
+            loop: Start over at the end of the file (soak tests)
+            fps: Frames handed out per second at most (ignored when realtime)
+        """
+        super().__init__(name or os.path.basename(path), None if realtime else fps)
+        self.path = path
+        self.capture = cv2.VideoCapture(path)
+        self.skip = max(0, skip)
+        self.realtime = realtime
+        self.loop = loop
+        self.file_fps = self.capture.get(cv2.CAP_PROP_FPS) or 30.0
+        self.frame_count = int(self.capture.get(cv2.CAP_PROP_FRAME_COUNT) or 0)
+        self.position_frame = 0  # Index of the next frame to decode
+        self.play_start = None
+
+        # Statistics
+        self.frames_skipped = 0
+
+        if start_seconds:
+            self.seek(start_seconds)
+
+    def isOpened(self) -> bool:
+        return self.capture.isOpened()
+
+    def seek(self, seconds: float):
+        """Continue reading at `seconds` into the file"""
+        self.seek_frame(int(round(seconds * self.file_fps)))
+
+    def seek_frame(self, index: int):
+        """Continue reading at frame `index`"""
+        index = max(0, index if not self.frame_count else min(index, self.frame_count - 1))
+        self.capture.set(cv2.CAP_PROP_POS_FRAMES, index)
+        self.position_frame = index
+        self.play_start = None
+
+    def _skip_frames(self, count: int) -> bool:
+        """Decode-free skip; False at end of file"""
+        for _ in range(count):
+            if not self.capture.grab():
+                return False
+            self.position_frame += 1
+            self.frames_skipped += 1
+        return True
+
+    def read_latest(self, timeout: Optional[float] = None) -> Optional[CapturedFrame]:
+        self._wait_for_turn()
+        if self.realtime:
+            # The frame a live camera would show now; earlier ones are skipped
+            now = time.perf_counter()
+            if self.play_start is None:
+                self.play_start = now - self.position_frame / self.file_fps
+            due = int((now - self.play_start) * self.file_fps)
+            if due > self.position_frame and not self._skip_frames(due - self.position_frame):
+                return self._restart()
+
+        ret, frame = self.capture.read()
+        if not ret:
+            return self._restart()
+        position = self.position_frame / self.file_fps
+        self.position_frame += 1
+        if self.skip:
+            self._skip_frames(self.skip)  # At end of file the next read ends the stream
+        return self._captured(frame, position=position)
+
+    def _restart(self) -> Optional[CapturedFrame]:
+        """At end of file: start over when looping, else end the stream"""
+        if not self.loop or self.position_frame == 0:
+            return None
+        self.seek_frame(0)
+        ret, frame = self.capture.read()
+        if not ret:
+            return None
+        self.position_frame = 1
+        return self._captured(frame, position=0.0)
+
+    def release(self):
+        self.capture.release()
+
+    def get_statistics(self) -> dict:
+        return {'frames_read': self.frames_read, 'frames_skipped': self.frames_skipped,
+                'position_seconds': round(self.position_frame / self.file_fps, 2)}
+
+
+class ImageDirectorySource(FrameSource):
+    """Images of a directory in name order (stills from site cameras, labelled test sets)"""
+
+    def __init__(self, directory: str, name: Optional[str] = None, fps: Optional[float] = None,
+                 loop: bool = False):
+        """
+        Args:
+            directory: Directory with .jpg/.png/.bmp images
+            name: Camera location (default: the directory name)
+            fps: Images handed out per second at most
+            loop: Start over after the last image
+        """
+        super().__init__(name or os.path.basename(os.path.normpath(directory)), fps)
+        self.directory = directory
+        self.paths = sorted(os.path.join(directory, entry) for entry in os.listdir(directory)
+                            if entry.lower().endswith(IMAGE_EXTENSIONS)) if os.path.isdir(directory) else []
+        self.loop = loop
+        self.index = 0
+
+        # Statistics
+        self.unreadable = 0
+
+    def isOpened(self) -> bool:
+        return bool(self.paths)
+
+    def read_latest(self, timeout: Optional[float] = None) -> Optional[CapturedFrame]:
+        self._wait_for_turn()
+        for _ in range(len(self.paths)):
+            if self.index >= len(self.paths):
+                if not self.loop:
+                    return None
+                self.index = 0
+            path = self.paths[self.index]
+            self.index += 1
+            frame = cv2.imread(path)
+            if frame is not None:
+                return self._captured(frame)
+            self.unreadable += 1
+            print(f"⚠️ Cannot read image: {path}")
+        return None
+
+    def get_statistics(self) -> dict:
+        return {'frames_read': self.frames_read, 'unreadable': self.unreadable, 'images': len(self.paths)}
+
+
+def random_plate_text(rng: random.Random) -> str:
+    """A plate text in one of the PlateValidator formats (ABC 123 or 123 ABC)"""
+    letters = "".join(rng.choice(string.ascii_uppercase) for _ in range(3))
+    digits = "".join(rng.choice(string.digits) for _ in range(3))
+    text = f"{letters} {digits}" if rng.random() < 0.5 else f"{digits} {letters}"
+    return PlateValidator.validate_and_normalize(text)[1]
+
+
+class SyntheticPlateSource(FrameSource):
+    """
+    Rendered frames with plates moving across a background at a controlled
+    rate; each frame's labels hold the plate texts and boxes (ground truth)
+    """
+
+    def __init__(self, name: str = "Synthetic", fps: Optional[float] = 15.0, size: Tuple[int, int] = (640, 480),
+                 plates: int = 1, speed: int = 8, frames: Optional[int] = None, seed: int = 0,
+                 backgrounds: Optional[Sequence[np.ndarray]] = None):
+        """
+        Args:
+            name: Camera location
+            fps: Frames per second (None = as fast as they are read)
+            size: Frame size (width, height)
+            plates: Plates in view at a time
+            speed: Pixels a plate moves per frame; a plate that leaves the frame
+                comes back with a new text
+            frames: Frames before the stream ends (None = endless)
+            seed: Random seed for texts and positions
+            backgrounds: BGR images cycled as backgrounds (default: gradient + noise)
+        """
+        super().__init__(name, fps)
+        self.width, self.height = size
+        self.speed = speed
+        self.max_frames = frames
+        self.rng = random.Random(seed)
+        self.backgrounds = [cv2.resize(image, size) for image in backgrounds] if backgrounds else \
+            [self._render_background(np.random.default_rng(seed))]
+        self.plates = [self._new_plate(lane, plates) for lane in range(plates)]
+
+    def _render_background(self, rng: np.random.Generator) -> np.ndarray:
+        gradient = np.linspace(60, 160, self.width, dtype=np.float32)[None, :].repeat(self.height, axis=0)
+        noise = rng.normal(0, 12, (self.height, self.width)).astype(np.float32)
+        return cv2.cvtColor(np.clip(gradient + noise, 0, 255).astype(np.uint8), cv2.COLOR_GRAY2BGR)
+
+    def _new_plate(self, lane: int, lanes: int) -> dict:
+        """A plate entering at the left edge in its own horizontal lane"""
+        plate_w = self.rng.randint(self.width // 6, self.width // 4)
+        plate_h = max(20, plate_w // 4)
+        lane_height = self.height // max(1, lanes)
+        y = lane * lane_height + self.rng.randint(0, max(0, lane_height - plate_h))
+        return {'text': random_plate_text(self.rng), 'x': -self.rng.randint(0, self.width // 2),
+                'y': y, 'w': plate_w, 'h': plate_h}
+
+    def read_latest(self, timeout: Optional[float] = None) -> Optional[CapturedFrame]:
+        if self.max_frames is not None and self.frame_id >= self.max_frames:
+            return None
+        self._wait_for_turn()
+
+        frame = self.backgrounds[self.frame_id % len(self.backgrounds)].copy()
+        labels = []
+        for lane, plate in enumerate(self.plates):
+            x, y, w, h = plate['x'], plate['y'], plate['w'], plate['h']
+            if x >= 0 and x + w <= self.width:
+                cv2.rectangle(frame, (x, y), (x + w, y + h), (235, 235, 235), -1)
+                cv2.rectangle(frame, (x, y), (x + w, y + h), (20, 20, 20), 2)
+                scale = h / 30.0
+                text_size = cv2.getTextSize(plate['text'], cv2.FONT_HERSHEY_SIMPLEX, scale, 2)[0]
+                cv2.putText(frame, plate['text'], (x + max(2, (w - text_size[0]) // 2), y + (h + text_size[1]) // 2),
+                            cv2.FONT_HERSHEY_SIMPLEX, scale, (10, 10, 10), 2)
+                labels.append((plate['text'], (x, y, w, h)))
+            plate['x'] += self.speed
+            if plate['x'] > self.width:
+                self.plates[lane] = self._new_plate(lane, len(self.plates))
+        return self._captured(frame, labels=labels)
+
+
+def open_frame_source(source: Union[int, str], name: Optional[str] = None, **kwargs) -> FrameSource:
+    """
+    Open a source by its description
+
+    Args:
+        source: Camera index or stream URL (webcam), "synthetic" or
+            "synthetic:FPS", a directory of images, or a video file
+        name: Camera location of the frames
+        **kwargs: Passed to the source class
+
+    Returns:
+        The source; check isOpened()
+    """
+    from app.services.camera_capture import WebcamSource
+
+    if isinstance(source, int) or (isinstance(source, str) and source.isdigit()):
+        return WebcamSource(int(source), name or f"Camera {source}", **kwargs)
+    if source.startswith("synthetic"):
+        _, _, fps = source.partition(":")
+        return SyntheticPlateSource(name or "Synthetic", fps=float(fps) if fps else 15.0, **kwargs)
+    if "://" in source:
+        return WebcamSource(source, name or source, **kwargs)
+    if os.path.isdir(source):
+        return ImageDirectorySource(source, name, **kwargs)
+    return VideoFileSource(source, name, **kwargs)
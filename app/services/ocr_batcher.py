@@ -0,0 +1,192 @@
+"""
+Batched OCR for License Plates
+Collects preprocessed plate crops from every caller (plates in one frame,
+frames from several cameras) and reads them with one EasyOCR recognition
+pass per batch instead of one call per plate
+"""
+
+import cv2
+import numpy as np
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import List, Optional, Tuple
+from app.services.ocr_service import LicensePlateOCR, get_ocr_service, PLATE_ALLOWLIST
+from app.utils.config import OCR_BATCH_SIZE, OCR_BATCH_MAX_WAIT_MS
+
+# Crops are scaled to EasyOCR's recognizer input height before stacking
+LINE_HEIGHT = 64
+# White rows between stacked crops so neighbouring lines never touch
+LINE_GAP = 16
+
+
+class OCRBatcher:
+    """Background worker that batches plate crops into single recognition passes"""
+
+    def __init__(self, ocr: LicensePlateOCR, max_batch_size: int = OCR_BATCH_SIZE,
+                 max_wait_ms: float = OCR_BATCH_MAX_WAIT_MS):
+        """
+        Args:
+            ocr: Loaded OCR service whose reader runs the batches
+            max_batch_size: Crops per recognition pass
+            max_wait_ms: Longest a crop waits for others before its batch runs
+        """
+        self.ocr = ocr
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max_wait_ms / 1000.0
+        self.requests = queue.Queue()
+        self.worker = threading.Thread(target=self._run, name="ocr-batcher", daemon=True)
+        self.worker.start()
+
+        # Statistics
+        self.batches = 0
+        self.crops = 0
+
+    def submit(self, image: np.ndarray, coordinates: Tuple[int, int, int, int],
+               camera: Optional[str] = None) -> Future:
+        """
+        Queue one plate for OCR
+
+        Preprocessing (and the fast character-classifier path) runs on the
+        calling thread; only recognition is batched.
+        camera: Source camera (see LicensePlateOCR.extract_text)
+
+        Returns:
+            Future resolving to (extracted_text, confidence_score)
+        """
+        future = Future()
+        if self.ocr.reader is None and self.ocr.fast_reader is None:
+            future.set_result((None, 0.0))
+            return future
+
+        plate_region = self.ocr.extract_plate_region(image, coordinates)
+        if plate_region is None:
+            self.ocr.count_attempt(read=False)
+            future.set_result((None, 0.0))
+            return future
+
+        cache_key, cached = self.ocr.lookup_cached_text(plate_region)
+        if cached is not None:
+            future.set_result(cached)
+            return future
+
+        self.ocr.count_attempt()
+        processed_image = self.ocr.enhance_plate_region(plate_region, coordinates[3], camera)
+        if processed_image is None or processed_image.size == 0:
+            future.set_result((None, 0.0))
+            return future
+
+        fast_result = self.ocr.read_fast(processed_image)
+        if fast_result is not None:
+            self.ocr.cache_plate_text(cache_key, fast_result)
+            future.set_result(fast_result)
+            return future
+        if self.ocr.reader is None:
+            future.set_result((None, 0.0))
+            return future
+        self.requests.put((processed_image, cache_key, future))
+        return future
+
+    def _run(self):
+        """Worker loop: wait for a crop, gather more until the batch is full or the wait expires"""
+        while True:
+            batch = [self.requests.get()]
+            deadline = time.monotonic() + self.max_wait
+
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self.requests.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            self._process_batch(batch)
+
+    def _process_batch(self, batch: List[Tuple[np.ndarray, Optional[int], Future]]):
+        """Read every crop of a batch in one recognition pass and resolve the futures"""
+        try:
+            per_crop = self._recognize([crop for crop, _, _ in batch])
+            self.batches += 1
+            self.crops += len(batch)
+        except Exception as e:
+            print(f"❌ Batched OCR error: {e}")
+            per_crop = [[] for _ in batch]
+
+        for (_, cache_key, future), results in zip(batch, per_crop):
+            try:
+                result = self.ocr.select_plate_text(results)
+                self.ocr.cache_plate_text(cache_key, result)
+                future.set_result(result)
+            except Exception as e:
+                print(f"❌ OCR extraction error: {e}")
+                future.set_result((None, 0.0))
+
+    def _recognize(self, crops: List[np.ndarray]) -> List[List[Tuple]]:
+        """
+        Stack crops into one fixed-line-height image and recognize each line
+
+        Returns:
+            EasyOCR results [(bbox, text, confidence)] per crop, in input order
+        """
+        lines = []
+        for crop in crops:
+            width = max(1, int(round(crop.shape[1] * LINE_HEIGHT / float(crop.shape[0]))))
+            interpolation = cv2.INTER_AREA if crop.shape[0] > LINE_HEIGHT else cv2.INTER_CUBIC
+            lines.append(cv2.resize(crop, (width, LINE_HEIGHT), interpolation=interpolation))
+
+        canvas_width = max(line.shape[1] for line in lines)
+        canvas = np.full((len(lines) * (LINE_HEIGHT + LINE_GAP), canvas_width), 255, dtype=np.uint8)
+        regions = []
+        for i, line in enumerate(lines):
+            top = i * (LINE_HEIGHT + LINE_GAP)
+            canvas[top:top + LINE_HEIGHT, :line.shape[1]] = line
+            regions.append([0, line.shape[1], top, top + LINE_HEIGHT])
+
+        results = self.ocr.reader.recognize(
+            canvas,
+            horizontal_list=regions,
+            free_list=[],
+            batch_size=len(regions),
+            allowlist=PLATE_ALLOWLIST,
+            paragraph=False,
+            detail=1
+        )
+
+        # Route each result back to its crop by the line it was read from
+        per_crop = [[] for _ in crops]
+        for result in results:
+            top = int(result[0][0][1])
+            index = top // (LINE_HEIGHT + LINE_GAP)
+            if 0 <= index < len(per_crop):
+                per_crop[index].append(result)
+        return per_crop
+
+    def get_statistics(self) -> dict:
+        """Get batching statistics"""
+        return {
+            'batches': self.batches,
+            'crops': self.crops,
+            'avg_batch_size': round(self.crops / self.batches, 2) if self.batches > 0 else 0,
+            'queued': self.requests.qsize()
+        }
+
+# Global batcher shared by every camera, created on first use
+_ocr_batcher: Optional[OCRBatcher] = None
+_ocr_batcher_lock = threading.Lock()
+
+def get_ocr_batcher() -> OCRBatcher:
+    """Get the global OCR batcher (loads the OCR reader on first call)"""
+    global _ocr_batcher
+    if _ocr_batcher is None:
+        with _ocr_batcher_lock:
+            if _ocr_batcher is None:
+                _ocr_batcher = OCRBatcher(get_ocr_service())
+    return _ocr_batcher
+
+def submit_plate_text(image: np.ndarray, coordinates: Tuple[int, int, int, int],
+                      camera: Optional[str] = None) -> Future:
+    """Convenience function to queue a plate region for batched OCR"""
+    return get_ocr_batcher().submit(image, coordinates, camera)
@@ -0,0 +1,118 @@
+"""
+OCR Result Cache
+Remembers recent OCR reads keyed by a perceptual hash of the grayscale
+plate crop, so a parked or slow car is not re-read (or even binarized) on
+every frame
+"""
+
+import cv2
+import numpy as np
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+
+def difference_hash(image: np.ndarray, hash_shape: Tuple[int, int] = (16, 4), margin: int = 8) -> int:
+    """
+    Perceptual difference hash (dHash) of a grayscale image
+
+    Args:
+        hash_shape: (columns, rows) of the comparison grid; wide like a plate
+        margin: Gray levels a cell must exceed its left neighbour by to set a
+            bit, so flat (noise-only) regions hash to stable zeros
+
+    Returns:
+        columns * rows bit integer; similar images differ in few bits
+    """
+    columns, rows = hash_shape
+    # Trim to a whole number of cells: INTER_AREA is fast at integer ratios and still averages every pixel
+    height = max(rows, image.shape[0] // rows * rows)
+    width = max(columns + 1, image.shape[1] // (columns + 1) * (columns + 1))
+    small = cv2.resize(image[:height, :width], (columns + 1, rows), interpolation=cv2.INTER_AREA).astype(np.int16)
+    bits = (small[:, 1:] > small[:, :-1] + margin).ravel()
+    return int.from_bytes(np.packbits(bits).tobytes(), "big")
+
+
+class OCRResultCache:
+    """LRU cache of OCR results with Hamming-distance lookup and age-based expiry"""
+
+    def __init__(self, max_size: int = 64, max_age_seconds: float = 5.0,
+                 max_distance: int = 4, hash_shape: Tuple[int, int] = (16, 4)):
+        """
+        Args:
+            max_size: Entries kept (least recently used evicted first)
+            max_age_seconds: Entries older than this are never returned
+            max_distance: Hash bits two crops may differ in and still share a read
+            hash_shape: dHash grid (columns, rows); the hash has columns * rows bits
+        """
+        self.max_size = max_size
+        self.max_age = max_age_seconds
+        self.max_distance = max_distance
+        self.hash_shape = hash_shape
+        self.entries: "OrderedDict[int, Tuple[float, Tuple[Optional[str], float]]]" = OrderedDict()
+        self.lock = threading.Lock()
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, plate_region: np.ndarray) -> int:
+        """Cache key (perceptual hash) for a grayscale plate crop"""
+        return difference_hash(plate_region, self.hash_shape)
+
+    def get(self, key: int) -> Optional[Tuple[Optional[str], float]]:
+        """Cached (text, confidence) for this key or a near-identical one, else None"""
+        now = time.monotonic()
+        with self.lock:
+            match = None
+            best_distance = self.max_distance + 1
+            expired = []
+            for cached_key, (stored_at, _) in self.entries.items():
+                if now - stored_at > self.max_age:
+                    expired.append(cached_key)
+                    continue
+                distance = bin(cached_key ^ key).count("1")
+                if distance < best_distance:
+                    match, best_distance = cached_key, distance
+
+            for cached_key in expired:
+                del self.entries[cached_key]
+
+            if match is None:
+                self.misses += 1
+                return None
+
+            self.entries.move_to_end(match)
+            self.hits += 1
+            return self.entries[match][1]
+
+    def put(self, key: int, result: Tuple[Optional[str], float]):
+        """
+        Store a read, evicting the least recently used entry when full
+
+        Failed reads (no text) are not stored: glare or motion blur on one
+        frame must not block the next near-identical crop from being read
+        """
+        if self.max_size <= 0 or result is None or result[0] is None:
+            return
+        with self.lock:
+            self.entries[key] = (time.monotonic(), result)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+
+    def clear(self):
+        """Forget every cached read"""
+        with self.lock:
+            self.entries.clear()
+
+    def get_statistics(self) -> dict:
+        """Get cache statistics"""
+        lookups = self.hits + self.misses
+        return {
+            'cache_hits': self.hits,
+            'cache_misses': self.misses,
+            'cache_hit_rate': round(self.hits / lookups * 100, 1) if lookups > 0 else 0,
+            'cache_size': len(self.entries)
+        }
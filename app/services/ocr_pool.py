@@ -0,0 +1,187 @@
+"""
+OCR Worker Process Pool
+Runs EasyOCR in worker processes so inference does not compete with the UI
+and capture threads for the main process. Plate crops are copied into
+multiprocessing.shared_memory slots instead of being pickled; results come
+back as futures
+"""
+
+import atexit
+import queue
+import threading
+import cv2
+import numpy as np
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Dict, Optional, Tuple
+
+# Bytes per shared-memory slot: a grayscale plate region up to 1024x256 fits,
+# larger regions are pickled instead
+SLOT_BYTES = 1024 * 256
+# Slots per worker (crops that can be queued or in flight at once)
+SLOTS_PER_WORKER = 4
+
+# Worker process state
+_worker_ocr = None
+_worker_slots: Dict[str, shared_memory.SharedMemory] = {}
+
+
+def _init_worker(torch_threads: int, opencv_threads: int, recognizer_only: bool):
+    """Limit threads and load the EasyOCR reader once per worker process"""
+    global _worker_ocr
+    cv2.setNumThreads(opencv_threads)
+    try:
+        import torch
+        torch.set_num_threads(torch_threads)
+    except ImportError:
+        pass
+
+    from app.services.ocr_service import LicensePlateOCR
+    # Caching happens in the main process, which sees every camera's crops
+    # (as does the fast path, so workers only get crops it could not read)
+    _worker_ocr = LicensePlateOCR(recognizer_only=recognizer_only, process_pool=False, cache_size=0,
+                                  fast_path=False)
+
+
+def _attach_slot(name: str) -> shared_memory.SharedMemory:
+    """Open (once per worker) a shared-memory slot created by the main process"""
+    slot = _worker_slots.get(name)
+    if slot is None:
+        # Workers share the main process's resource tracker, so attaching here
+        # does not hand the segment's cleanup to this worker
+        slot = shared_memory.SharedMemory(name=name)
+        _worker_slots[name] = slot
+    return slot
+
+
+def _probe_worker() -> bool:
+    """Whether this worker's EasyOCR reader loaded"""
+    return _worker_ocr is not None and _worker_ocr.is_available()
+
+
+def _read_worker(slot_name: Optional[str], shape: Tuple[int, int], plate_height: int,
+                 camera: Optional[str], pickled_region: Optional[np.ndarray] = None) -> Tuple[Optional[str], float, bool]:
+    """
+    Enhance and read one grayscale plate region
+
+    Returns:
+        (extracted_text, confidence_score, validated) - validated is True when
+        the text passed PlateValidator (counts as a successful read)
+    """
+    if _worker_ocr is None or not _worker_ocr.is_available():
+        return None, 0.0, False
+
+    if pickled_region is not None:
+        plate_region = pickled_region
+    else:
+        plate_region = np.ndarray(shape, dtype=np.uint8, buffer=_attach_slot(slot_name).buf)
+
+    # enhance_plate_region copies, so the slot is not read after this line
+    processed_image = _worker_ocr.enhance_plate_region(plate_region, plate_height, camera)
+    if processed_image is None:
+        return None, 0.0, False
+
+    # The main process counts the read (finish() in LicensePlateOCR.submit_text)
+    return _worker_ocr._pick_plate_text(_worker_ocr._read_text(processed_image))
+
+
+class OCRProcessPool:
+    """Pool of OCR worker processes fed through shared-memory slots"""
+
+    def __init__(self, workers: int = 1, torch_threads: int = 1, opencv_threads: int = 1,
+                 recognizer_only: bool = False, mp_context=None):
+        """
+        Args:
+            workers: Worker processes, each with its own EasyOCR reader
+            torch_threads: torch intra-op threads per worker
+            opencv_threads: OpenCV threads per worker
+            recognizer_only: See LicensePlateOCR
+            mp_context: Optional multiprocessing context (e.g. 'spawn')
+        """
+        self.workers = max(1, workers)
+        self.executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=mp_context,
+            initializer=_init_worker,
+            initargs=(torch_threads, opencv_threads, recognizer_only)
+        )
+
+        self.slots = [shared_memory.SharedMemory(create=True, size=SLOT_BYTES)
+                      for _ in range(self.workers * SLOTS_PER_WORKER)]
+        self.free_slots = queue.Queue()
+        for index in range(len(self.slots)):
+            self.free_slots.put(index)
+
+        self.available = None
+        self.available_lock = threading.Lock()
+        atexit.register(self.shutdown)
+
+        # Statistics (submit() is called from several OCR threads)
+        self.lock = threading.Lock()
+        self.crops_submitted = 0
+        self.crops_pickled = 0
+
+    def is_available(self) -> bool:
+        """Whether the workers loaded EasyOCR (the first call waits for a worker to start)"""
+        if self.available is None:
+            with self.available_lock:
+                if self.available is None:
+                    try:
+                        self.available = self.executor.submit(_probe_worker).result()
+                    except Exception as e:
+                        print(f"❌ OCR worker failed to start: {e}")
+                        self.available = False
+        return self.available
+
+    def submit(self, plate_region: np.ndarray, plate_height: int,
+               camera: Optional[str] = None) -> Future:
+        """
+        Queue a grayscale plate region (extract_plate_region) for a worker
+
+        Blocks while every slot is in use, so a slow pool slows its callers
+        instead of queueing crops without bound.
+
+        Returns:
+            Future resolving to (extracted_text, confidence_score, validated)
+        """
+        pickled = plate_region.nbytes > SLOT_BYTES
+        with self.lock:
+            self.crops_submitted += 1
+            if pickled:
+                self.crops_pickled += 1
+        if pickled:
+            return self.executor.submit(_read_worker, None, plate_region.shape, plate_height, camera,
+                                        np.ascontiguousarray(plate_region))
+
+        index = self.free_slots.get()
+        slot = self.slots[index]
+        np.ndarray(plate_region.shape, dtype=np.uint8, buffer=slot.buf)[...] = plate_region
+        try:
+            future = self.executor.submit(_read_worker, slot.name, plate_region.shape, plate_height, camera)
+        except Exception:
+            self.free_slots.put(index)
+            raise
+        future.add_done_callback(lambda _: self.free_slots.put(index))
+        return future
+
+    def get_statistics(self) -> dict:
+        """Get pool statistics"""
+        with self.lock:
+            crops_submitted, crops_pickled = self.crops_submitted, self.crops_pickled
+        return {
+            'workers': self.workers,
+            'crops_submitted': crops_submitted,
+            'crops_pickled': crops_pickled,
+            'free_slots': self.free_slots.qsize()
+        }
+
+    def shutdown(self):
+        """Stop the workers and release the shared memory"""
+        if self.executor is None:
+            return
+        self.executor.shutdown(wait=True)
+        self.executor = None
+        for slot in self.slots:
+            slot.close()
+            slot.unlink()
+        self.slots = []
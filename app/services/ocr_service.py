@@ -4,40 +4,130 @@ Uses EasyOCR to extract text from detected license plate regions
 Optimized for Philippine license plate formats
 """
 
-import easyocr
 import cv2
 import numpy as np
 from typing import Optional, Tuple, List
 import re
 import time
+import threading
+import multiprocessing
+from concurrent.futures import Future
 from app.utils.plate_validator import PlateValidator
+from app.services.ocr_cache import OCRResultCache
+from app.services.char_ocr import FastPlateReader
+from app.utils.config import (OCR_RECOGNIZER_ONLY, OCR_CACHE_SIZE, OCR_CACHE_MAX_AGE_SECONDS,
+                              OCR_CACHE_MAX_DISTANCE, OCR_TARGET_CHAR_HEIGHT, OCR_THRESHOLD_RECHECK_INTERVAL,
+                              OCR_PROCESS_POOL_ENABLED, OCR_POOL_WORKERS, OCR_POOL_TORCH_THREADS,
+                              OCR_POOL_OPENCV_THREADS, FAST_OCR_ENABLED, FAST_OCR_MODEL_PATH,
+                              FAST_OCR_MIN_CONFIDENCE)
+
+# Characters that can appear on a plate
+PLATE_ALLOWLIST = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789 '
+
+# Preprocessing: characters fill about this much of a detected plate's height
+CHARACTER_HEIGHT_RATIO = 0.6
+# Never upsample a crop more than this (the old fixed factor)
+MAX_SCALE_FACTOR = 4.0
+# Binarization methods, chosen per camera; block size of the adaptive one at target scale
+THRESHOLD_METHODS = ('adaptive', 'otsu', 'fixed')
+ADAPTIVE_BLOCK_SIZE = 11
+# The threshold method is chosen on a thumbnail this tall
+THRESHOLD_THUMBNAIL_HEIGHT = 32
 
 class LicensePlateOCR:
     """OCR service specifically optimized for license plate text recognition"""
     
-    def __init__(self):
-        # Initialize EasyOCR reader with English language
-        # This will download the model on first use
-        print("🔤 Initializing EasyOCR for license plate recognition...")
-        try:
-            self.reader = easyocr.Reader(['en'], gpu=False)  # Set gpu=True if you have CUDA
-            print("✅ EasyOCR initialized successfully!")
-        except Exception as e:
-            print(f"❌ Failed to initialize EasyOCR: {e}")
-            self.reader = None
+    def __init__(self, recognizer_only: bool = OCR_RECOGNIZER_ONLY, process_pool: Optional[bool] = None,
+                 cache_size: int = OCR_CACHE_SIZE, fast_path: Optional[bool] = None, load_reader: bool = True):
+        """
+        Args:
+            recognizer_only: Load only EasyOCR's recognition model and read the
+                whole (already localized) plate crop as one text line, skipping
+                the CRAFT text detector
+            process_pool: Run EasyOCR in OCR_POOL_WORKERS worker processes
+                instead of this one (None = OCR_PROCESS_POOL_ENABLED, main
+                process only)
+            cache_size: Result cache entries (0 = no cache)
+            fast_path: Try the character classifier (FAST_OCR_MODEL_PATH)
+                before EasyOCR (None = FAST_OCR_ENABLED)
+            load_reader: False = no EasyOCR reader or worker processes, for
+                callers that only use the preprocessing (training, benchmarks)
+        """
+        self.recognizer_only = recognizer_only
+        self.reader = None
+        self.pool = None
+        
+        if process_pool is None:
+            process_pool = OCR_PROCESS_POOL_ENABLED and multiprocessing.parent_process() is None
+        
+        mode = " (recognizer only)" if recognizer_only else ""
+        if not load_reader:
+            pass  # Preprocessing only
+        elif process_pool:
+            # Imported here: the pool module imports this one for its workers
+            from app.services.ocr_pool import OCRProcessPool
+            print(f"🔤 Starting {OCR_POOL_WORKERS} OCR worker process(es){mode}...")
+            self.pool = OCRProcessPool(OCR_POOL_WORKERS, OCR_POOL_TORCH_THREADS, OCR_POOL_OPENCV_THREADS,
+                                       recognizer_only)
+        else:
+            # Initialize EasyOCR reader with English language
+            # This will download the model on first use
+            print(f"🔤 Initializing EasyOCR for license plate recognition{mode}...")
+            try:
+                # Imported here so that importing this module does not load torch
+                import easyocr
+                # Set gpu=True if you have CUDA
+                self.reader = easyocr.Reader(['en'], gpu=False, detector=not recognizer_only)
+                print("✅ EasyOCR initialized successfully!")
+            except Exception as e:
+                print(f"❌ Failed to initialize EasyOCR: {e}")
+                self.reader = None
+        
+        # Character-classifier fast path; EasyOCR only reads what it cannot
+        self.fast_reader = None
+        if FAST_OCR_ENABLED if fast_path is None else fast_path:
+            self.fast_reader = FastPlateReader.load(FAST_OCR_MODEL_PATH)
         
         # OCR confidence threshold - lowered to catch more plates
         self.confidence_threshold = 0.25  # Even lower for bordered plates
         
+        # Recent reads by perceptual hash of the preprocessed crop (None = disabled)
+        self.result_cache = None
+        if cache_size > 0:
+            self.result_cache = OCRResultCache(cache_size, OCR_CACHE_MAX_AGE_SECONDS, OCR_CACHE_MAX_DISTANCE)
+        
+        # Threshold method per camera and crops binarized with it since it was chosen
+        self.threshold_methods = {}
+        self.threshold_uses = {}
+        
+        # Guards the threshold state and the statistics: crops are read from
+        # pipeline OCR workers, batcher threads and pool callbacks at once
+        self.lock = threading.Lock()
+        
+        # Crops each thread has read (see get_thread_reads)
+        self.thread_reads = threading.local()
+        
         # Statistics
         self.total_attempts = 0
         self.successful_reads = 0
+        self.fast_attempts = 0
+        self.fast_reads = 0
+        self.fast_seconds = 0.0
         self.start_time = time.time()
     
-    def preprocess_plate_image(self, image: np.ndarray, coordinates: Tuple[int, int, int, int]) -> np.ndarray:
+    def preprocess_plate_image(self, image: np.ndarray, coordinates: Tuple[int, int, int, int],
+                               camera: Optional[str] = None) -> np.ndarray:
         """
         Preprocess the license plate region for better OCR accuracy
+        (extract_plate_region followed by enhance_plate_region)
         """
+        plate_region = self.extract_plate_region(image, coordinates)
+        if plate_region is None:
+            return None
+        return self.enhance_plate_region(plate_region, coordinates[3], camera)
+    
+    def extract_plate_region(self, image: np.ndarray, coordinates: Tuple[int, int, int, int]) -> Optional[np.ndarray]:
+        """Grayscale plate region with some padding (None if empty)"""
         try:
             x, y, w, h = coordinates
             
@@ -53,66 +143,57 @@ class LicensePlateOCR:
             if plate_region.size == 0:
                 return None
             
-            # Resize for better OCR (make it larger)
-            scale_factor = 4.0  # Increased for better text recognition
+            # Convert to grayscale first so the resize only touches one channel
+            if len(plate_region.shape) == 3:
+                plate_region = cv2.cvtColor(plate_region, cv2.COLOR_BGR2GRAY)
+            return plate_region
+            
+        except Exception as e:
+            print(f"❌ Error preprocessing plate image: {e}")
+            return None
+    
+    def enhance_plate_region(self, plate_region: np.ndarray, plate_height: int,
+                             camera: Optional[str] = None) -> Optional[np.ndarray]:
+        """
+        Scale and binarize a grayscale plate region for OCR
+        
+        The region is scaled so characters are about OCR_TARGET_CHAR_HEIGHT
+        pixels tall, then binarized with the threshold method last chosen for
+        this camera (re-chosen on a small thumbnail when it stops fitting).
+        """
+        try:
+            # Resize to the target character height instead of a fixed factor
+            scale_factor = self._scale_factor(max(1, plate_height))
             new_width = int(plate_region.shape[1] * scale_factor)
             new_height = int(plate_region.shape[0] * scale_factor)
             
             if new_width > 0 and new_height > 0:
-                plate_region = cv2.resize(plate_region, (new_width, new_height), interpolation=cv2.INTER_CUBIC)
-            
-            # Convert to grayscale if it's color
-            if len(plate_region.shape) == 3:
-                plate_region = cv2.cvtColor(plate_region, cv2.COLOR_BGR2GRAY)
+                interpolation = cv2.INTER_CUBIC if scale_factor > 1.0 else cv2.INTER_AREA
+                plate_region = cv2.resize(plate_region, (new_width, new_height), interpolation=interpolation)
             
             # Apply image enhancements for better OCR - optimized for bordered plates
             # 1. Reduce noise but preserve borders
             plate_region = cv2.GaussianBlur(plate_region, (3, 3), 0)
             
-            # 2. Try multiple threshold methods for bordered plates
-            # Method 1: Standard adaptive threshold
-            thresh1 = cv2.adaptiveThreshold(
-                plate_region, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 11, 2
-            )
-            
-            # Method 2: Otsu's threshold for high contrast plates
-            _, thresh2 = cv2.threshold(plate_region, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
-            
-            # Method 3: Inverted threshold for dark borders
-            _, thresh3 = cv2.threshold(plate_region, 127, 255, cv2.THRESH_BINARY_INV)
-            thresh3 = cv2.bitwise_not(thresh3)  # Invert back
-            
-            # Choose the best threshold based on plate characteristics
-            # Count white pixels to determine which works best
-            white_pixels1 = cv2.countNonZero(thresh1)
-            white_pixels2 = cv2.countNonZero(thresh2)
-            white_pixels3 = cv2.countNonZero(thresh3)
+            # 2. Threshold with this camera's method; re-choose it when it stops fitting
+            camera_key = camera or "default"
+            with self.lock:
+                method = self.threshold_methods.get(camera_key)
+                recheck = method is None or self.threshold_uses[camera_key] >= OCR_THRESHOLD_RECHECK_INTERVAL
+            if recheck:
+                method = self._choose_threshold_method(camera_key, plate_region)
             
-            # Use the threshold that gives moderate white pixel count (good character extraction)
-            total_pixels = thresh1.shape[0] * thresh1.shape[1]
-            white_ratios = [
-                white_pixels1 / total_pixels,
-                white_pixels2 / total_pixels,
-                white_pixels3 / total_pixels
-            ]
+            binary = self._apply_threshold(plate_region, method)
+            if not 0.2 <= cv2.countNonZero(binary) / float(binary.size) <= 0.8:
+                chosen = self._choose_threshold_method(camera_key, plate_region)
+                if chosen != method:
+                    method = chosen
+                    binary = self._apply_threshold(plate_region, method)
+            with self.lock:
+                self.threshold_uses[camera_key] += 1
+            plate_region = binary
             
-            # Prefer ratio between 0.3 and 0.7 (good character/background balance)
-            best_idx = 0
-            best_score = float('inf')
-            for i, ratio in enumerate(white_ratios):
-                # Score based on distance from ideal ratio (0.5)
-                score = abs(ratio - 0.5)
-                if 0.2 <= ratio <= 0.8 and score < best_score:
-                    best_score = score
-                    best_idx = i
-            
-            plate_region = [thresh1, thresh2, thresh3][best_idx]
-            
-            # 3. Morphological operations to clean up - smaller kernel for bordered plates
-            kernel = np.ones((1, 1), np.uint8)
-            plate_region = cv2.morphologyEx(plate_region, cv2.MORPH_CLOSE, kernel)
-            
-            # 4. Remove small noise while preserving character borders
+            # 3. Remove small noise while preserving character borders
             kernel = np.ones((2, 2), np.uint8)
             plate_region = cv2.morphologyEx(plate_region, cv2.MORPH_OPEN, kernel)
             
@@ -122,70 +203,305 @@ class LicensePlateOCR:
             print(f"❌ Error preprocessing plate image: {e}")
             return None
     
-    def extract_text(self, image: np.ndarray, coordinates: Tuple[int, int, int, int]) -> Tuple[Optional[str], float]:
+    def _scale_factor(self, plate_height: int) -> float:
+        """Resize factor that brings the characters of a plate this tall to OCR_TARGET_CHAR_HEIGHT"""
+        scale_factor = OCR_TARGET_CHAR_HEIGHT / (plate_height * CHARACTER_HEIGHT_RATIO)
+        return min(scale_factor, MAX_SCALE_FACTOR)
+    
+    def _apply_threshold(self, gray: np.ndarray, method: int, block_size: int = ADAPTIVE_BLOCK_SIZE) -> np.ndarray:
+        """Binarize with one of THRESHOLD_METHODS (index)"""
+        if method == 0:
+            # Standard adaptive threshold
+            return cv2.adaptiveThreshold(gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, block_size, 2)
+        if method == 1:
+            # Otsu's threshold for high contrast plates
+            return cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)[1]
+        # Fixed threshold for dark borders
+        return cv2.threshold(gray, 127, 255, cv2.THRESH_BINARY)[1]
+    
+    def _choose_threshold_method(self, camera_key: str, gray: np.ndarray) -> int:
+        """
+        Pick (and remember for the camera) the threshold method on a small thumbnail of the plate
+        
+        Prefers the method whose white pixel ratio is closest to 0.5 within
+        0.2-0.8 (good character/background balance); adaptive when none fits.
+        """
+        thumbnail_scale = min(1.0, THRESHOLD_THUMBNAIL_HEIGHT / float(gray.shape[0]))
+        thumbnail = gray
+        if thumbnail_scale < 1.0:
+            thumbnail_size = (max(1, int(gray.shape[1] * thumbnail_scale)), THRESHOLD_THUMBNAIL_HEIGHT)
+            thumbnail = cv2.resize(gray, thumbnail_size, interpolation=cv2.INTER_AREA)
+        # Keep the adaptive block the same size relative to the characters
+        block_size = max(3, int(ADAPTIVE_BLOCK_SIZE * thumbnail_scale) | 1)
+        
+        best_idx = 0
+        best_score = float('inf')
+        for i in range(len(THRESHOLD_METHODS)):
+            binary = self._apply_threshold(thumbnail, i, block_size)
+            ratio = cv2.countNonZero(binary) / float(binary.size)
+            # Score based on distance from ideal ratio (0.5)
+            score = abs(ratio - 0.5)
+            if 0.2 <= ratio <= 0.8 and score < best_score:
+                best_score = score
+                best_idx = i
+        
+        with self.lock:
+            self.threshold_methods[camera_key] = best_idx
+            self.threshold_uses[camera_key] = 0
+        return best_idx
+    
+    def extract_text(self, image: np.ndarray, coordinates: Tuple[int, int, int, int],
+                     camera: Optional[str] = None) -> Tuple[Optional[str], float]:
         """
         Extract text from a license plate region
+        camera: Source camera; preprocessing remembers its threshold method per camera
         Returns: (extracted_text, confidence_score)
         """
-        if self.reader is None:
-            return None, 0.0
+        if self.pool is not None:
+            return self.submit_text(image, coordinates, camera).result()
         
-        self.total_attempts += 1
+        if self.reader is None and self.fast_reader is None:
+            return None, 0.0
         
         try:
-            # Preprocess the image
-            processed_image = self.preprocess_plate_image(image, coordinates)
+            plate_region = self.extract_plate_region(image, coordinates)
             
-            if processed_image is None:
+            if plate_region is None:
+                self.count_attempt(read=False)
                 return None, 0.0
             
-            # Use EasyOCR to extract text with optimized parameters
-            results = self.reader.readtext(
-                processed_image,
-                allowlist='ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789 ',  # Only alphanumeric and space
-                width_ths=0.5,  # Lowered threshold for better detection
-                height_ths=0.5,  # Lowered threshold for better detection
-                paragraph=False,  # Don't group into paragraphs
-                detail=1  # Return detailed results with confidence
-            )
+            # Near-identical crop read recently (parked / slow car)
+            cache_key, cached = self.lookup_cached_text(plate_region)
+            if cached is not None:
+                return cached
+            
+            # Preprocess the image
+            processed_image = self.enhance_plate_region(plate_region, coordinates[3], camera)
             
-            if not results:
+            self.count_attempt()
+            if processed_image is None:
                 return None, 0.0
             
-            # Process all detected text regions
-            best_text = None
-            best_confidence = 0.0
+            fast_result = self.read_fast(processed_image)
+            if fast_result is not None:
+                self.cache_plate_text(cache_key, fast_result)
+                return fast_result
+            if self.reader is None:
+                return None, 0.0
             
-            for (bbox, text, confidence) in results:
-                # Clean up the text
-                cleaned_text = self._clean_text(text)
-                
-                # Validate if it looks like a license plate
-                if cleaned_text and confidence > self.confidence_threshold:
-                    is_valid, normalized_text, plate_type = PlateValidator.validate_and_normalize(cleaned_text)
-                    
-                    if is_valid and confidence > best_confidence:
-                        best_text = normalized_text
-                        best_confidence = confidence
+            results = self._read_text(processed_image)
             
-            if best_text:
-                self.successful_reads += 1
-                print(f"🔤 OCR Success: '{best_text}' (confidence: {best_confidence:.2f})")
-                return best_text, best_confidence
-            else:
-                # Try fallback with lower threshold
-                for (bbox, text, confidence) in results:
-                    cleaned_text = self._clean_text(text)
-                    if cleaned_text and len(cleaned_text) >= 5:  # At least 5 characters
-                        print(f"🔤 OCR Fallback: '{cleaned_text}' (confidence: {confidence:.2f})")
-                        return cleaned_text, confidence
-                
-                return None, 0.0
+            result = self.select_plate_text(results)
+            self.cache_plate_text(cache_key, result)
+            return result
                 
         except Exception as e:
             print(f"❌ OCR extraction error: {e}")
             return None, 0.0
     
+    def submit_text(self, image: np.ndarray, coordinates: Tuple[int, int, int, int],
+                    camera: Optional[str] = None) -> Future:
+        """
+        Start reading a license plate region
+        
+        With the process pool the region is handed to a worker and the future
+        resolves when it is read (cache hits and fast-path reads resolve at
+        once); otherwise the text is extracted before returning.
+        
+        Returns: Future resolving to (extracted_text, confidence_score)
+        """
+        future = Future()
+        if self.pool is None:
+            future.set_result(self.extract_text(image, coordinates, camera))
+            return future
+        
+        try:
+            if self.fast_reader is None and not self.pool.is_available():
+                future.set_result((None, 0.0))
+                return future
+            
+            plate_region = self.extract_plate_region(image, coordinates)
+            if plate_region is None:
+                self.count_attempt(read=False)
+                future.set_result((None, 0.0))
+                return future
+            
+            # Near-identical crop read recently (parked / slow car)
+            cache_key, cached = self.lookup_cached_text(plate_region)
+            if cached is not None:
+                future.set_result(cached)
+                return future
+            
+            self.count_attempt()
+            if self.fast_reader is not None:
+                # The fast path runs here; only crops it cannot read go to a worker
+                processed_image = self.enhance_plate_region(plate_region, coordinates[3], camera)
+                fast_result = self.read_fast(processed_image) if processed_image is not None else None
+                if fast_result is not None:
+                    self.cache_plate_text(cache_key, fast_result)
+                    future.set_result(fast_result)
+                    return future
+                if not self.pool.is_available():
+                    future.set_result((None, 0.0))
+                    return future
+            
+            pending = self.pool.submit(plate_region, coordinates[3], camera)
+        except Exception as e:
+            print(f"❌ OCR extraction error: {e}")
+            future.set_result((None, 0.0))
+            return future
+        
+        def finish(done: Future):
+            try:
+                text, confidence, validated = done.result()
+            except Exception as e:
+                print(f"❌ OCR worker error: {e}")
+                text, confidence, validated = None, 0.0, False
+            if validated:
+                self.count_success()
+            self.cache_plate_text(cache_key, (text, confidence))
+            future.set_result((text, confidence))
+        
+        pending.add_done_callback(finish)
+        return future
+    
+    def read_fast(self, processed_image: np.ndarray) -> Optional[Tuple[str, float]]:
+        """
+        Try the character classifier on a preprocessed plate crop
+        Returns: (text, confidence) when the read passes PlateValidator with at
+        least FAST_OCR_MIN_CONFIDENCE, otherwise None (read it with EasyOCR)
+        """
+        if self.fast_reader is None:
+            return None
+        
+        start = time.perf_counter()
+        result = None
+        try:
+            text, confidence = self.fast_reader.read(processed_image)
+            if text and confidence >= FAST_OCR_MIN_CONFIDENCE:
+                is_valid, normalized_text, plate_type = PlateValidator.validate_and_normalize(text)
+                if is_valid:
+                    result = (normalized_text, confidence)
+        except Exception as e:
+            print(f"❌ Fast OCR error: {e}")
+        
+        elapsed = time.perf_counter() - start
+        with self.lock:
+            self.fast_attempts += 1
+            self.fast_seconds += elapsed
+            if result is not None:
+                self.fast_reads += 1
+                self.successful_reads += 1
+        if result is not None:
+            print(f"🔤 Fast OCR Success: '{result[0]}' (confidence: {result[1]:.2f})")
+        return result
+    
+    def count_attempt(self, read: bool = True):
+        """
+        Count a crop that was preprocessed for reading (not answered from the cache)
+        read: False for an empty plate region, which never reaches the OCR
+        """
+        with self.lock:
+            self.total_attempts += 1
+        if read:
+            self.thread_reads.count = self.get_thread_reads() + 1
+    
+    def get_thread_reads(self) -> int:
+        """
+        Crops the calling thread has handed to the OCR so far (cache hits excluded);
+        the difference across a frame is the number of real OCR calls it made
+        """
+        return getattr(self.thread_reads, 'count', 0)
+    
+    def count_success(self):
+        """Count a read that passed validation"""
+        with self.lock:
+            self.successful_reads += 1
+    
+    def lookup_cached_text(self, plate_region: np.ndarray) -> Tuple[Optional[int], Optional[Tuple[Optional[str], float]]]:
+        """
+        Look up a grayscale plate region (extract_plate_region) in the result cache
+        Returns: (cache key, cached (text, confidence) or None)
+        """
+        if self.result_cache is None:
+            return None, None
+        cache_key = self.result_cache.key(plate_region)
+        return cache_key, self.result_cache.get(cache_key)
+    
+    def cache_plate_text(self, cache_key: Optional[int], result: Tuple[Optional[str], float]):
+        """Remember the read for a crop looked up with lookup_cached_text (failed reads are not kept)"""
+        if self.result_cache is not None and cache_key is not None:
+            self.result_cache.put(cache_key, result)
+    
+    def select_plate_text(self, results: List[Tuple]) -> Tuple[Optional[str], float]:
+        """
+        Pick the plate text from EasyOCR results for one crop
+        Returns: (extracted_text, confidence_score)
+        """
+        text, confidence, validated = self._pick_plate_text(results)
+        if validated:
+            self.count_success()
+        return text, confidence
+    
+    def _pick_plate_text(self, results: List[Tuple]) -> Tuple[Optional[str], float, bool]:
+        """
+        select_plate_text() without counting the read
+        Returns: (extracted_text, confidence_score, validated) - validated is
+        True when the text passed PlateValidator
+        """
+        if not results:
+            return None, 0.0, False
+        
+        # Process all detected text regions
+        best_text = None
+        best_confidence = 0.0
+        
+        for (bbox, text, confidence) in results:
+            # Clean up the text
+            cleaned_text = self._clean_text(text)
+            
+            # Validate if it looks like a license plate
+            if cleaned_text and confidence > self.confidence_threshold:
+                is_valid, normalized_text, plate_type = PlateValidator.validate_and_normalize(cleaned_text)
+                
+                if is_valid and confidence > best_confidence:
+                    best_text = normalized_text
+                    best_confidence = confidence
+        
+        if best_text:
+            print(f"🔤 OCR Success: '{best_text}' (confidence: {best_confidence:.2f})")
+            return best_text, best_confidence, True
+        else:
+            # Try fallback with lower threshold
+            for (bbox, text, confidence) in results:
+                cleaned_text = self._clean_text(text)
+                if cleaned_text and len(cleaned_text) >= 5:  # At least 5 characters
+                    print(f"🔤 OCR Fallback: '{cleaned_text}' (confidence: {confidence:.2f})")
+                    return cleaned_text, confidence, False
+            
+            return None, 0.0, False
+    
+    def _read_text(self, processed_image: np.ndarray) -> List[Tuple]:
+        """Run EasyOCR on a preprocessed plate crop; returns [(bbox, text, confidence), ...]"""
+        if self.recognizer_only:
+            # The plate detector already localized the text: the whole crop is one region
+            return self.reader.recognize(
+                processed_image,
+                allowlist=PLATE_ALLOWLIST,
+                paragraph=False,
+                detail=1
+            )
+        
+        # Use EasyOCR to extract text with optimized parameters
+        return self.reader.readtext(
+            processed_image,
+            allowlist=PLATE_ALLOWLIST,  # Only alphanumeric and space
+            width_ths=0.5,  # Lowered threshold for better detection
+            height_ths=0.5,  # Lowered threshold for better detection
+            paragraph=False,  # Don't group into paragraphs
+            detail=1  # Return detailed results with confidence
+        )
+    
     def _clean_text(self, text: str) -> Optional[str]:
         """Clean and normalize extracted text"""
         if not text:
@@ -260,30 +576,71 @@ class LicensePlateOCR:
     def get_statistics(self) -> dict:
         """Get OCR performance statistics"""
         uptime = time.time() - self.start_time
-        success_rate = (self.successful_reads / self.total_attempts * 100) if self.total_attempts > 0 else 0
+        with self.lock:
+            total_attempts, successful_reads = self.total_attempts, self.successful_reads
+            fast_attempts, fast_reads, fast_seconds = self.fast_attempts, self.fast_reads, self.fast_seconds
+        success_rate = (successful_reads / total_attempts * 100) if total_attempts > 0 else 0
         
-        return {
-            'total_attempts': self.total_attempts,
-            'successful_reads': self.successful_reads,
+        stats = {
+            'total_attempts': total_attempts,
+            'successful_reads': successful_reads,
             'success_rate': round(success_rate, 1),
             'uptime_seconds': round(uptime, 1)
         }
+        if self.result_cache is not None:
+            stats.update(self.result_cache.get_statistics())
+        if self.fast_reader is not None:
+            fast_share = (fast_reads / total_attempts * 100) if total_attempts > 0 else 0
+            stats.update({
+                'fast_path_attempts': fast_attempts,
+                'fast_path_reads': fast_reads,
+                'fast_path_share': round(fast_share, 1),
+                'fast_path_avg_ms': round(fast_seconds / fast_attempts * 1000, 2)
+                if fast_attempts > 0 else 0
+            })
+        if self.pool is not None:
+            stats.update(self.pool.get_statistics())
+        return stats
     
     def is_available(self) -> bool:
         """Check if OCR service is available"""
-        return self.reader is not None
+        # Probing the pool starts its workers (model warm-up relies on this)
+        if self.pool is not None:
+            return self.pool.is_available() or self.fast_reader is not None
+        return self.reader is not None or self.fast_reader is not None
+
+# Global OCR instance, created on first use (loading EasyOCR takes seconds)
+_ocr_service: Optional[LicensePlateOCR] = None
+_ocr_service_lock = threading.Lock()
+
+def get_ocr_service() -> LicensePlateOCR:
+    """Get the global OCR service, loading the EasyOCR reader on first call"""
+    global _ocr_service
+    if _ocr_service is None:
+        with _ocr_service_lock:
+            if _ocr_service is None:
+                _ocr_service = LicensePlateOCR()
+    return _ocr_service
+
+def is_ocr_loaded() -> bool:
+    """Check if the OCR service has been created yet (without creating it)"""
+    return _ocr_service is not None
 
-# Global OCR instance
-ocr_service = LicensePlateOCR()
+def __getattr__(name: str):
+    # Keeps `from app.services.ocr_service import ocr_service` working; the reader loads on that import
+    if name == "ocr_service":
+        return get_ocr_service()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-def extract_plate_text(image: np.ndarray, coordinates: Tuple[int, int, int, int]) -> Tuple[Optional[str], float]:
+def extract_plate_text(image: np.ndarray, coordinates: Tuple[int, int, int, int],
+                       camera: Optional[str] = None) -> Tuple[Optional[str], float]:
     """Convenience function to extract text from license plate region"""
-    return ocr_service.extract_text(image, coordinates)
+    return get_ocr_service().extract_text(image, coordinates, camera)
 
 def get_ocr_stats() -> dict:
     """Get OCR performance statistics"""
-    return ocr_service.get_statistics()
+    return get_ocr_service().get_statistics()
 
 def is_ocr_available() -> bool:
     """Check if OCR is available"""
-    return ocr_service.is_available()
+    return get_ocr_service().is_available()
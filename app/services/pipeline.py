@@ -0,0 +1,771 @@
+"""
+Camera Pipeline
+Runs the camera loop as separate stages - capture, detect, OCR and sink
+(draw, log, display) - connected by bounded queues. Frame queues drop their
+oldest frame when full, so a slow OCR call costs dropped frames instead of
+a frozen capture and display, and latency stays bounded by the queue sizes.
+Every stage has its own worker count (threads, or processes for stages
+whose handler can be pickled) and reports queue depth and throughput.
+
+Headless (no UI):
+    python -m app.services.pipeline [--source 0 | --source clip.mp4 | --source synthetic:15] [--duration 60]
+"""
+
+import collections
+import threading
+import time
+import cv2
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from app.services.plate.detector import get_plate_detector, get_thread_detector
+from app.utils.config import (PIPELINE_QUEUE_SIZE, PIPELINE_DETECT_WORKERS, PIPELINE_OCR_WORKERS,
+                              PIPELINE_DETECT_PROCESSES, TILED_DETECTION_ENABLED)
+
+# Completions kept per stage for its recent throughput
+THROUGHPUT_WINDOW = 30
+# How often idle workers re-check for stop (seconds)
+POLL_INTERVAL = 0.1
+
+
+class FrameQueue:
+    """Bounded queue between two stages; when full, put() drops the oldest item (or waits)"""
+
+    def __init__(self, maxsize: int = PIPELINE_QUEUE_SIZE, drop_oldest: bool = True):
+        """
+        Args:
+            maxsize: Items the queue holds
+            drop_oldest: Drop the oldest item when full; False = put() waits for room
+                (recorded footage, where every frame should be processed)
+        """
+        self.maxsize = max(1, maxsize)
+        self.drop_oldest = drop_oldest
+        self.items = collections.deque()
+        self.condition = threading.Condition()
+        self.closed = False
+
+        # Statistics
+        self.dropped = 0
+        self.max_depth = 0
+
+    def put(self, item: Any, timeout: Optional[float] = None) -> bool:
+        """Add an item; False when the queue is closed (or no room came up within timeout)"""
+        with self.condition:
+            if not self.drop_oldest and not self.condition.wait_for(
+                    lambda: self.closed or len(self.items) < self.maxsize, timeout):
+                return False
+            if self.closed:
+                return False
+            if len(self.items) >= self.maxsize:
+                self.items.popleft()
+                self.dropped += 1
+            self.items.append(item)
+            self.max_depth = max(self.max_depth, len(self.items))
+            self.condition.notify_all()
+            return True
+
+    def get(self, timeout: Optional[float] = None) -> Any:
+        """Oldest item; None on timeout, or once the queue is closed and empty"""
+        with self.condition:
+            if not self.condition.wait_for(lambda: self.items or self.closed, timeout):
+                return None
+            if not self.items:
+                return None
+            item = self.items.popleft()
+            self.condition.notify_all()
+            return item
+
+    def close(self):
+        """No more puts; get() drains what is left, then returns None"""
+        with self.condition:
+            self.closed = True
+            self.condition.notify_all()
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+
+class FairFrameQueue(FrameQueue):
+    """
+    FrameQueue with one bounded lane per key (camera): get() takes the
+    lanes in turn, and a busy camera only drops its own oldest frames.
+    With pin_lanes() every lane is served by one worker only.
+    """
+
+    def __init__(self, maxsize: int = PIPELINE_QUEUE_SIZE, drop_oldest: bool = True,
+                 key: Callable[[Any], Any] = lambda item: item.camera):
+        """
+        Args:
+            maxsize: Items each lane holds
+            drop_oldest: See FrameQueue
+            key: Lane of an item
+        """
+        super().__init__(maxsize, drop_oldest)
+        self.key = key
+        self.lanes: Dict[Any, collections.deque] = {}
+        self.turn = collections.deque()  # Lane keys, next lane to serve first
+        self.dropped_by_key: Dict[Any, int] = {}
+        self.pinned_workers = 0
+        self.owners: Dict[Any, int] = {}  # Lane key -> worker serving it (pinned lanes)
+
+    def pin_lanes(self, workers: int):
+        """
+        Serve every lane from one of `workers` workers only (get(worker=...)),
+        so a lane's items are handled one at a time and in order; lanes are
+        dealt out to the workers as they appear
+        """
+        with self.condition:
+            self.pinned_workers = max(1, workers)
+            self.owners = {}
+
+    def _serves(self, worker: Optional[int], key: Any) -> bool:
+        """Whether `worker` takes items from lane `key` (call with the condition held)"""
+        if worker is None or not self.pinned_workers:
+            return True
+        if key not in self.owners:
+            self.owners[key] = len(self.owners) % self.pinned_workers
+        return self.owners[key] == worker
+
+    def waiting(self, worker: Optional[int] = None) -> int:
+        """Items waiting in the lanes `worker` serves (None = all lanes)"""
+        with self.condition:
+            return sum(len(lane) for key, lane in self.lanes.items() if self._serves(worker, key))
+
+    def put(self, item: Any, timeout: Optional[float] = None) -> bool:
+        key = self.key(item)
+        with self.condition:
+            if key not in self.lanes:
+                self.lanes[key] = collections.deque()
+                self.turn.append(key)
+                self.dropped_by_key[key] = 0
+            lane = self.lanes[key]
+            if not self.drop_oldest and not self.condition.wait_for(
+                    lambda: self.closed or len(lane) < self.maxsize, timeout):
+                return False
+            if self.closed:
+                return False
+            if len(lane) >= self.maxsize:
+                lane.popleft()
+                self.dropped += 1
+                self.dropped_by_key[key] += 1
+            lane.append(item)
+            self.max_depth = max(self.max_depth, len(self))
+            self.condition.notify_all()
+            return True
+
+    def get(self, timeout: Optional[float] = None, worker: Optional[int] = None) -> Any:
+        """Oldest item of the next lane in turn; `worker` only takes its own lanes (see pin_lanes)"""
+        with self.condition:
+            if not self.condition.wait_for(lambda: self.waiting(worker) or self.closed, timeout):
+                return None
+            for _ in range(len(self.turn)):
+                key = self.turn[0]
+                self.turn.rotate(-1)
+                if self.lanes[key] and self._serves(worker, key):
+                    item = self.lanes[key].popleft()
+                    self.condition.notify_all()
+                    return item
+            return None
+
+    def __len__(self) -> int:
+        return sum(len(lane) for lane in self.lanes.values())
+
+
+class PipelineStage:
+    """One stage: worker threads (or processes) taking items from the stage's input queue"""
+
+    def __init__(self, name: str, handler: Callable[[Any], Any], workers: int = 1,
+                 queue_size: int = PIPELINE_QUEUE_SIZE, drop_oldest: bool = True,
+                 processes: bool = False, process_initializer: Optional[Callable] = None,
+                 queue: Optional[FrameQueue] = None, pin_lanes: bool = False):
+        """
+        Args:
+            name: Stage name in statistics and log lines
+            handler: Called with each item; returns the item for the next stage,
+                or None to stop it here. Handlers exposing get_statistics() have
+                their numbers merged into the stage's.
+            workers: Items handled at the same time
+            queue_size: Items waiting in front of the stage
+            drop_oldest: See FrameQueue
+            processes: Run the handler in `workers` worker processes (handler and
+                items must be picklable; the item comes back as a copy)
+            process_initializer: Runs once in every worker process
+            queue: Input queue to use instead of a FrameQueue(queue_size, drop_oldest)
+            pin_lanes: Serve each lane of a FairFrameQueue from one worker, for
+                handlers that keep per-camera state and need its frames in order
+        """
+        self.name = name
+        self.handler = handler
+        self.workers = max(1, workers)
+        self.queue = queue if queue is not None else FrameQueue(queue_size, drop_oldest)
+        self.processes = processes
+        self.process_initializer = process_initializer
+        self.pin_lanes = pin_lanes and isinstance(self.queue, FairFrameQueue)
+        self.executor = None
+        self.threads: List[threading.Thread] = []
+        self.output: Optional[FrameQueue] = None
+        self.lock = threading.Lock()
+        self.active_workers = 0
+
+        # Statistics
+        self.processed = 0
+        self.errors = 0
+        self.busy_seconds = 0.0
+        self.completions = collections.deque(maxlen=THROUGHPUT_WINDOW)
+
+    def start(self, output: Optional[FrameQueue]):
+        """Start the workers; results go to `output` (None = last stage)"""
+        self.output = output
+        if self.processes:
+            self.executor = ProcessPoolExecutor(max_workers=self.workers, initializer=self.process_initializer)
+        if self.pin_lanes:
+            self.queue.pin_lanes(self.workers)
+        self.active_workers = self.workers
+        self.threads = [
+            threading.Thread(target=self._run, args=(i,), name=f"pipeline-{self.name}-{i}", daemon=True)
+            for i in range(self.workers)
+        ]
+        for thread in self.threads:
+            thread.start()
+
+    def _run(self, worker: int):
+        while True:
+            if self.pin_lanes:
+                item = self.queue.get(timeout=POLL_INTERVAL, worker=worker)
+            else:
+                item = self.queue.get(timeout=POLL_INTERVAL)
+            if item is None:
+                remaining = self.queue.waiting(worker) if self.pin_lanes else len(self.queue)
+                if self.queue.closed and not remaining:
+                    break
+                continue
+
+            start = time.perf_counter()
+            try:
+                if self.executor is not None:
+                    result = self.executor.submit(self.handler, item).result()
+                else:
+                    result = self.handler(item)
+            except Exception as e:
+                print(f"❌ Pipeline stage '{self.name}' error: {e}")
+                result = None
+                with self.lock:
+                    self.errors += 1
+            finished = time.perf_counter()
+
+            with self.lock:
+                self.processed += 1
+                self.busy_seconds += finished - start
+                self.completions.append(finished)
+            if result is not None and self.output is not None:
+                self.output.put(result)
+
+        # The last worker out closes the next stage's queue so it drains and stops too
+        with self.lock:
+            self.active_workers -= 1
+            last = self.active_workers == 0
+        if last:
+            if self.output is not None:
+                self.output.close()
+            if self.executor is not None:
+                self.executor.shutdown(wait=False)
+
+    def join(self, timeout: Optional[float] = None):
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        for thread in self.threads:
+            thread.join(None if deadline is None else max(0.0, deadline - time.perf_counter()))
+
+    def is_alive(self) -> bool:
+        return any(thread.is_alive() for thread in self.threads)
+
+    def get_statistics(self) -> dict:
+        """Queue depth, drops and throughput of this stage"""
+        with self.lock:
+            completions = list(self.completions)
+            stats = {
+                'workers': self.workers,
+                'queue_depth': len(self.queue),
+                'queue_size': self.queue.maxsize,
+                'max_queue_depth': self.queue.max_depth,
+                'dropped': self.queue.dropped,
+                'processed': self.processed,
+                'errors': self.errors,
+                'avg_ms': round(self.busy_seconds / self.processed * 1000, 1) if self.processed else 0.0
+            }
+        span = completions[-1] - completions[0] if len(completions) > 1 else 0.0
+        stats['fps'] = round((len(completions) - 1) / span, 1) if span > 0 else 0.0
+        if hasattr(self.handler, 'get_statistics'):
+            stats.update(self.handler.get_statistics())
+        return stats
+
+
+class Pipeline:
+    """Capture threads (one per source) feeding a chain of PipelineStages"""
+
+    def __init__(self, source: Union[Callable[[], Any], List[Callable[[], Any]]], stages: List[PipelineStage],
+                 max_fps: Optional[float] = None):
+        """
+        Args:
+            source: Returns the next item (blocking is fine), None at end of
+                stream; a list of sources gets one capture thread each
+            stages: Stages in order; each stage's output feeds the next one's queue
+            max_fps: Cap on items taken from each source (None = as fast as it delivers)
+        """
+        self.sources = list(source) if isinstance(source, (list, tuple)) else [source]
+        self.stages = stages
+        self.min_interval = 1.0 / max_fps if max_fps else 0.0
+        self.capture_threads: List[threading.Thread] = []
+        self.running = False
+        self.lock = threading.Lock()
+        self.active_sources = 0
+
+        # Statistics
+        self.captured = 0
+        self.capture_completions = collections.deque(maxlen=THROUGHPUT_WINDOW)
+
+    def start(self):
+        """Start every stage, then the capture threads"""
+        for index, stage in enumerate(self.stages):
+            stage.start(self.stages[index + 1].queue if index + 1 < len(self.stages) else None)
+        self.running = True
+        self.active_sources = len(self.sources)
+        self.capture_threads = [
+            threading.Thread(target=self._capture_loop, args=(source,), name=f"pipeline-capture-{i}", daemon=True)
+            for i, source in enumerate(self.sources)
+        ]
+        for thread in self.capture_threads:
+            thread.start()
+        sources = f"capture x{len(self.sources)}" if len(self.sources) > 1 else "capture"
+        print(f"✅ Pipeline started: {sources} → {' → '.join(f'{s.name} x{s.workers}' for s in self.stages)}")
+
+    def _capture_loop(self, source: Callable[[], Any]):
+        next_time = time.perf_counter()
+        try:
+            while self.running:
+                if self.min_interval:
+                    delay = next_time - time.perf_counter()
+                    if delay > 0:
+                        time.sleep(delay)
+                    next_time = max(next_time + self.min_interval, time.perf_counter())
+
+                item = source()
+                if item is None:
+                    print("📹 Pipeline source ended")
+                    break
+                with self.lock:
+                    self.captured += 1
+                    self.capture_completions.append(time.perf_counter())
+                if not self.stages[0].queue.put(item):
+                    break
+        except Exception as e:
+            print(f"❌ Pipeline capture error: {e}")
+        finally:
+            # The last source to end closes the first stage's queue
+            with self.lock:
+                self.active_sources -= 1
+                last = self.active_sources == 0
+            if last:
+                self.running = False
+                self.stages[0].queue.close()
+
+    def stop(self, timeout: Optional[float] = 1.0):
+        """
+        Stop capturing; the stages finish the frames already queued and exit
+        (see join). Waits up to `timeout` for the capture threads only, so the
+        caller may release the cameras afterwards.
+        """
+        self.running = False
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        for thread in self.capture_threads:
+            if thread is not threading.current_thread():
+                thread.join(None if deadline is None else max(0.0, deadline - time.perf_counter()))
+
+    def join(self, timeout: Optional[float] = None):
+        """Wait until every source has ended and every stage has drained"""
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        remaining = lambda: None if deadline is None else max(0.0, deadline - time.perf_counter())
+        for thread in self.capture_threads:
+            thread.join(remaining())
+        for stage in self.stages:
+            stage.join(remaining())
+
+    def is_alive(self) -> bool:
+        """True while any thread (capture or stage) is still running"""
+        return any(thread.is_alive() for thread in self.capture_threads) or \
+            any(stage.is_alive() for stage in self.stages)
+
+    def get_statistics(self) -> Dict[str, dict]:
+        """Per-stage statistics, capture first"""
+        with self.lock:
+            completions = list(self.capture_completions)
+            captured = self.captured
+        span = completions[-1] - completions[0] if len(completions) > 1 else 0.0
+        stats = {'capture': {'captured': captured,
+                             'fps': round((len(completions) - 1) / span, 1) if span > 0 else 0.0}}
+        for stage in self.stages:
+            stats[stage.name] = stage.get_statistics()
+        return stats
+
+    def format_statistics(self) -> str:
+        """One status line: fps, queue depth and drops per stage"""
+        stats = self.get_statistics()
+        parts = [f"capture {stats['capture']['fps']:.1f} fps"]
+        for stage in self.stages:
+            stage_stats = stats[stage.name]
+            parts.append(f"{stage.name} {stage_stats['fps']:.1f} fps, {stage_stats['avg_ms']:.0f} ms, "
+                         f"queue {stage_stats['queue_depth']}/{stage_stats['queue_size']}, "
+                         f"{stage_stats['dropped']} dropped")
+        return " | ".join(parts)
+
+
+# ---------------------------------------------------------------------------
+# License plate stages
+# ---------------------------------------------------------------------------
+
+@dataclass
+class PlateFrame:
+    """A camera frame on its way through the plate pipeline"""
+    frame_id: int
+    camera: str
+    captured_at: float  # time.perf_counter() when the frame was grabbed from the camera
+    frame: np.ndarray
+    regions: Optional[List[Tuple[int, int, int, int]]] = None  # Motion gate output; [] = static frame
+    plates: Optional[List[Tuple[int, int, int, int]]] = None
+    scores: Optional[List[float]] = None
+    results: Optional[List[Dict]] = None  # detect_and_read_plates dictionaries
+    labels: Optional[List[Tuple[str, Tuple[int, int, int, int]]]] = None  # Ground truth of synthetic sources
+
+
+class CameraSource:
+    """Pipeline source reading PlateFrames from a FrameSource (or a cv2.VideoCapture)"""
+
+    def __init__(self, capture, camera: str = "Camera", resize: Optional[Tuple[int, int]] = None,
+                 motion_gate=None):
+        """
+        Args:
+            capture: Opened FrameSource (see open_frame_source) or cv2.VideoCapture
+            camera: Camera location, passed on to OCR and the detection log
+            resize: Frame size (width, height); default 640x480 unless tiled detection is on
+            motion_gate: Optional MotionGate; static frames skip detection and OCR
+        """
+        self.capture = capture
+        self.camera = camera
+        self.resize = resize if resize is not None else (None if TILED_DETECTION_ENABLED else (640, 480))
+        self.motion_gate = motion_gate
+        self.frame_id = 0
+
+    def __call__(self) -> Optional[PlateFrame]:
+        if hasattr(self.capture, 'read_latest'):
+            # FrameSource: frame stamped when it was captured (grabbed by the camera's capture thread)
+            latest = self.capture.read_latest()
+            if latest is None:
+                return None
+            frame, captured_at, labels = latest.frame, latest.timestamp, latest.labels
+        else:
+            ret, frame = self.capture.read()
+            if not ret:
+                return None
+            captured_at, labels = time.perf_counter(), None
+        if self.resize and frame.shape[1::-1] != tuple(self.resize):
+            scale_x, scale_y = self.resize[0] / frame.shape[1], self.resize[1] / frame.shape[0]
+            frame = cv2.resize(frame, self.resize)
+            if labels:
+                labels = [(text, (int(x * scale_x), int(y * scale_y), int(w * scale_x), int(h * scale_y)))
+                          for text, (x, y, w, h) in labels]
+        # The motion gate keeps a background model, so it runs here, in frame order
+        regions = self.motion_gate.check(frame) if self.motion_gate else None
+        self.frame_id += 1
+        return PlateFrame(self.frame_id, self.camera, captured_at, frame, regions, labels=labels)
+
+
+def _init_detect_worker():
+    """Load the cascades once per detect worker process"""
+    cv2.setNumThreads(1)
+    get_thread_detector()
+
+
+def detect_frame(item: PlateFrame) -> PlateFrame:
+    """
+    Detect stage: plate boxes and scores (static frames skip the cascades);
+    every detect worker uses its own detector
+    """
+    if item.regions == []:
+        item.plates, item.scores = [], []
+    else:
+        item.plates, item.scores = get_thread_detector().detect_plates_with_scores(item.frame, regions=item.regions)
+    return item
+
+
+class TrackedDetection:
+    """
+    Detect stage for PlateTracker: the tracker detects and reads in one call
+    and needs its camera's frames in order, so every camera is served by one
+    worker (pinned lanes) and the OCR stage passes its frames through
+    """
+
+    def __init__(self, tracker):
+        """
+        Args:
+            tracker: PlateTracker, or {camera: PlateTracker} for several cameras;
+                trackers that can run at the same time need their own detector
+                (PlateDetector.worker_copy)
+        """
+        self.trackers = tracker if isinstance(tracker, dict) else None
+        self.tracker = None if self.trackers is not None else tracker
+
+    def __call__(self, item: PlateFrame) -> PlateFrame:
+        tracker = self.trackers.get(item.camera) if self.trackers is not None else self.tracker
+        if item.regions == []:
+            item.results = []
+        elif tracker is None:
+            # Camera without a tracker: the OCR stage reads what is detected here
+            detect_frame(item)
+        else:
+            item.results = tracker.detect_and_read_plates(item.frame)
+        return item
+
+    def get_statistics(self) -> dict:
+        trackers = self.trackers.values() if self.trackers is not None else [self.tracker]
+        return {'active_tracks': sum(len(tracker.tracks) for tracker in trackers)}
+
+
+def read_frame(item: PlateFrame) -> PlateFrame:
+    """OCR stage: read the detected plates (frames the tracker already read pass through)"""
+    if item.results is None:
+        if item.regions == []:
+            item.results = []
+        else:
+            item.results = get_plate_detector().read_detected_plates(item.frame, item.plates, item.scores,
+                                                                     item.camera)
+    return item
+
+
+def log_plate_results(results: List[Dict], camera: str) -> bool:
+    """
+    Log the first plate of a frame with valid OCR text to the detection log
+
+    Returns:
+        True when a plate was logged (the logger rate-limits repeats)
+    """
+    from app.services.detection_logger import detection_logger
+
+    for plate_info in results:
+        coordinates = plate_info['coordinates']
+        plate_text = plate_info.get('text')
+        confidence = plate_info.get('confidence', 0.0)
+
+        # Only log plates with valid OCR text
+        if plate_info.get('valid', False) and plate_text:
+            logged = detection_logger.log_detection(
+                plate_text=plate_text,
+                confidence=confidence,
+                location=camera,
+                coordinates=coordinates
+            )
+            if logged:
+                print(f"🔤 Logged plate with OCR: '{plate_text}' (conf: {confidence:.2f})")
+            return logged  # Only process the first valid plate per frame
+        elif coordinates:
+            x, y, w, h = coordinates
+            print(f"🔍 Plate detected at ({x},{y}) but OCR failed - skipped")
+    return False
+
+
+class PlateSink:
+    """Last stage: log valid plates, draw the results and hand the frame to the display"""
+
+    def __init__(self, on_frame: Optional[Callable[[PlateFrame, np.ndarray], None]] = None,
+                 on_logged: Optional[Callable[[], None]] = None, log: bool = True, draw: bool = True):
+        """
+        Args:
+            on_frame: Called with (frame, display image) for every frame newer than the last one shown
+            on_logged: Called after a plate was logged
+            log: Write valid plates to the detection log
+            draw: Draw boxes and text on a copy of the frame for on_frame
+        """
+        self.on_frame = on_frame
+        self.on_logged = on_logged
+        self.log = log
+        self.draw = draw
+        self.lock = threading.Lock()
+        self.last_frame_ids: Dict[str, int] = {}  # Frame ids count per camera
+
+        # Statistics
+        self.frames = 0
+        self.stale_frames = 0
+        self.plates_logged = 0
+        self.latency_seconds = 0.0
+        self.cameras: Dict[str, dict] = {}
+
+    def __call__(self, item: PlateFrame) -> None:
+        camera = self._camera_stats(item.camera)
+        if self.log and item.results and log_plate_results(item.results, item.camera):
+            with self.lock:
+                self.plates_logged += 1
+                camera['plates_logged'] += 1
+            if self.on_logged:
+                self.on_logged()
+
+        # With several detect/OCR workers frames can finish out of order; never show an older one
+        now = time.perf_counter()
+        with self.lock:
+            if item.frame_id < self.last_frame_ids.get(item.camera, 0):
+                self.stale_frames += 1
+                camera['stale_frames'] += 1
+                return None
+            self.last_frame_ids[item.camera] = item.frame_id
+            self.frames += 1
+            self.latency_seconds += now - item.captured_at
+            camera['frames'] += 1
+            camera['latency_seconds'] += now - item.captured_at
+            camera['completions'].append(now)
+
+        if self.on_frame:
+            display_frame = item.frame
+            if self.draw and item.results:
+                display_frame = get_plate_detector().draw_plates_with_text(item.frame, item.results)
+            self.on_frame(item, display_frame)
+        return None
+
+    def _camera_stats(self, camera: str) -> dict:
+        with self.lock:
+            if camera not in self.cameras:
+                self.cameras[camera] = {'frames': 0, 'stale_frames': 0, 'plates_logged': 0, 'latency_seconds': 0.0,
+                                        'completions': collections.deque(maxlen=THROUGHPUT_WINDOW)}
+            return self.cameras[camera]
+
+    def get_camera_statistics(self) -> Dict[str, dict]:
+        """Frames shown, fps, latency, stale frames and plates logged per camera"""
+        stats = {}
+        with self.lock:
+            for name, camera in self.cameras.items():
+                completions = list(camera['completions'])
+                span = completions[-1] - completions[0] if len(completions) > 1 else 0.0
+                stats[name] = {
+                    'frames': camera['frames'],
+                    'fps': round((len(completions) - 1) / span, 1) if span > 0 else 0.0,
+                    'latency_ms': round(camera['latency_seconds'] / camera['frames'] * 1000, 1)
+                    if camera['frames'] else 0.0,
+                    'stale_frames': camera['stale_frames'],
+                    'plates_logged': camera['plates_logged']
+                }
+        return stats
+
+    def get_statistics(self) -> dict:
+        return {
+            'plates_logged': self.plates_logged,
+            'stale_frames': self.stale_frames,
+            'latency_ms': round(self.latency_seconds / self.frames * 1000, 1) if self.frames else 0.0
+        }
+
+
+def build_plate_pipeline(source: Union[Callable[[], Optional[PlateFrame]], List[Callable[[], Optional[PlateFrame]]]],
+                         on_frame: Optional[Callable[[PlateFrame, np.ndarray], None]] = None,
+                         on_logged: Optional[Callable[[], None]] = None, tracker=None,
+                         detect_workers: int = PIPELINE_DETECT_WORKERS, ocr_workers: int = PIPELINE_OCR_WORKERS,
+                         detect_processes: bool = PIPELINE_DETECT_PROCESSES,
+                         queue_size: int = PIPELINE_QUEUE_SIZE, drop_frames: bool = True,
+                         log: bool = True, draw: bool = True, max_fps: Optional[float] = None) -> Pipeline:
+    """
+    Capture → detect → OCR → sink pipeline for license plates
+
+    Args:
+        source: Returns PlateFrames (e.g. CameraSource), None at end of stream;
+            a list of sources (one per camera) shares the detect and OCR workers,
+            which take the cameras' frames in turn
+        on_frame, on_logged: See PlateSink
+        tracker: Optional PlateTracker ({camera: PlateTracker} for several
+            cameras); it detects and reads in the detect stage (threads only,
+            each camera on one of up to detect_workers workers)
+        detect_workers, ocr_workers: Workers per stage
+        detect_processes: Detect in worker processes instead of threads
+        queue_size: Frames waiting in front of each stage (per camera for detect and OCR)
+        drop_frames: Drop the oldest waiting frame when a queue is full (live
+            cameras); False = every frame is processed (recorded footage)
+        log: Write valid plates to the detection log
+        draw: Draw the plates on a full-size copy for on_frame; False = on_frame
+            gets the frame as captured and draws itself (e.g. CameraPreview)
+        max_fps: Cap on frames taken from each source
+    """
+    # Several cameras: one lane per camera so a busy lane cannot starve or drop the others' frames
+    multi_camera = isinstance(source, (list, tuple)) and len(source) > 1
+    frame_queue = (lambda: FairFrameQueue(queue_size, drop_frames)) if multi_camera else \
+        (lambda: FrameQueue(queue_size, drop_frames))
+
+    if tracker is not None:
+        # A tracker needs its camera's frames in order: each camera stays on one worker
+        workers = min(detect_workers, len(tracker)) if multi_camera and isinstance(tracker, dict) else 1
+        if detect_workers > workers or detect_processes:
+            print(f"⚠️ Plate tracker needs frames in order - detect stage uses {workers} thread(s), "
+                  f"one per camera at most")
+        detect = PipelineStage("detect", TrackedDetection(tracker), workers, queue=frame_queue(),
+                               pin_lanes=workers > 1)
+    else:
+        detect = PipelineStage("detect", detect_frame, detect_workers, processes=detect_processes,
+                               process_initializer=_init_detect_worker, queue=frame_queue())
+    stages = [
+        detect,
+        PipelineStage("ocr", read_frame, ocr_workers, queue=frame_queue()),
+        # Results queue: keep every read frame so no plate is dropped before it is logged
+        PipelineStage("sink", PlateSink(on_frame, on_logged, log, draw), 1, queue_size, drop_oldest=False)
+    ]
+    return Pipeline(source, stages, max_fps)
+
+
+if __name__ == "__main__":
+    import argparse
+    from app.services.plate.motion import get_motion_gate
+    from app.services.plate.tracker import PlateTracker, PlateTrackerSettings
+    from app.services.detection_logger import start_detection_logging, stop_detection_logging
+    from app.services.frame_sources import open_frame_source
+    from app.utils.config import MOTION_GATE_ENABLED, PLATE_TRACKING_ENABLED, PLATE_TRACKER_SETTINGS
+
+    parser = argparse.ArgumentParser(description="Run the license plate camera pipeline without the UI")
+    parser.add_argument("--source", default="0",
+                        help="Camera index, stream URL, video file, image directory or synthetic[:FPS]")
+    parser.add_argument("--camera", default="Camera", help="Camera location for the detection log")
+    parser.add_argument("--duration", type=float, default=None, help="Stop after this many seconds")
+    parser.add_argument("--detect-workers", type=int, default=PIPELINE_DETECT_WORKERS)
+    parser.add_argument("--ocr-workers", type=int, default=PIPELINE_OCR_WORKERS)
+    parser.add_argument("--detect-processes", action="store_true", default=PIPELINE_DETECT_PROCESSES)
+    parser.add_argument("--queue-size", type=int, default=PIPELINE_QUEUE_SIZE)
+    parser.add_argument("--no-drop", action="store_true", help="Process every frame (recorded footage)")
+    parser.add_argument("--max-fps", type=float, default=None)
+    parser.add_argument("--no-log", action="store_true", help="Do not write plates to the detection log")
+    parser.add_argument("--stats-every", type=float, default=5.0, help="Seconds between statistics lines")
+    args = parser.parse_args()
+
+    capture = open_frame_source(args.source, args.camera)
+    if not capture.isOpened():
+        print(f"❌ Cannot open source: {args.source}")
+        raise SystemExit(1)
+
+    detector = get_plate_detector()
+    tracker = PlateTracker(detector, PlateTrackerSettings(**PLATE_TRACKER_SETTINGS), camera=args.camera) \
+        if PLATE_TRACKING_ENABLED else None
+    source = CameraSource(capture, args.camera, motion_gate=get_motion_gate(args.camera) if MOTION_GATE_ENABLED else None)
+    pipeline = build_plate_pipeline(source, tracker=tracker, detect_workers=args.detect_workers,
+                                    ocr_workers=args.ocr_workers, detect_processes=args.detect_processes,
+                                    queue_size=args.queue_size, drop_frames=not args.no_drop,
+                                    log=not args.no_log, max_fps=args.max_fps)
+
+    if not args.no_log:
+        start_detection_logging()
+    started = time.perf_counter()
+    pipeline.start()
+    try:
+        while pipeline.is_alive():
+            pipeline.join(args.stats_every)
+            print(f"📊 {pipeline.format_statistics()}")
+            if args.duration is not None and time.perf_counter() - started >= args.duration:
+                break
+    except KeyboardInterrupt:
+        pass
+    finally:
+        pipeline.stop()
+        pipeline.join(5.0)
+        capture.release()
+        if not args.no_log:
+            stop_detection_logging()
+    print(f"✅ Pipeline finished: {pipeline.format_statistics()}")
@@ -0,0 +1,125 @@
+"""
+Batch License Plate Detection
+Fans frames out to a pool of worker processes (each with its own cascades and
+OCR reader) so back-filling recorded footage is not limited by the GIL of the
+UI process. Results come back in input order.
+"""
+
+import os
+import itertools
+import cv2
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import List, Tuple, Dict, Iterable, Iterator, Optional
+from app.utils.config import BATCH_DETECTION_WORKERS, BATCH_DETECTION_CHUNK_SIZE
+
+
+def _init_worker():
+    """Load the cascades once per worker process (the OCR reader loads on a worker's first read)"""
+    # One OpenCV thread per process; the pool provides the parallelism
+    cv2.setNumThreads(1)
+    from app.services.plate.detector import get_plate_detector
+    get_plate_detector()
+
+
+def _detect_worker(frame: np.ndarray, model_name: str = None) -> List[Tuple[int, int, int, int]]:
+    from app.services.plate.detector import get_plate_detector
+    return get_plate_detector().detect_plates(frame, model_name)
+
+
+def _detect_and_read_worker(frame: np.ndarray, model_name: str = None) -> List[Dict]:
+    from app.services.plate.detector import get_plate_detector
+    return get_plate_detector().detect_and_read_plates(frame, model_name)
+
+
+class BatchPlateDetector:
+    """Process-pool batch detection over many frames"""
+
+    def __init__(self, workers: Optional[int] = None, chunk_size: Optional[int] = None,
+                 mp_context=None):
+        """
+        Args:
+            workers: Worker processes (None = BATCH_DETECTION_WORKERS or CPU count)
+            chunk_size: Frames sent to a worker per task (None = BATCH_DETECTION_CHUNK_SIZE)
+            mp_context: Optional multiprocessing context (e.g. 'spawn')
+        """
+        self.workers = workers or BATCH_DETECTION_WORKERS or os.cpu_count() or 1
+        self.chunk_size = chunk_size or BATCH_DETECTION_CHUNK_SIZE
+        self.mp_context = mp_context
+        self.executor = None
+
+        # Statistics
+        self.frames_processed = 0
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=self.mp_context,
+                initializer=_init_worker
+            )
+        return self.executor
+
+    def _map(self, worker, frames: Iterable[np.ndarray]) -> Iterator:
+        """Map frames through the pool in bounded windows, preserving input order"""
+        executor = self._get_executor()
+        # Keep only a few chunks per worker in flight so long videos stay in bounded memory
+        window_size = self.workers * self.chunk_size * 2
+        frames = iter(frames)
+
+        while True:
+            window = list(itertools.islice(frames, window_size))
+            if not window:
+                break
+            for result in executor.map(worker, window, chunksize=self.chunk_size):
+                self.frames_processed += 1
+                yield result
+
+    def iter_detect_plates(self, frames: Iterable[np.ndarray],
+                           model_name: str = None) -> Iterator[List[Tuple[int, int, int, int]]]:
+        """Streaming version of detect_plates_batch"""
+        return self._map(partial(_detect_worker, model_name=model_name), frames)
+
+    def iter_detect_and_read(self, frames: Iterable[np.ndarray],
+                             model_name: str = None) -> Iterator[List[Dict]]:
+        """Streaming version of detect_and_read_batch"""
+        return self._map(partial(_detect_and_read_worker, model_name=model_name), frames)
+
+    def detect_plates_batch(self, frames: Iterable[np.ndarray],
+                            model_name: str = None) -> List[List[Tuple[int, int, int, int]]]:
+        """Detect plates in every frame; one result list per frame, in input order"""
+        return list(self.iter_detect_plates(frames, model_name))
+
+    def detect_and_read_batch(self, frames: Iterable[np.ndarray],
+                              model_name: str = None) -> List[List[Dict]]:
+        """Detect and OCR plates in every frame; one result list per frame, in input order"""
+        return list(self.iter_detect_and_read(frames, model_name))
+
+    def close(self):
+        """Shut down the worker processes"""
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+            self.executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def detect_plates_batch(frames: Iterable[np.ndarray], model_name: str = None,
+                        workers: Optional[int] = None,
+                        chunk_size: Optional[int] = None) -> List[List[Tuple[int, int, int, int]]]:
+    """Convenience function for batch plate detection with a temporary worker pool"""
+    with BatchPlateDetector(workers, chunk_size) as batch_detector:
+        return batch_detector.detect_plates_batch(frames, model_name)
+
+
+def detect_and_read_batch(frames: Iterable[np.ndarray], model_name: str = None,
+                          workers: Optional[int] = None,
+                          chunk_size: Optional[int] = None) -> List[List[Dict]]:
+    """Convenience function for batch plate detection + OCR with a temporary worker pool"""
+    with BatchPlateDetector(workers, chunk_size) as batch_detector:
+        return batch_detector.detect_and_read_batch(frames, model_name)
@@ -0,0 +1,119 @@
+"""
+Per-Frame OCR Budget
+Caps the OCR time spent on one frame so a crowded frame does not hold up
+the display for seconds. Plates are read in priority order (new plates,
+then the highest detector score, then the largest crop); the ones that do
+not fit are deferred to the next frame, where they are still new
+"""
+
+import threading
+import time
+import numpy as np
+from typing import Dict, List, Optional, Sequence, Tuple
+from app.services.plate.nms import iou_matrix
+
+# A plate overlapping an already-read plate of the previous frame by at least this much is not new
+SAME_PLATE_IOU = 0.3
+
+
+class OCRBudget:
+    """OCR time budget for each frame"""
+
+    def __init__(self, budget_ms: float, smoothing: float = 0.3):
+        """
+        Args:
+            budget_ms: OCR time allowed per frame
+            smoothing: Weight of the newest frame in the per-plate time estimate
+        """
+        self.budget = budget_ms / 1000.0
+        self.smoothing = smoothing
+        self.plate_seconds = None  # Estimated OCR wall time per plate
+        self.read_boxes: Dict[Optional[str], List[Tuple[int, int, int, int]]] = {}
+        self.lock = threading.Lock()  # OCR workers of every camera share the budget
+
+        # Statistics
+        self.frames = 0
+        self.plates_read = 0
+        self.plates_deferred = 0
+        self.overruns = 0
+        self.overrun_seconds = 0.0
+        self.max_overrun_seconds = 0.0
+
+    def mark_new(self, camera: Optional[str], boxes: Sequence[Tuple[int, int, int, int]]) -> List[bool]:
+        """Flag the plates that have not been read since they came into view on this camera"""
+        with self.lock:
+            previous = self.read_boxes.get(camera)
+        if not previous or not boxes:
+            return [True] * len(boxes)
+
+        ious = iou_matrix(np.array(list(boxes) + previous))[:len(boxes), len(boxes):]
+        return [bool(best < SAME_PLATE_IOU) for best in ious.max(axis=1)]
+
+    def remember_reads(self, camera: Optional[str], boxes: Sequence[Tuple[int, int, int, int]]):
+        """Store this frame's plates that have been read (now or earlier) for the next mark_new()"""
+        with self.lock:
+            self.read_boxes[camera] = [tuple(box) for box in boxes]
+
+    def order(self, boxes: Sequence[Tuple[int, int, int, int]], scores: Sequence[Optional[float]],
+              new_plates: Sequence[bool]) -> List[int]:
+        """Plate indices by priority: new plates, then highest score, then largest crop"""
+        return sorted(range(len(boxes)),
+                      key=lambda i: (not new_plates[i], -(scores[i] or 0.0), -boxes[i][2] * boxes[i][3]))
+
+    def affordable(self, count: int) -> int:
+        """Plates that fit the budget when they are all submitted at once (batcher / process pool)"""
+        with self.lock:
+            plate_seconds = self.plate_seconds
+        if plate_seconds is None or plate_seconds <= 0:
+            return count
+        return min(count, max(1, int(self.budget / plate_seconds)))
+
+    def has_time(self, start: float, reads: int) -> bool:
+        """Whether one more plate fits when reading one at a time (the first always does)"""
+        if reads == 0:
+            return True
+        with self.lock:
+            plate_seconds = self.plate_seconds or 0.0
+        return time.perf_counter() - start + plate_seconds <= self.budget
+
+    def finish_frame(self, start: float, read: int, deferred: int, ocr_calls: Optional[int] = None):
+        """
+        Count one frame's reads and update the per-plate estimate
+
+        Args:
+            ocr_calls: Reads that ran the OCR (default: all of them); cache hits
+                cost next to nothing, so only OCR calls feed the estimate
+        """
+        elapsed = time.perf_counter() - start
+        ocr_calls = read if ocr_calls is None else ocr_calls
+        with self.lock:
+            self.frames += 1
+            self.plates_read += read
+            self.plates_deferred += deferred
+
+            if ocr_calls > 0:
+                per_plate = elapsed / ocr_calls
+                if self.plate_seconds is None:
+                    self.plate_seconds = per_plate
+                else:
+                    self.plate_seconds = self.smoothing * per_plate + (1 - self.smoothing) * self.plate_seconds
+
+            if elapsed > self.budget:
+                overrun = elapsed - self.budget
+                self.overruns += 1
+                self.overrun_seconds += overrun
+                self.max_overrun_seconds = max(self.max_overrun_seconds, overrun)
+
+    def get_statistics(self) -> dict:
+        """Get OCR budget statistics"""
+        with self.lock:
+            return {
+                'budget_ms': round(self.budget * 1000, 1),
+                'frames': self.frames,
+                'plates_read': self.plates_read,
+                'plates_deferred': self.plates_deferred,
+                'budget_overruns': self.overruns,
+                'avg_overrun_ms': round(self.overrun_seconds / self.overruns * 1000, 1) if self.overruns else 0.0,
+                'max_overrun_ms': round(self.max_overrun_seconds * 1000, 1),
+                'estimated_plate_ms': round(self.plate_seconds * 1000, 1) if self.plate_seconds else None
+            }
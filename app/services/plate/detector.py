@@ -2,15 +2,74 @@ import cv2
 import numpy as np
 from typing import List, Tuple, Optional, Dict
 import os
-from app.services.ocr_service import extract_plate_text, is_ocr_available
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, Future
+from app.services.ocr_service import extract_plate_text, is_ocr_available, get_ocr_service
+from app.services.plate.pyramid import SharedPyramidEngine
+from app.services.plate.nms import nms_indices
+from app.services.plate.tiling import compute_tiles, touches_inner_edge
+from app.services.plate.bordered import find_bordered_plates
+from app.services.plate.quality import CropQualityGate, CropQualitySettings
+from app.services.plate.budget import OCRBudget
+from app.utils.config import (TILED_DETECTION_ENABLED, TILE_SIZE, TILE_OVERLAP, TILE_WORKERS,
+                              MIN_PLATE_SCORE, BORDERED_EDGE_MAX_WIDTH, OCR_BATCHING_ENABLED,
+                              CROP_QUALITY_GATE_ENABLED, CROP_QUALITY_SETTINGS,
+                              OCR_FRAME_BUDGET_ENABLED, OCR_FRAME_BUDGET_MS)
+
+# Score given to contour-based bordered plates, which have no cascade level weight
+BORDERED_PLATE_SCORE = 0.5
+
+def level_weight_to_score(level_weight: float) -> float:
+    """Map a cascade level weight (final stage sum, unbounded) to a 0-1 plate score"""
+    return float(1.0 / (1.0 + np.exp(-level_weight)))
 
 class PlateDetector:
     """License plate detector using multiple haarcascade models"""
     
-    def __init__(self):
+    def __init__(self, use_shared_pyramid: bool = True, use_tiling: bool = TILED_DETECTION_ENABLED):
         self.models_path = "app/models/"
         self.cascade_models = {}
         self._load_cascade_models()
+        
+        # Evaluate every cascade/parameter set on one pyramid per frame
+        self.use_shared_pyramid = use_shared_pyramid
+        self.pyramid_engine = SharedPyramidEngine(
+            self.cascade_models,
+            {name: self._get_parameter_sets(name) for name in self.cascade_models}
+        )
+        
+        # Tiled mode for frames larger than one tile
+        self.use_tiling = use_tiling
+        self.tile_size = TILE_SIZE
+        self.tile_overlap = TILE_OVERLAP
+        self.tile_workers = TILE_WORKERS or os.cpu_count() or 1
+        self._tile_executor = None
+        self._tile_local = threading.local()
+        
+        # Downscaled edge pass for the bordered-plate search on wide frames
+        self.bordered_edge_max_width = BORDERED_EDGE_MAX_WIDTH
+        
+        # Skip blurry / tiny / flat plate crops before OCR (None = read every plate)
+        self.quality_gate = None
+        if CROP_QUALITY_GATE_ENABLED:
+            self.quality_gate = CropQualityGate(CropQualitySettings(**CROP_QUALITY_SETTINGS))
+        
+        # Per-frame OCR time budget; plates over it wait for the next frame (None = read every plate)
+        self.ocr_budget = None
+        if OCR_FRAME_BUDGET_ENABLED:
+            self.ocr_budget = OCRBudget(OCR_FRAME_BUDGET_MS)
+    
+    def worker_copy(self) -> 'PlateDetector':
+        """
+        Detector with its own cascades for another thread (CascadeClassifier
+        is not thread-safe) that shares this one's crop quality gate and OCR
+        budget, so their statistics stay in one place
+        """
+        detector = PlateDetector(use_shared_pyramid=self.use_shared_pyramid, use_tiling=self.use_tiling)
+        detector.quality_gate = self.quality_gate
+        detector.ocr_budget = self.ocr_budget
+        return detector
     
     def _load_cascade_models(self):
         """Load all available license plate cascade models"""
@@ -40,20 +99,44 @@ class PlateDetector:
         else:
             print(f"✅ Total {len(self.cascade_models)} plate detection models loaded")
     
-    def detect_plates(self, frame: np.ndarray, model_name: str = None) -> List[Tuple[int, int, int, int]]:
+    def detect_plates(self, frame: np.ndarray, model_name: str = None,
+                      regions: Optional[List[Tuple[int, int, int, int]]] = None) -> List[Tuple[int, int, int, int]]:
         """
         Detect license plates in frame
         
         Args:
             frame: Input image/frame
             model_name: Specific model to use (None = use all models)
+            regions: Only search inside these (x, y, w, h) regions, e.g. from
+                a MotionGate (None = whole frame, [] = skip detection)
             
         Returns:
             List of (x, y, w, h) tuples representing detected plates
         """
+        return self.detect_plates_with_scores(frame, model_name, regions)[0]
+    
+    def detect_plates_with_scores(self, frame: np.ndarray, model_name: str = None,
+                                  regions: Optional[List[Tuple[int, int, int, int]]] = None
+                                  ) -> Tuple[List[Tuple[int, int, int, int]], List[float]]:
+        """
+        Detect license plates in frame, with a 0-1 score per plate
+        
+        Scores come from the cascade level weights (detectMultiScale3
+        outputRejectLevels); bordered plates get BORDERED_PLATE_SCORE.
+        Overlapping boxes are suppressed in score order.
+        
+        Returns:
+            (plates, scores) with plates as (x, y, w, h) tuples
+        """
         if len(self.cascade_models) == 0:
             print("⚠️ No cascade models available for plate detection")
-            return []
+            return [], []
+        
+        if regions is not None:
+            return self._detect_in_regions(frame, regions, model_name)
+        
+        if self.use_tiling and (frame.shape[1] > self.tile_size[0] or frame.shape[0] > self.tile_size[1]):
+            return self._detect_tiled_with_scores(frame, model_name)
         
         # Convert to grayscale if needed
         if len(frame.shape) == 3:
@@ -62,148 +145,234 @@ class PlateDetector:
             gray = frame
         
         all_plates = []
+        all_scores = []
         
-        # Use specific model if requested
+        # Use specific model if requested, otherwise all available models
         if model_name and model_name in self.cascade_models:
-            plates = self._detect_with_model(gray, self.cascade_models[model_name], model_name)
+            model_names = [model_name]
+        else:
+            model_names = list(self.cascade_models.keys())
+        
+        if self.use_shared_pyramid:
+            # One shared pyramid for every model and parameter set
+            plates, scores = self._detect_with_shared_pyramid(gray, model_names)
             all_plates.extend(plates)
+            all_scores.extend(scores)
         else:
-            # Use all available models and combine results
-            for name, cascade in self.cascade_models.items():
-                plates = self._detect_with_model(gray, cascade, name)
+            for name in model_names:
+                plates, scores = self._detect_with_model(gray, self.cascade_models[name], name)
                 all_plates.extend(plates)
-        
-        # Remove duplicate detections
-        filtered_plates = self._filter_overlapping_plates(all_plates)
+                all_scores.extend(scores)
         
         # Add additional detection for modern bordered plates
         bordered_plates = self._detect_bordered_plates(gray)
         all_plates.extend(bordered_plates)
+        all_scores.extend([BORDERED_PLATE_SCORE] * len(bordered_plates))
         
         # Final filtering with all detections
-        filtered_plates = self._filter_overlapping_plates(all_plates)
+        return self._filter_scored_plates(all_plates, all_scores)
+    
+    def _detect_in_regions(self, frame: np.ndarray, regions: List[Tuple[int, int, int, int]],
+                           model_name: str = None) -> Tuple[List[Tuple[int, int, int, int]], List[float]]:
+        """Run full detection inside each region and map boxes back to frame coordinates"""
+        all_plates = []
+        all_scores = []
         
-        return filtered_plates
+        for (rx, ry, rw, rh) in regions:
+            roi = frame[ry:ry + rh, rx:rx + rw]
+            if roi.size == 0:
+                continue
+            
+            plates, scores = self.detect_plates_with_scores(roi, model_name)
+            all_plates.extend((x + rx, y + ry, w, h) for (x, y, w, h) in plates)
+            all_scores.extend(scores)
+        
+        # Regions can overlap at their padded edges
+        return self._filter_scored_plates(all_plates, all_scores)
+    
+    def detect_plates_tiled(self, frame: np.ndarray, model_name: str = None) -> List[Tuple[int, int, int, int]]:
+        """
+        Detect plates at full resolution by splitting the frame into overlapping tiles
+        
+        Each tile runs the cascade and bordered-plate passes on a thread pool;
+        partial plates cut by a tile seam are dropped (the overlapping tile
+        sees them whole) and the remaining boxes are merged with NMS.
+        """
+        return self._detect_tiled_with_scores(frame, model_name)[0]
+    
+    def _detect_tiled_with_scores(self, frame: np.ndarray,
+                                  model_name: str = None) -> Tuple[List[Tuple[int, int, int, int]], List[float]]:
+        """Tiled detection returning (plates, scores)"""
+        height, width = frame.shape[:2]
+        tiles = compute_tiles(width, height, self.tile_size, self.tile_overlap)
+        
+        if self._tile_executor is None:
+            self._tile_executor = ThreadPoolExecutor(max_workers=self.tile_workers)
+        
+        futures = [
+            self._tile_executor.submit(self._detect_tile, frame, tile, model_name)
+            for tile in tiles
+        ]
+        
+        all_plates = []
+        all_scores = []
+        for future in futures:
+            plates, scores = future.result()
+            all_plates.extend(plates)
+            all_scores.extend(scores)
+        
+        return self._filter_scored_plates(all_plates, all_scores)
+    
+    def _detect_tile(self, frame: np.ndarray, tile: Tuple[int, int, int, int],
+                     model_name: str = None) -> Tuple[List[Tuple[int, int, int, int]], List[float]]:
+        """Detect plates in one tile (runs on a tile worker thread)"""
+        # CascadeClassifier is not thread-safe, so each worker thread gets its own detector
+        detector = getattr(self._tile_local, 'detector', None)
+        if detector is None:
+            detector = PlateDetector(use_shared_pyramid=self.use_shared_pyramid, use_tiling=False)
+            self._tile_local.detector = detector
+        
+        tile_x, tile_y, tile_w, tile_h = tile
+        tile_frame = frame[tile_y:tile_y + tile_h, tile_x:tile_x + tile_w]
+        frame_size = (frame.shape[1], frame.shape[0])
+        
+        plates, scores = [], []
+        for (x, y, w, h), score in zip(*detector.detect_plates_with_scores(tile_frame, model_name)):
+            if not touches_inner_edge((x, y, w, h), tile, frame_size):
+                plates.append((x + tile_x, y + tile_y, w, h))
+                scores.append(score)
+        return plates, scores
+    
+    def _get_parameter_sets(self, model_name: str) -> List[Dict]:
+        """Get detectMultiScale parameter sets for a cascade model"""
+        if "russian" in model_name:
+            # Multiple parameter sets for Russian models
+            return [
+                # Standard parameters
+                {
+                    'scaleFactor': 1.1,
+                    'minNeighbors': 4,
+                    'minSize': (50, 15),
+                    'maxSize': (300, 100)
+                },
+                # More sensitive for modern plates with borders
+                {
+                    'scaleFactor': 1.05,
+                    'minNeighbors': 3,
+                    'minSize': (80, 25),  # Larger minimum for bordered plates
+                    'maxSize': (350, 120)
+                },
+                # Even more sensitive
+                {
+                    'scaleFactor': 1.08,
+                    'minNeighbors': 2,
+                    'minSize': (60, 20),
+                    'maxSize': (400, 150)
+                }
+            ]
+        
+        # Default parameter sets
+        return [
+            {
+                'scaleFactor': 1.2,
+                'minNeighbors': 3,
+                'minSize': (40, 15),
+                'maxSize': (400, 120)
+            }
+        ]
     
     def _detect_with_model(self, gray_frame: np.ndarray, cascade: cv2.CascadeClassifier, 
-                          model_name: str) -> List[Tuple[int, int, int, int]]:
-        """Detect plates using a specific cascade model"""
+                          model_name: str) -> Tuple[List[Tuple[int, int, int, int]], List[float]]:
+        """Detect plates using a specific cascade model (one pyramid per parameter set)"""
         try:
             # Try multiple parameter sets for better detection of modern plates
-            parameter_sets = []
-            
-            if "russian" in model_name:
-                # Multiple parameter sets for Russian models
-                parameter_sets = [
-                    # Standard parameters
-                    {
-                        'scaleFactor': 1.1,
-                        'minNeighbors': 4,
-                        'minSize': (50, 15),
-                        'maxSize': (300, 100)
-                    },
-                    # More sensitive for modern plates with borders
-                    {
-                        'scaleFactor': 1.05,
-                        'minNeighbors': 3,
-                        'minSize': (80, 25),  # Larger minimum for bordered plates
-                        'maxSize': (350, 120)
-                    },
-                    # Even more sensitive
-                    {
-                        'scaleFactor': 1.08,
-                        'minNeighbors': 2,
-                        'minSize': (60, 20),
-                        'maxSize': (400, 150)
-                    }
-                ]
-            else:
-                # Default parameter sets
-                parameter_sets = [
-                    {
-                        'scaleFactor': 1.2,
-                        'minNeighbors': 3,
-                        'minSize': (40, 15),
-                        'maxSize': (400, 120)
-                    }
-                ]
+            parameter_sets = self._get_parameter_sets(model_name)
             
             all_detections = []
+            all_weights = []
             
             # Try each parameter set
             for params in parameter_sets:
-                plates = cascade.detectMultiScale(
+                plates, _, level_weights = cascade.detectMultiScale3(
                     gray_frame,
                     scaleFactor=params['scaleFactor'],
                     minNeighbors=params['minNeighbors'],
                     minSize=params['minSize'],
                     maxSize=params['maxSize'],
-                    flags=cv2.CASCADE_SCALE_IMAGE
+                    flags=cv2.CASCADE_SCALE_IMAGE,
+                    outputRejectLevels=True
                 )
                 all_detections.extend(plates)
+                all_weights.extend(np.ravel(level_weights))
             
-            # Remove duplicates from multiple parameter sets
-            if all_detections:
-                # Convert to list of tuples for consistency
-                plates = self._filter_overlapping_plates(
-                    [(int(x), int(y), int(w), int(h)) for x, y, w, h in all_detections],
-                    overlap_threshold=0.5
-                )
-            else:
-                plates = []
-            
-            # Add model name info to each detection
-            plates_with_info = []
-            for (x, y, w, h) in plates:
-                plates_with_info.append((x, y, w, h))
-            
-            if len(plates) > 0:
-                print(f"🔍 {model_name}: Found {len(plates)} potential plates")
-            
-            return plates_with_info
+            return self._merge_model_detections(all_detections, model_name, all_weights)
             
         except Exception as e:
             print(f"❌ Error detecting with {model_name}: {e}")
-            return []
+            return [], []
     
-    def _filter_overlapping_plates(self, plates: List[Tuple[int, int, int, int]], 
-                                 overlap_threshold: float = 0.3) -> List[Tuple[int, int, int, int]]:
-        """Remove overlapping detections using Non-Maximum Suppression"""
-        if len(plates) <= 1:
-            return plates
+    def _detect_with_shared_pyramid(self, gray_frame: np.ndarray, 
+                                    model_names: List[str]) -> Tuple[List[Tuple[int, int, int, int]], List[float]]:
+        """Detect plates with every requested model over one shared image pyramid"""
+        try:
+            detections = self.pyramid_engine.detect_with_scores(gray_frame, model_names)
+        except Exception as e:
+            print(f"❌ Error in shared pyramid detection: {e}")
+            return [], []
         
-        # Convert to numpy array for easier manipulation
-        boxes = np.array(plates)
+        plates = []
+        scores = []
+        for name in model_names:
+            boxes, weights = detections.get(name, ([], []))
+            model_plates, model_scores = self._merge_model_detections(boxes, name, weights)
+            plates.extend(model_plates)
+            scores.extend(model_scores)
+        return plates, scores
+    
+    def _merge_model_detections(self, detections, model_name: str,
+                                level_weights) -> Tuple[List[Tuple[int, int, int, int]], List[float]]:
+        """Remove duplicates produced by a model's multiple parameter sets"""
+        if len(detections) > 0:
+            # Convert to list of tuples for consistency
+            plates, scores = self._filter_scored_plates(
+                [(int(x), int(y), int(w), int(h)) for x, y, w, h in detections],
+                [level_weight_to_score(weight) for weight in level_weights],
+                overlap_threshold=0.5
+            )
+        else:
+            plates, scores = [], []
         
-        # Calculate areas
-        areas = boxes[:, 2] * boxes[:, 3]
+        if len(plates) > 0:
+            print(f"🔍 {model_name}: Found {len(plates)} potential plates")
         
-        # Sort by confidence (we'll use area as a proxy)
-        indices = np.argsort(areas)[::-1]
+        return plates, scores
+    
+    def _filter_overlapping_plates(self, plates: List[Tuple[int, int, int, int]], 
+                                 overlap_threshold: float = 0.3,
+                                 scores: Optional[List[float]] = None) -> List[Tuple[int, int, int, int]]:
+        """
+        Remove overlapping detections using Non-Maximum Suppression
         
-        keep = []
-        while len(indices) > 0:
-            # Pick the detection with largest area
-            current = indices[0]
-            keep.append(current)
-            
-            if len(indices) == 1:
-                break
-            
-            # Calculate IoU with remaining detections
-            remaining = indices[1:]
-            ious = []
-            
-            for idx in remaining:
-                iou = self._calculate_iou(boxes[current], boxes[idx])
-                ious.append(iou)
-            
-            # Keep only detections with IoU below threshold
-            ious = np.array(ious)
-            indices = remaining[ious < overlap_threshold]
+        Args:
+            plates: Detected (x, y, w, h) boxes
+            overlap_threshold: IoU at or above which a box is suppressed
+            scores: Optional per-box confidence (None = use area as a proxy)
+        """
+        if len(plates) <= 1:
+            return plates
         
+        keep = nms_indices(plates, overlap_threshold, scores)
         return [plates[i] for i in keep]
     
+    def _filter_scored_plates(self, plates: List[Tuple[int, int, int, int]], scores: List[float],
+                              overlap_threshold: float = 0.3) -> Tuple[List[Tuple[int, int, int, int]], List[float]]:
+        """Score-ranked NMS that keeps each surviving box's score alongside it"""
+        if len(plates) <= 1:
+            return list(plates), list(scores)
+        
+        keep = nms_indices(plates, overlap_threshold, scores)
+        return [plates[i] for i in keep], [scores[i] for i in keep]
+    
     def _calculate_iou(self, box1: np.ndarray, box2: np.ndarray) -> float:
         """Calculate Intersection over Union of two bounding boxes"""
         x1, y1, w1, h1 = box1
@@ -227,51 +396,187 @@ class PlateDetector:
         
         return intersection / union if union > 0 else 0.0
     
-    def detect_and_read_plates(self, frame: np.ndarray, model_name: str = None) -> List[Dict]:
+    def detect_and_read_plates(self, frame: np.ndarray, model_name: str = None,
+                               regions: Optional[List[Tuple[int, int, int, int]]] = None,
+                               camera: Optional[str] = None) -> List[Dict]:
         """
         Detect license plates and extract text using OCR
         
+        Args:
+            regions: Optional search regions (see detect_plates)
+            camera: Source camera, passed on to OCR preprocessing
+        
+        Plates scoring below MIN_PLATE_SCORE are dropped before OCR. With the
+        crop quality gate enabled, plates whose crop is too blurry, small or
+        flat to read are returned unread instead of going to OCR. With the OCR
+        budget enabled, plates that do not fit this frame's budget are
+        returned unread with 'deferred': True; plates not yet read since
+        they came into view go first.
+        
         Returns:
             List of dictionaries with detection info:
             [{
                 'coordinates': (x, y, w, h),
+                'score': 0.87,
                 'text': 'ABC 123',
                 'confidence': 0.95,
-                'valid': True
+                'valid': True,
+                'deferred': False
             }]
         """
         # First detect plate regions
-        plates = self.detect_plates(frame, model_name)
-        
-        results = []
-        for plate_coords in plates:
-            result = {
-                'coordinates': plate_coords,
-                'text': None,
-                'confidence': 0.0,
-                'valid': False
-            }
-            
-            # Try to extract text using OCR if available
-            if is_ocr_available():
-                try:
-                    text, confidence = extract_plate_text(frame, plate_coords)
-                    if text:
-                        result['text'] = text
-                        result['confidence'] = confidence
-                        result['valid'] = True
-                        print(f"🔤 Plate detected and read: '{text}' (conf: {confidence:.2f})")
-                    else:
-                        print(f"🔍 Plate detected but text unreadable")
-                except Exception as e:
-                    print(f"❌ OCR error: {e}")
+        plates, scores = self.detect_plates_with_scores(frame, model_name, regions)
+        return self.read_detected_plates(frame, plates, scores, camera)
+    
+    def read_detected_plates(self, frame: np.ndarray, plates: List[Tuple[int, int, int, int]],
+                             scores: List[float], camera: Optional[str] = None) -> List[Dict]:
+        """
+        OCR half of detect_and_read_plates, for callers that detect and read
+        on different threads (the camera pipeline)
+        
+        Args:
+            plates, scores: detect_plates_with_scores output for this frame
+        
+        Returns:
+            Same dictionaries as detect_and_read_plates
+        """
+        kept = [(plate_coords, score) for plate_coords, score in zip(plates, scores) if score >= MIN_PLATE_SCORE]
+        if self.quality_gate is None:
+            readable = list(range(len(kept)))
+        else:
+            readable = []
+            for index, (plate_coords, _) in enumerate(kept):
+                quality = self.quality_gate.check(frame, plate_coords)
+                self.quality_gate.record(quality)
+                if quality.passed:
+                    readable.append(index)
+        
+        # Skipped plates are still reported (and drawn), just not read
+        results = [self._unread_result(plate_coords, score) for plate_coords, score in kept]
+        boxes = [kept[index][0] for index in readable]
+        new_plates = self.ocr_budget.mark_new(camera, boxes) if self.ocr_budget is not None else None
+        reads = self.read_plates(frame, boxes, [kept[index][1] for index in readable], camera, new_plates)
+        for index, read in zip(readable, reads):
+            results[index] = read
+        
+        if self.ocr_budget is not None:
+            self.ocr_budget.remember_reads(camera, [box for box, new, read in zip(boxes, new_plates, reads)
+                                                    if not (new and read['deferred'])])
+        return results
+    
+    def read_plates(self, frame: np.ndarray, plates: List[Tuple[int, int, int, int]],
+                    scores: Optional[List[float]] = None, camera: Optional[str] = None,
+                    new_plates: Optional[List[bool]] = None) -> List[Dict]:
+        """
+        Run OCR on several plates of one frame
+        
+        With OCR_BATCHING_ENABLED every crop is queued first so they share
+        recognition passes (with crops from other cameras too); with the OCR
+        process pool every crop is handed to a worker before waiting for any.
+        """
+        return self.read_plate_crops([(frame, plate_coords) for plate_coords in plates], scores, camera, new_plates)
+    
+    def read_plate_crops(self, crops: List[Tuple[np.ndarray, Tuple[int, int, int, int]]],
+                         scores: Optional[List[float]] = None, camera: Optional[str] = None,
+                         new_plates: Optional[List[bool]] = None) -> List[Dict]:
+        """
+        Run OCR on plates that may come from different frames (e.g. the best
+        crop of each tracked plate)
+        
+        With the OCR budget enabled, plates are read in priority order until
+        the frame's budget is spent; the rest come back unread with
+        'deferred': True.
+        
+        Args:
+            crops: (image, plate coordinates within that image) per plate
+            new_plates: Per plate, whether it is new (read first under the OCR budget; default all new)
+        """
+        scores = scores if scores is not None else [None] * len(crops)
+        results = [None] * len(crops)
+        order = list(range(len(crops)))
+        concurrent = bool(crops) and (OCR_BATCHING_ENABLED or get_ocr_service().pool is not None) \
+            and is_ocr_available()
+        
+        budget = self.ocr_budget if crops and is_ocr_available() else None
+        if budget is not None:
+            new_plates = new_plates if new_plates is not None else [True] * len(crops)
+            order = budget.order([plate_coords for _, plate_coords in crops], scores, new_plates)
+            start = time.perf_counter()
+            ocr_reads = get_ocr_service().get_thread_reads()
+        
+        if concurrent:
+            if get_ocr_service().pool is not None:
+                # OCR worker processes read the plates in parallel
+                submit_plate_text = get_ocr_service().submit_text
             else:
-                print(f"⚠️ OCR not available - only detection")
-            
-            results.append(result)
+                from app.services.ocr_batcher import submit_plate_text
+            if budget is not None:
+                order = order[:budget.affordable(len(order))]
+            pending = [submit_plate_text(crops[index][0], crops[index][1], camera) for index in order]
+            for index, pending_text in zip(order, pending):
+                image, plate_coords = crops[index]
+                results[index] = self.read_plate(image, plate_coords, scores[index], pending_text)
+        else:
+            for reads, index in enumerate(order):
+                if budget is not None and not budget.has_time(start, reads):
+                    break
+                image, plate_coords = crops[index]
+                results[index] = self.read_plate(image, plate_coords, scores[index], camera=camera)
         
+        deferred = 0
+        for index, result in enumerate(results):
+            if result is None:
+                results[index] = self._unread_result(crops[index][1], scores[index])
+                results[index]['deferred'] = True
+                deferred += 1
+        if budget is not None:
+            budget.finish_frame(start, len(crops) - deferred, deferred,
+                                get_ocr_service().get_thread_reads() - ocr_reads)
         return results
     
+    def _unread_result(self, plate_coords: Tuple[int, int, int, int], score: Optional[float] = None) -> Dict:
+        """Result dictionary for a plate that has not been read (yet)"""
+        return {
+            'coordinates': plate_coords,
+            'score': score,
+            'text': None,
+            'confidence': 0.0,
+            'valid': False,
+            'deferred': False
+        }
+    
+    def read_plate(self, frame: np.ndarray, plate_coords: Tuple[int, int, int, int],
+                   score: Optional[float] = None, pending_text: Optional[Future] = None,
+                   camera: Optional[str] = None) -> Dict:
+        """
+        Run OCR on one detected plate and build its result dictionary
+        
+        Args:
+            pending_text: Future from the OCR batcher or process pool already reading this plate
+        """
+        result = self._unread_result(plate_coords, score)
+        
+        # Try to extract text using OCR if available
+        if is_ocr_available():
+            try:
+                if pending_text is not None:
+                    text, confidence = pending_text.result()
+                else:
+                    text, confidence = extract_plate_text(frame, plate_coords, camera)
+                if text:
+                    result['text'] = text
+                    result['confidence'] = confidence
+                    result['valid'] = True
+                    print(f"🔤 Plate detected and read: '{text}' (conf: {confidence:.2f})")
+                else:
+                    print(f"🔍 Plate detected but text unreadable")
+            except Exception as e:
+                print(f"❌ OCR error: {e}")
+        else:
+            print(f"⚠️ OCR not available - only detection")
+        
+        return result
+    
     def draw_plates(self, frame: np.ndarray, plates: List[Tuple[int, int, int, int]], 
                    color: Tuple[int, int, int] = (0, 255, 0), thickness: int = 2) -> np.ndarray:
         """Draw bounding boxes around detected plates"""
@@ -298,12 +603,21 @@ class PlateDetector:
         return result_frame
     
     def draw_plates_with_text(self, frame: np.ndarray, plate_results: List[Dict], 
-                             color: Tuple[int, int, int] = (0, 255, 0), thickness: int = 2) -> np.ndarray:
-        """Draw bounding boxes around detected plates with OCR text"""
-        result_frame = frame.copy()
+                             color: Tuple[int, int, int] = (0, 255, 0), thickness: int = 2,
+                             scale: float = 1.0, in_place: bool = False) -> np.ndarray:
+        """
+        Draw bounding boxes around detected plates with OCR text
+        
+        Args:
+            scale: Factor from plate coordinates to `frame` (preview buffers
+                smaller than the detected frame)
+            in_place: Draw on `frame` itself instead of a copy
+        """
+        result_frame = frame if in_place else frame.copy()
+        font_scale = 0.6 * min(1.0, max(scale, 0.5))
         
         for i, plate_info in enumerate(plate_results):
-            x, y, w, h = plate_info['coordinates']
+            x, y, w, h = (int(round(value * scale)) for value in plate_info['coordinates'])
             text = plate_info.get('text', '')
             confidence = plate_info.get('confidence', 0.0)
             valid = plate_info.get('valid', False)
@@ -320,7 +634,7 @@ class PlateDetector:
             else:
                 label = f"Plate {i+1}"
             
-            label_size = cv2.getTextSize(label, cv2.FONT_HERSHEY_SIMPLEX, 0.6, 2)[0]
+            label_size = cv2.getTextSize(label, cv2.FONT_HERSHEY_SIMPLEX, font_scale, 2)[0]
             
             # Draw label background
             cv2.rectangle(result_frame, 
@@ -330,7 +644,7 @@ class PlateDetector:
             
             # Draw label text
             cv2.putText(result_frame, label, (x, y - 5), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
+                       cv2.FONT_HERSHEY_SIMPLEX, font_scale, (255, 255, 255), 2)
         
         return result_frame
     
@@ -360,71 +674,92 @@ class PlateDetector:
         Uses contour detection to find rectangular regions
         """
         try:
-            # Edge detection to find borders
-            edges = cv2.Canny(gray_frame, 50, 150, apertureSize=3)
-            
-            # Morphological operations to connect character borders
-            kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (3, 3))
-            edges = cv2.morphologyEx(edges, cv2.MORPH_CLOSE, kernel)
-            
-            # Find contours
-            contours, _ = cv2.findContours(edges, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-            
-            plate_candidates = []
-            
-            for contour in contours:
-                # Get bounding rectangle
-                x, y, w, h = cv2.boundingRect(contour)
-                
-                # Filter by size and aspect ratio for license plates
-                aspect_ratio = w / h if h > 0 else 0
-                area = w * h
-                
-                # Philippine license plate characteristics:
-                # - Wider than tall (aspect ratio 2:1 to 5:1)
-                # - Reasonable size
-                if (2.0 <= aspect_ratio <= 5.0 and 
-                    1000 <= area <= 50000 and
-                    w >= 80 and h >= 20):
-                    
-                    # Additional checks for plate-like characteristics
-                    roi = gray_frame[y:y+h, x:x+w]
-                    if roi.size > 0:
-                        # Check for text-like patterns (multiple vertical edges)
-                        roi_edges = cv2.Canny(roi, 50, 150)
-                        vertical_edges = cv2.countNonZero(roi_edges)
-                        
-                        # Should have sufficient detail for text
-                        if vertical_edges > (w * h * 0.05):  # At least 5% edge pixels
-                            plate_candidates.append((x, y, w, h))
-            
-            # Sort by confidence (area) and return top candidates
-            plate_candidates.sort(key=lambda p: p[2] * p[3], reverse=True)
+            plate_candidates, total = find_bordered_plates(gray_frame, self.bordered_edge_max_width)
             
-            if plate_candidates:
-                print(f"🔍 bordered_detection: Found {len(plate_candidates)} potential bordered plates")
+            if total:
+                print(f"🔍 bordered_detection: Found {total} potential bordered plates")
             
-            return plate_candidates[:3]  # Return top 3 candidates
+            return plate_candidates
             
         except Exception as e:
             print(f"❌ Error in bordered plate detection: {e}")
             return []
 
-# Global detector instance
-plate_detector = PlateDetector()
+# Global detector instance, created on first use
+_plate_detector: Optional[PlateDetector] = None
+_plate_detector_lock = threading.Lock()
+_thread_detectors = threading.local()
+_warmup_future: Optional[Future] = None
+_warmup_lock = threading.Lock()
+
+def get_plate_detector() -> PlateDetector:
+    """Get the global plate detector, loading the cascades on first call"""
+    global _plate_detector
+    if _plate_detector is None:
+        with _plate_detector_lock:
+            if _plate_detector is None:
+                _plate_detector = PlateDetector()
+    return _plate_detector
+
+def get_thread_detector() -> PlateDetector:
+    """
+    This thread's own copy of the global detector (see PlateDetector.worker_copy),
+    for detection on worker threads
+    """
+    detector = getattr(_thread_detectors, 'detector', None)
+    if detector is None:
+        detector = get_plate_detector().worker_copy()
+        _thread_detectors.detector = detector
+    return detector
+
+def start_model_warmup(load_ocr: bool = True) -> Future:
+    """
+    Load the plate detector (and the OCR reader) on a background thread
+    
+    Returns:
+        Future resolving to the detector once everything is loaded; the UI can
+        poll done(). Repeated calls return the same future.
+    """
+    global _warmup_future
+    with _warmup_lock:
+        if _warmup_future is None:
+            future = Future()
+            
+            def warm_up():
+                try:
+                    detector = get_plate_detector()
+                    if load_ocr:
+                        is_ocr_available()  # Also starts the OCR worker processes
+                    future.set_result(detector)
+                except Exception as e:
+                    print(f"❌ Model warm-up failed: {e}")
+                    future.set_exception(e)
+            
+            threading.Thread(target=warm_up, name="model-warmup", daemon=True).start()
+            _warmup_future = future
+    return _warmup_future
+
+def __getattr__(name: str):
+    # Keeps `from app.services.plate.detector import plate_detector` working; the cascades load on that import
+    if name == "plate_detector":
+        return get_plate_detector()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-def detect_license_plates(frame: np.ndarray, model_name: str = None) -> List[Tuple[int, int, int, int]]:
+def detect_license_plates(frame: np.ndarray, model_name: str = None,
+                          regions: Optional[List[Tuple[int, int, int, int]]] = None) -> List[Tuple[int, int, int, int]]:
     """Convenience function for detecting license plates"""
-    return plate_detector.detect_plates(frame, model_name)
+    return get_plate_detector().detect_plates(frame, model_name, regions)
 
-def detect_and_read_license_plates(frame: np.ndarray, model_name: str = None) -> List[Dict]:
+def detect_and_read_license_plates(frame: np.ndarray, model_name: str = None,
+                                   regions: Optional[List[Tuple[int, int, int, int]]] = None,
+                                   camera: Optional[str] = None) -> List[Dict]:
     """Convenience function for detecting and reading license plates with OCR"""
-    return plate_detector.detect_and_read_plates(frame, model_name)
+    return get_plate_detector().detect_and_read_plates(frame, model_name, regions, camera)
 
 def draw_detected_plates(frame: np.ndarray, plates: List[Tuple[int, int, int, int]]) -> np.ndarray:
     """Convenience function for drawing detected plates"""
-    return plate_detector.draw_plates(frame, plates)
+    return get_plate_detector().draw_plates(frame, plates)
 
 def draw_plates_with_ocr(frame: np.ndarray, plate_results: List[Dict]) -> np.ndarray:
     """Convenience function for drawing detected plates with OCR text"""
-    return plate_detector.draw_plates_with_text(frame, plate_results)
+    return get_plate_detector().draw_plates_with_text(frame, plate_results)
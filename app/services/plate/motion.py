@@ -0,0 +1,148 @@
+"""
+Motion Gate for License Plate Detection
+Cheap frame differencing on a downscaled frame decides whether the cascades
+and OCR need to run at all, and if so, only inside the regions that moved
+"""
+
+import cv2
+import numpy as np
+from dataclasses import dataclass
+from typing import List, Tuple, Optional, Dict
+from app.utils.config import MOTION_GATE_SETTINGS
+
+
+@dataclass
+class MotionGateSettings:
+    """Motion gate thresholds (one set per camera)"""
+    downscale_width: int = 160  # Width of the frame used for differencing
+    diff_threshold: int = 25  # Per-pixel gray level change that counts as motion
+    min_motion_ratio: float = 0.002  # Fraction of changed pixels needed to run detection
+    background_alpha: float = 0.05  # Running-average background update rate
+    region_padding: float = 0.25  # Padding around motion regions (fraction of region size)
+    full_frame_ratio: float = 0.5  # Motion covering more than this runs full-frame detection
+    warmup_frames: int = 1  # Frames detected in full while the background settles
+
+
+class MotionGate:
+    """Skips detection on static frames and returns the regions that moved"""
+
+    def __init__(self, settings: MotionGateSettings = None):
+        self.settings = settings or MotionGateSettings()
+        self.background = None
+
+        # Statistics
+        self.frames_seen = 0
+        self.frames_skipped = 0
+        self.frames_regional = 0
+        self.frames_full = 0
+
+    def check(self, frame: np.ndarray) -> Optional[List[Tuple[int, int, int, int]]]:
+        """
+        Check a frame for motion
+
+        Returns:
+            None: run detection on the full frame (warm-up or widespread motion)
+            []: static frame, skip detection and OCR
+            [(x, y, w, h), ...]: run detection only inside these full-resolution regions
+        """
+        self.frames_seen += 1
+
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY) if len(frame.shape) == 3 else frame
+        height, width = gray.shape[:2]
+        scale = width / float(self.settings.downscale_width)
+        small_size = (self.settings.downscale_width, max(1, int(round(height / scale))))
+        small = cv2.resize(gray, small_size, interpolation=cv2.INTER_AREA)
+        small = cv2.GaussianBlur(small, (5, 5), 0)
+
+        if self.background is None or self.background.shape != small.shape:
+            self.background = small.astype(np.float32)
+            self.frames_full += 1
+            return None
+
+        diff = cv2.absdiff(small, cv2.convertScaleAbs(self.background))
+        _, mask = cv2.threshold(diff, self.settings.diff_threshold, 255, cv2.THRESH_BINARY)
+        cv2.accumulateWeighted(small, self.background, self.settings.background_alpha)
+
+        if self.frames_seen <= self.settings.warmup_frames:
+            self.frames_full += 1
+            return None
+
+        motion_ratio = cv2.countNonZero(mask) / float(mask.size)
+        if motion_ratio < self.settings.min_motion_ratio:
+            self.frames_skipped += 1
+            return []
+
+        regions = self._motion_regions(mask, scale, width, height)
+        covered = sum(w * h for _, _, w, h in regions)
+        if covered > self.settings.full_frame_ratio * width * height:
+            self.frames_full += 1
+            return None
+
+        self.frames_regional += 1
+        return regions
+
+    def _motion_regions(self, mask: np.ndarray, scale: float,
+                        width: int, height: int) -> List[Tuple[int, int, int, int]]:
+        """Padded, merged full-resolution bounding boxes of the moving blobs"""
+        mask = cv2.dilate(mask, np.ones((3, 3), np.uint8), iterations=2)
+        contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+
+        regions = []
+        for contour in contours:
+            x, y, w, h = cv2.boundingRect(contour)
+            pad_x = int(w * scale * self.settings.region_padding)
+            pad_y = int(h * scale * self.settings.region_padding)
+            x1 = max(0, int(x * scale) - pad_x)
+            y1 = max(0, int(y * scale) - pad_y)
+            x2 = min(width, int((x + w) * scale) + pad_x)
+            y2 = min(height, int((y + h) * scale) + pad_y)
+            regions.append([x1, y1, x2, y2])
+
+        # Merge overlapping regions so a plate is never split between two crops
+        merged = True
+        while merged:
+            merged = False
+            for i in range(len(regions)):
+                for j in range(i + 1, len(regions)):
+                    a, b = regions[i], regions[j]
+                    if a[0] <= b[2] and b[0] <= a[2] and a[1] <= b[3] and b[1] <= a[3]:
+                        regions[i] = [min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3])]
+                        del regions[j]
+                        merged = True
+                        break
+                if merged:
+                    break
+
+        return [(x1, y1, x2 - x1, y2 - y1) for x1, y1, x2, y2 in regions]
+
+    def reset(self):
+        """Forget the background model and start the statistics over (e.g. after the camera restarts)"""
+        self.background = None
+        # frames_seen also drives the warm-up, so all counters restart together
+        self.frames_seen = 0
+        self.frames_skipped = 0
+        self.frames_regional = 0
+        self.frames_full = 0
+
+    def get_statistics(self) -> dict:
+        """Get motion gate statistics"""
+        skip_rate = (self.frames_skipped / self.frames_seen * 100) if self.frames_seen > 0 else 0
+
+        return {
+            'frames_seen': self.frames_seen,
+            'frames_skipped': self.frames_skipped,
+            'frames_regional': self.frames_regional,
+            'frames_full': self.frames_full,
+            'skip_rate': round(skip_rate, 1)
+        }
+
+# Motion gates per camera location
+_motion_gates: Dict[str, MotionGate] = {}
+
+def get_motion_gate(camera: str = "Camera") -> MotionGate:
+    """Get (creating on first use) the motion gate for a camera, using its configured thresholds"""
+    if camera not in _motion_gates:
+        settings = dict(MOTION_GATE_SETTINGS.get("default", {}))
+        settings.update(MOTION_GATE_SETTINGS.get(camera, {}))
+        _motion_gates[camera] = MotionGate(MotionGateSettings(**settings))
+    return _motion_gates[camera]
@@ -0,0 +1,107 @@
+"""
+Vectorized Non-Maximum Suppression
+IoU is computed over whole box arrays with NumPy instead of one Python
+call per box pair
+"""
+
+import numpy as np
+from typing import List, Optional, Sequence
+
+
+def iou_matrix(boxes: np.ndarray) -> np.ndarray:
+    """
+    Pairwise Intersection over Union for (x, y, w, h) boxes
+
+    Args:
+        boxes: (N, 4) array of x, y, w, h
+
+    Returns:
+        (N, N) float64 IoU matrix
+    """
+    boxes = np.asarray(boxes, dtype=np.float64)
+    x1, y1 = boxes[:, 0], boxes[:, 1]
+    x2, y2 = x1 + boxes[:, 2], y1 + boxes[:, 3]
+    areas = boxes[:, 2] * boxes[:, 3]
+
+    inter_w = np.clip(np.minimum(x2[:, None], x2[None, :]) - np.maximum(x1[:, None], x1[None, :]), 0, None)
+    inter_h = np.clip(np.minimum(y2[:, None], y2[None, :]) - np.maximum(y1[:, None], y1[None, :]), 0, None)
+    intersection = inter_w * inter_h
+    union = areas[:, None] + areas[None, :] - intersection
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        iou = np.where(union > 0, intersection / union, 0.0)
+    return iou
+
+
+# Above this many boxes the O(N^2) IoU matrix costs more than sweeping the
+# survivors of each kept box; both give identical results
+MATRIX_NMS_MAX_BOXES = 64
+
+
+def nms_indices(boxes: Sequence, overlap_threshold: float = 0.3,
+                scores: Optional[Sequence[float]] = None) -> List[int]:
+    """
+    Greedy NMS returning the indices of kept boxes, best first
+
+    Args:
+        boxes: Sequence of (x, y, w, h)
+        overlap_threshold: Boxes with IoU >= threshold to a kept box are suppressed
+        scores: Optional per-box confidence; None ranks by box area
+            (the detector's original confidence proxy)
+    """
+    count = len(boxes)
+    if count == 0:
+        return []
+    if count == 1:
+        return [0]
+
+    boxes = np.asarray(boxes)
+    if scores is None:
+        ranking = boxes[:, 2] * boxes[:, 3]
+    else:
+        ranking = np.asarray(scores, dtype=np.float64)
+    order = np.argsort(ranking)[::-1]
+
+    if count <= MATRIX_NMS_MAX_BOXES:
+        return _nms_matrix(boxes, order, overlap_threshold)
+    return _nms_sweep(boxes, order, overlap_threshold)
+
+
+def _nms_matrix(boxes: np.ndarray, order: np.ndarray, overlap_threshold: float) -> List[int]:
+    """Greedy NMS over one precomputed IoU matrix"""
+    iou = iou_matrix(boxes[order])
+    suppressed = np.zeros(len(order), dtype=bool)
+    keep = []
+
+    for i in range(len(order)):
+        if suppressed[i]:
+            continue
+        keep.append(int(order[i]))
+        suppressed[i + 1:] |= iou[i, i + 1:] >= overlap_threshold
+
+    return keep
+
+
+def _nms_sweep(boxes: np.ndarray, order: np.ndarray, overlap_threshold: float) -> List[int]:
+    """Greedy NMS computing IoU of each kept box against all remaining boxes at once"""
+    boxes = boxes.astype(np.float64)
+    x1, y1 = boxes[:, 0], boxes[:, 1]
+    x2, y2 = x1 + boxes[:, 2], y1 + boxes[:, 3]
+    areas = boxes[:, 2] * boxes[:, 3]
+    keep = []
+
+    while order.size > 0:
+        current = order[0]
+        keep.append(int(current))
+        remaining = order[1:]
+
+        inter_w = np.clip(np.minimum(x2[current], x2[remaining]) - np.maximum(x1[current], x1[remaining]), 0, None)
+        inter_h = np.clip(np.minimum(y2[current], y2[remaining]) - np.maximum(y1[current], y1[remaining]), 0, None)
+        intersection = inter_w * inter_h
+        union = areas[current] + areas[remaining] - intersection
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            iou = np.where(union > 0, intersection / union, 0.0)
+        order = remaining[iou < overlap_threshold]
+
+    return keep
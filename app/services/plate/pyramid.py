@@ -0,0 +1,279 @@
+"""
+Shared Image Pyramid Detection Engine
+Builds one grayscale scale pyramid per frame and evaluates every loaded
+cascade and parameter set against it, instead of letting each
+detectMultiScale call rebuild its own pyramid. Every parameter set is
+scanned at exactly its own detectMultiScale scales; levels that several
+cascades or parameter sets share are resized and scanned once
+"""
+
+import cv2
+import numpy as np
+from typing import List, Tuple, Dict
+
+# Same grouping epsilon OpenCV uses inside detectMultiScale
+GROUP_EPS = 0.2
+
+
+def group_rectangles(rects: List, level_weights: List[float], group_threshold: int,
+                     eps: float = GROUP_EPS) -> Tuple[List[Tuple[int, int, int, int]], List[float]]:
+    """
+    NumPy port of cv::groupRectangles with level weights
+
+    The Python binding of cv2.groupRectangles only returns neighbour counts,
+    so this mirrors the C++ overload used by detectMultiScale3: the same
+    clusters, averaged boxes and nested-box filtering, plus the best cascade
+    level weight of every cluster.
+
+    Returns:
+        (grouped boxes, level weight per box)
+    """
+    if group_threshold <= 0 or len(rects) == 0:
+        return [tuple(int(v) for v in r) for r in rects], [float(w) for w in level_weights]
+
+    boxes = np.asarray(rects, dtype=np.int64)
+    weights = np.asarray(level_weights, dtype=np.float64)
+    x, y, w, h = boxes[:, 0], boxes[:, 1], boxes[:, 2], boxes[:, 3]
+
+    # SimilarRects predicate for every pair
+    delta = eps * (np.minimum(w[:, None], w[None, :]) + np.minimum(h[:, None], h[None, :])) * 0.5
+    similar = ((np.abs(x[:, None] - x[None, :]) <= delta) &
+               (np.abs(y[:, None] - y[None, :]) <= delta) &
+               (np.abs((x + w)[:, None] - (x + w)[None, :]) <= delta) &
+               (np.abs((y + h)[:, None] - (y + h)[None, :]) <= delta))
+
+    # Connected components; each is labelled by its smallest member index,
+    # which is also the order cv::partition numbers its classes in
+    labels = np.arange(len(boxes))
+    while True:
+        new_labels = np.where(similar, labels[None, :], len(boxes)).min(axis=1)
+        new_labels = np.minimum(new_labels, labels)
+        if np.array_equal(new_labels, labels):
+            break
+        labels = new_labels
+
+    classes, class_idx = np.unique(labels, return_inverse=True)
+    counts = np.bincount(class_idx)
+    sums = np.zeros((len(classes), 4), dtype=np.int64)
+    np.add.at(sums, class_idx, boxes)
+    averaged = np.rint(sums * (1.0 / counts)[:, None]).astype(np.int64)
+
+    best_weights = np.full(len(classes), -np.inf)
+    np.maximum.at(best_weights, class_idx, weights)
+
+    grouped, grouped_weights = [], []
+    for i in range(len(classes)):
+        n1 = counts[i]
+        if n1 <= group_threshold:
+            continue
+        r1 = averaged[i]
+
+        # Drop small boxes nested inside a stronger larger box
+        nested = False
+        for j in range(len(classes)):
+            n2 = counts[j]
+            if j == i or n2 <= group_threshold:
+                continue
+            r2 = averaged[j]
+            dx = int(np.rint(r2[2] * eps))
+            dy = int(np.rint(r2[3] * eps))
+            if (r1[0] >= r2[0] - dx and r1[1] >= r2[1] - dy and
+                    r1[0] + r1[2] <= r2[0] + r2[2] + dx and r1[1] + r1[3] <= r2[1] + r2[3] + dy and
+                    (n2 > max(3, n1) or n1 < 3)):
+                nested = True
+                break
+
+        if not nested:
+            grouped.append(tuple(int(v) for v in r1))
+            grouped_weights.append(float(best_weights[i]))
+
+    return grouped, grouped_weights
+
+
+class SharedPyramidEngine:
+    """Multi-cascade, multi-parameter-set detection over a single shared pyramid"""
+
+    def __init__(self, cascade_models: Dict[str, cv2.CascadeClassifier],
+                 parameter_sets: Dict[str, List[Dict]]):
+        """
+        Args:
+            cascade_models: Loaded cascades keyed by model name
+            parameter_sets: detectMultiScale parameter sets keyed by model name
+        """
+        self.cascade_models = cascade_models
+        self.parameter_sets = parameter_sets
+
+        # Last-frame counters (for benchmarks/debugging)
+        self.last_level_count = 0
+        self.last_cascade_passes = 0
+
+    def _plan_levels(self, model_name: str, window: Tuple[int, int],
+                     image_size: Tuple[int, int]) -> Dict[float, List[int]]:
+        """
+        Work out the scales each parameter set of a model scans
+
+        Returns:
+            {scale: [parameter_set_index, ...]}, scales as the float32 values
+            OpenCV stores in its scale list
+        """
+        img_w, img_h = image_size
+        win_w, win_h = window
+        plan = {}
+
+        for set_idx, params in enumerate(self.parameter_sets.get(model_name, [])):
+            min_w, min_h = params['minSize']
+            max_w, max_h = params['maxSize']
+            factor = 1.0
+
+            # Mirrors the scale loop inside CascadeClassifier.detectMultiScale
+            # (double-precision factor, stepped by multiplication)
+            while True:
+                scaled_w = int(round(img_w / factor))
+                scaled_h = int(round(img_h / factor))
+                # A level exactly the window size still holds one window position
+                if scaled_w - win_w < 0 or scaled_h - win_h < 0:
+                    break
+
+                window_w = int(round(win_w * factor))
+                window_h = int(round(win_h * factor))
+                if window_w > max_w or window_h > max_h:
+                    break
+                if window_w >= min_w and window_h >= min_h:
+                    scale = float(np.float32(factor))
+                    plan.setdefault(scale, [])
+                    if set_idx not in plan[scale]:
+                        plan[scale].append(set_idx)
+
+                factor *= params['scaleFactor']
+
+        return plan
+
+    def _get_level_image(self, gray_frame: np.ndarray, scale: float,
+                         pyramid: Dict[float, np.ndarray]) -> np.ndarray:
+        """Get (building once per frame) the grayscale image for a pyramid scale"""
+        if scale not in pyramid:
+            if scale == 1.0:
+                pyramid[scale] = gray_frame
+            else:
+                height, width = gray_frame.shape[:2]
+                size = (int(round(width / scale)), int(round(height / scale)))
+                # Same resampling OpenCV uses when it builds its own pyramid
+                pyramid[scale] = cv2.resize(gray_frame, size, fx=1.0 / scale, fy=1.0 / scale,
+                                            interpolation=cv2.INTER_LINEAR_EXACT)
+        return pyramid[scale]
+
+    def _scan_level(self, cascade: cv2.CascadeClassifier, gray_frame: np.ndarray, window: Tuple[int, int],
+                    scale: float, pyramid: Dict[float, np.ndarray]) -> Tuple[List[List[int]], List[float]]:
+        """
+        Collect raw (ungrouped) boxes in frame coordinates and their cascade
+        level weights for one scale
+
+        Below scale 2 detectMultiScale visits every second window position,
+        which a single-scale call on the shared level image reproduces. From
+        scale 2 up it visits every position (skipping the next one after a
+        first-stage reject), which only a call at that very scale reproduces,
+        so those (small) levels are scanned on the frame with scaleFactor = scale.
+        """
+        if scale >= 2.0:
+            window_size = (int(round(window[0] * scale)), int(round(window[1] * scale)))
+            boxes, _, level_weights = cascade.detectMultiScale3(
+                gray_frame,
+                scaleFactor=scale,  # Scales 1 (below minSize) and scale² (above maxSize) are skipped
+                minNeighbors=0,  # Raw windows; grouping happens per parameter set
+                minSize=window_size,
+                maxSize=window_size,
+                flags=cv2.CASCADE_SCALE_IMAGE,
+                outputRejectLevels=True
+            )
+            return [[int(v) for v in box] for box in boxes], [float(w) for w in np.ravel(level_weights)]
+
+        level_image = self._get_level_image(gray_frame, scale, pyramid)
+        if level_image.shape[1] < window[0] or level_image.shape[0] < window[1]:
+            return [], []
+        hits, _, level_weights = cascade.detectMultiScale3(
+            level_image,
+            scaleFactor=1.1,
+            minNeighbors=0,
+            minSize=window,
+            maxSize=window,
+            flags=cv2.CASCADE_SCALE_IMAGE,
+            outputRejectLevels=True
+        )
+        if len(hits) == 0:
+            return [], []
+
+        # Back to frame coordinates in float32, as OpenCV maps its hits
+        scaled = np.rint(np.asarray(hits, dtype=np.float32) * np.float32(scale)).astype(int)
+        window_w, window_h = np.rint(np.asarray(window, dtype=np.float32) * np.float32(scale)).astype(int)
+        boxes = [[int(x), int(y), int(window_w), int(window_h)] for x, y in scaled[:, :2]]
+        return boxes, [float(w) for w in np.ravel(level_weights)]
+
+    def detect(self, gray_frame: np.ndarray,
+               model_names: List[str] = None) -> Dict[str, List[Tuple[int, int, int, int]]]:
+        """
+        Run the requested cascades (default: all) over one shared pyramid
+
+        Args:
+            gray_frame: Grayscale input frame
+            model_names: Models to evaluate (None = all loaded models)
+
+        Returns:
+            {model_name: [(x, y, w, h), ...]} with each parameter set grouped
+            exactly like detectMultiScale (minNeighbors, eps=0.2) and the
+            parameter sets concatenated
+        """
+        return {name: boxes for name, (boxes, _) in self.detect_with_scores(gray_frame, model_names).items()}
+
+    def detect_with_scores(self, gray_frame: np.ndarray,
+                           model_names: List[str] = None) -> Dict[str, Tuple[List[Tuple[int, int, int, int]], List[float]]]:
+        """
+        Same as detect(), also returning each box's cascade level weight
+        (the detectMultiScale3 outputRejectLevels confidence)
+
+        Returns:
+            {model_name: ([(x, y, w, h), ...], [level_weight, ...])}
+        """
+        if model_names is None:
+            model_names = list(self.cascade_models.keys())
+
+        height, width = gray_frame.shape[:2]
+        pyramid = {}
+        results = {}
+        cascade_passes = 0
+
+        for model_name in model_names:
+            cascade = self.cascade_models.get(model_name)
+            if cascade is None:
+                continue
+
+            window = tuple(cascade.getOriginalWindowSize())
+            plan = self._plan_levels(model_name, window, (width, height))
+            param_sets = self.parameter_sets.get(model_name, [])
+            raw_hits = [[] for _ in param_sets]
+            raw_weights = [[] for _ in param_sets]
+
+            # One cascade pass per scale, shared by every parameter set that scans it
+            for scale in sorted(plan.keys()):
+                boxes, weights = self._scan_level(cascade, gray_frame, window, scale, pyramid)
+                cascade_passes += 1
+                for set_idx in plan[scale]:
+                    raw_hits[set_idx].extend(boxes)
+                    raw_weights[set_idx].extend(weights)
+
+            model_plates = []
+            model_scores = []
+            for set_idx, params in enumerate(param_sets):
+                if not raw_hits[set_idx]:
+                    continue
+                grouped, grouped_weights = group_rectangles(
+                    raw_hits[set_idx], raw_weights[set_idx], params['minNeighbors'], GROUP_EPS
+                )
+                model_plates.extend(grouped)
+                model_scores.extend(grouped_weights)
+
+            results[model_name] = (model_plates, model_scores)
+
+        self.last_level_count = len(pyramid)
+        self.last_cascade_passes = cascade_passes
+
+        return results
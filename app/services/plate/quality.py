@@ -0,0 +1,161 @@
+"""
+Plate Crop Quality Gate
+Scores detected plate crops (sharpness, height, contrast) before OCR so
+motion-blurred, tiny or washed-out crops that would never validate are
+skipped, and tracked plates can wait a few frames for their sharpest crop
+"""
+
+import cv2
+import threading
+import numpy as np
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+# Crops are scaled to this height before measuring sharpness, so the score
+# does not depend on how far away the plate is
+QUALITY_HEIGHT = 32
+# Padding kept around a stored crop (matches the OCR preprocessing padding)
+CROP_PADDING = 5
+
+
+@dataclass
+class CropQualitySettings:
+    """Crop quality thresholds"""
+    min_sharpness: float = 150.0  # Laplacian variance below this = too blurry to read
+    min_height: int = 16  # Plate height in pixels
+    min_contrast: float = 20.0  # Gray-level standard deviation of the plate
+    good_sharpness: float = 1500.0  # Crops at least this sharp are read without waiting
+    window_frames: int = 5  # Frames a tracked plate waits for a sharper crop
+
+
+@dataclass
+class CropQuality:
+    """Quality measurements of one plate crop"""
+    sharpness: float
+    height: int
+    contrast: float
+    reason: Optional[str] = None  # Why the crop fails the gate ('small', 'low_contrast', 'blurry'), None = passes
+
+    @property
+    def passed(self) -> bool:
+        return self.reason is None
+
+    def rank(self) -> Tuple[bool, float]:
+        """Sort key: passing crops first, then the sharpest"""
+        return (self.passed, self.sharpness)
+
+
+def measure_crop(frame: np.ndarray, plate_coords: Tuple[int, int, int, int]) -> Tuple[float, int, float]:
+    """
+    Measure a plate crop
+
+    Returns:
+        (sharpness, height, contrast): Laplacian variance of the plate interior
+        at QUALITY_HEIGHT pixels tall, box height, gray-level standard deviation
+    """
+    x, y, w, h = plate_coords
+    region = frame[max(0, y):y + h, max(0, x):x + w]
+    if region.size == 0:
+        return 0.0, 0, 0.0
+
+    gray = cv2.cvtColor(region, cv2.COLOR_BGR2GRAY) if len(region.shape) == 3 else region
+    # Trim the plate border: its long straight edges stay sharp under horizontal motion blur
+    rows, columns = gray.shape
+    inner = gray[rows // 8:rows - rows // 8, columns // 16:columns - columns // 16]
+    if inner.size == 0:
+        inner = gray
+
+    width = max(1, int(round(inner.shape[1] * QUALITY_HEIGHT / float(inner.shape[0]))))
+    interpolation = cv2.INTER_AREA if inner.shape[0] > QUALITY_HEIGHT else cv2.INTER_LINEAR
+    normalized = cv2.resize(inner, (width, QUALITY_HEIGHT), interpolation=interpolation)
+
+    sharpness = float(cv2.Laplacian(normalized, cv2.CV_32F).var())
+    contrast = float(normalized.std())
+    return sharpness, h, contrast
+
+
+def extract_crop(frame: np.ndarray, plate_coords: Tuple[int, int, int, int],
+                 padding: int = CROP_PADDING) -> Tuple[np.ndarray, Tuple[int, int, int, int]]:
+    """
+    Copy a plate (with padding) out of a frame so it can be read after the frame is gone
+
+    Returns:
+        (crop, plate coordinates inside the crop)
+    """
+    x, y, w, h = plate_coords
+    x1, y1 = max(0, x - padding), max(0, y - padding)
+    x2, y2 = min(frame.shape[1], x + w + padding), min(frame.shape[0], y + h + padding)
+    return frame[y1:y2, x1:x2].copy(), (x - x1, y - y1, w, h)
+
+
+class CropQualityGate:
+    """Decides which plate crops are worth an OCR call"""
+
+    def __init__(self, settings: CropQualitySettings = None):
+        self.settings = settings or CropQualitySettings()
+        self.lock = threading.Lock()  # OCR workers of every camera share the gate
+
+        # Statistics
+        self.crops_checked = 0
+        self.crops_read = 0
+        self.crops_deferred = 0
+        self.skipped = {'small': 0, 'low_contrast': 0, 'blurry': 0}
+
+    def measure(self, frame: np.ndarray, plate_coords: Tuple[int, int, int, int]) -> CropQuality:
+        """Score a crop against the thresholds (does not touch the statistics)"""
+        sharpness, height, contrast = measure_crop(frame, plate_coords)
+
+        reason = None
+        if height < self.settings.min_height:
+            reason = 'small'
+        elif contrast < self.settings.min_contrast:
+            reason = 'low_contrast'
+        elif sharpness < self.settings.min_sharpness:
+            reason = 'blurry'
+
+        return CropQuality(sharpness, height, contrast, reason)
+
+    def check(self, frame: np.ndarray, plate_coords: Tuple[int, int, int, int]) -> CropQuality:
+        """Score a crop and count it; its outcome is counted with record() or defer()"""
+        with self.lock:
+            self.crops_checked += 1
+        return self.measure(frame, plate_coords)
+
+    def is_good(self, quality: CropQuality) -> bool:
+        """Sharp enough to read now instead of waiting for a better frame"""
+        return quality.passed and quality.sharpness >= self.settings.good_sharpness
+
+    def record(self, quality: CropQuality):
+        """Count the outcome for a crop: read when it passes, otherwise skipped by reason"""
+        with self.lock:
+            if quality.passed:
+                self.crops_read += 1
+            else:
+                self.skipped[quality.reason] += 1
+
+    def defer(self):
+        """Count a crop that was neither read nor skipped (a sharper one may still come)"""
+        with self.lock:
+            self.crops_deferred += 1
+
+    def get_statistics(self) -> dict:
+        """Get quality gate statistics"""
+        with self.lock:
+            crops_checked, crops_read, crops_deferred = self.crops_checked, self.crops_read, self.crops_deferred
+            skipped_by_reason = dict(self.skipped)
+        skipped = sum(skipped_by_reason.values())
+        # Only skipped crops are saved OCR calls; deferred crops may still be read
+        # later, so the rate is taken over the crops with an outcome (read or skipped)
+        decided = crops_read + skipped
+        saved_rate = (skipped / decided * 100) if decided > 0 else 0
+
+        return {
+            'crops_checked': crops_checked,
+            'crops_read': crops_read,
+            'crops_deferred': crops_deferred,
+            'crops_skipped': skipped,
+            'skipped_small': skipped_by_reason['small'],
+            'skipped_low_contrast': skipped_by_reason['low_contrast'],
+            'skipped_blurry': skipped_by_reason['blurry'],
+            'ocr_calls_saved_rate': round(saved_rate, 1)
+        }
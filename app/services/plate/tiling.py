@@ -0,0 +1,55 @@
+"""
+Frame Tiling for High-Resolution Detection
+Splits large frames into overlapping tiles so each tile can be searched at
+full resolution on its own thread
+"""
+
+from typing import List, Tuple
+
+
+def compute_tiles(width: int, height: int, tile_size: Tuple[int, int],
+                  overlap: int) -> List[Tuple[int, int, int, int]]:
+    """
+    Overlapping tiles covering a frame
+
+    Args:
+        width, height: Frame size
+        tile_size: (tile_width, tile_height)
+        overlap: Pixels shared by neighbouring tiles; plates smaller than
+            this always fit entirely inside at least one tile
+
+    Returns:
+        List of (x, y, w, h) tiles; the last row/column is aligned to the frame edge
+    """
+    tile_w, tile_h = min(tile_size[0], width), min(tile_size[1], height)
+    return [
+        (x, y, tile_w, tile_h)
+        for y in _tile_starts(height, tile_h, overlap)
+        for x in _tile_starts(width, tile_w, overlap)
+    ]
+
+
+def _tile_starts(length: int, tile: int, overlap: int) -> List[int]:
+    """Tile start offsets along one axis"""
+    step = max(1, tile - overlap)
+    starts = list(range(0, max(1, length - tile + 1), step))
+    if starts[-1] + tile < length:
+        starts.append(length - tile)
+    return starts
+
+
+def touches_inner_edge(box: Tuple[int, int, int, int], tile: Tuple[int, int, int, int],
+                       frame_size: Tuple[int, int], margin: int = 2) -> bool:
+    """
+    Whether a tile-local box is cut by a tile edge that lies inside the frame
+
+    Such boxes are partial plates; the neighbouring tile sees them whole.
+    """
+    x, y, w, h = box
+    tile_x, tile_y, tile_w, tile_h = tile
+    frame_w, frame_h = frame_size
+
+    return ((tile_x > 0 and x <= margin) or
+            (tile_y > 0 and y <= margin) or
+            (tile_x + tile_w < frame_w and x + w >= tile_w - margin) or
+            (tile_y + tile_h < frame_h and y + h >= tile_h - margin))
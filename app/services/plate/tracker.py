@@ -0,0 +1,254 @@
+"""
+License Plate Tracker
+Keeps plates alive between frames so the full-frame cascade pass only runs
+every few frames; in between, detection runs only in small search windows
+around each track's predicted position
+"""
+
+import numpy as np
+from dataclasses import dataclass, field
+from typing import List, Tuple, Dict, Optional
+from app.services.plate.nms import iou_matrix
+from app.services.plate.quality import CropQuality, extract_crop
+from app.utils.config import MIN_PLATE_SCORE
+
+
+@dataclass
+class PlateTrackerSettings:
+    """Tracker scheduling and association thresholds"""
+    full_detection_interval: int = 5  # Full-frame detection every N frames
+    search_margin: float = 0.5  # Search window padding (fraction of the box size)
+    match_iou: float = 0.3  # Minimum IoU between prediction and detection
+    max_misses: int = 3  # Drop a track after this many frames without a match
+    velocity_smoothing: float = 0.5  # Weight of the newest motion in the velocity estimate
+    ocr_interval: int = 10  # Re-read an already-read plate every N matched frames
+
+
+@dataclass
+class PlateTrack:
+    """One tracked plate"""
+    track_id: int
+    box: Tuple[int, int, int, int]
+    score: float = 0.0
+    velocity: Tuple[float, float] = (0.0, 0.0)
+    hits: int = 1
+    misses: int = 0
+    frames_since_ocr: int = 0
+    result: Dict = field(default_factory=dict)
+    # Best crop seen while waiting to read (crop quality gate)
+    best_crop: Optional[Tuple[np.ndarray, Tuple[int, int, int, int]]] = None
+    best_quality: Optional[CropQuality] = None
+    quality_frames: int = 0
+
+    def predict(self) -> Tuple[int, int, int, int]:
+        """Constant-velocity prediction of the next box"""
+        x, y, w, h = self.box
+        return (int(round(x + self.velocity[0])), int(round(y + self.velocity[1])), w, h)
+
+
+class PlateTracker:
+    """Multi-plate tracker layered over a PlateDetector"""
+
+    def __init__(self, detector, settings: PlateTrackerSettings = None, camera: Optional[str] = None):
+        self.detector = detector
+        self.camera = camera  # Passed on to OCR preprocessing
+        self.settings = settings or PlateTrackerSettings()
+        self.quality_gate = getattr(detector, 'quality_gate', None)
+        self.tracks: List[PlateTrack] = []
+        self.next_track_id = 1
+        self.frame_index = 0
+
+        # Statistics
+        self.full_detections = 0
+        self.window_detections = 0
+        self.ocr_calls = 0
+
+    def _search_windows(self, frame_shape: Tuple[int, ...]) -> List[Tuple[int, int, int, int]]:
+        """Padded search windows around every track's predicted box"""
+        height, width = frame_shape[:2]
+        windows = []
+
+        for track in self.tracks:
+            x, y, w, h = track.predict()
+            pad_x = int(w * self.settings.search_margin)
+            pad_y = int(h * self.settings.search_margin)
+            x1, y1 = max(0, x - pad_x), max(0, y - pad_y)
+            x2, y2 = min(width, x + w + pad_x), min(height, y + h + pad_y)
+            if x2 > x1 and y2 > y1:
+                windows.append((x1, y1, x2 - x1, y2 - y1))
+
+        return windows
+
+    def update(self, frame: np.ndarray) -> List[PlateTrack]:
+        """
+        Advance the tracker by one frame
+
+        Returns:
+            Live tracks; tracks not re-detected this frame carry their predicted box
+        """
+        full_frame = self.frame_index % self.settings.full_detection_interval == 0
+        self.frame_index += 1
+
+        if full_frame:
+            detections, scores = self.detector.detect_plates_with_scores(frame)
+            self.full_detections += 1
+        else:
+            detections, scores = self.detector.detect_plates_with_scores(
+                frame, regions=self._search_windows(frame.shape)
+            )
+            self.window_detections += 1
+
+        self._associate(detections, scores, allow_new=full_frame)
+        return self.tracks
+
+    def _associate(self, detections: List[Tuple[int, int, int, int]], scores: List[float],
+                   allow_new: bool = True):
+        """Greedy IoU matching of detections to predicted track boxes"""
+        predictions = [track.predict() for track in self.tracks]
+        matched_tracks = set()
+        matched_detections = set()
+
+        if predictions and detections:
+            ious = iou_matrix(np.array(predictions + list(detections)))[:len(predictions), len(predictions):]
+            for flat_idx in np.argsort(ious, axis=None)[::-1]:
+                track_idx, det_idx = np.unravel_index(flat_idx, ious.shape)
+                if ious[track_idx, det_idx] < self.settings.match_iou:
+                    break
+                if track_idx in matched_tracks or det_idx in matched_detections:
+                    continue
+                matched_tracks.add(track_idx)
+                matched_detections.add(det_idx)
+                self._update_track(self.tracks[track_idx], detections[det_idx], scores[det_idx])
+
+        alive = []
+        for track_idx, track in enumerate(self.tracks):
+            if track_idx not in matched_tracks:
+                track.misses += 1
+                track.box = predictions[track_idx]
+            if track.misses <= self.settings.max_misses:
+                alive.append(track)
+
+        if allow_new:
+            for det_idx, box in enumerate(detections):
+                # Low-scoring boxes never start a track, so they never reach OCR
+                if det_idx not in matched_detections and scores[det_idx] >= MIN_PLATE_SCORE:
+                    alive.append(PlateTrack(track_id=self.next_track_id, box=tuple(box), score=scores[det_idx]))
+                    self.next_track_id += 1
+
+        self.tracks = alive
+
+    def _update_track(self, track: PlateTrack, box: Tuple[int, int, int, int], score: float):
+        """Move a track onto its matched detection and refresh its velocity"""
+        alpha = self.settings.velocity_smoothing
+        dx, dy = box[0] - track.box[0], box[1] - track.box[1]
+        track.velocity = (
+            alpha * dx + (1 - alpha) * track.velocity[0],
+            alpha * dy + (1 - alpha) * track.velocity[1]
+        )
+        track.box = tuple(box)
+        track.score = score
+        track.hits += 1
+        track.misses = 0
+        track.frames_since_ocr += 1
+
+    def detect_and_read_plates(self, frame: np.ndarray) -> List[Dict]:
+        """
+        Tracked equivalent of PlateDetector.detect_and_read_plates
+
+        OCR runs for new tracks, unread tracks and every `ocr_interval`
+        matched frames; otherwise the track's last read is reused. With the
+        detector's crop quality gate enabled, a due track is read from the
+        sharpest crop seen over the gate's window instead of the current one.
+        With the detector's OCR budget enabled, tracks never read go first
+        and tracks deferred past the budget stay due for the next frame.
+
+        Returns:
+            Same dictionaries as detect_and_read_plates plus 'track_id'
+        """
+        tracks = self.update(frame)
+        due = [
+            track for track in tracks
+            if not track.result or (track.misses == 0 and (not track.result.get('valid') or
+                                                           track.frames_since_ocr >= self.settings.ocr_interval))
+        ]
+
+        if self.quality_gate is None:
+            to_read = [(track, (frame, track.box)) for track in due]
+        else:
+            to_read = self._select_crops(frame, due)
+
+        # One read_plate_crops call so the plates of this frame can share an OCR batch
+        reads = self.detector.read_plate_crops([crop for _, crop in to_read],
+                                               [track.score for track, _ in to_read], self.camera,
+                                               [not track.result for track, _ in to_read])
+        deferred = set()
+        for (track, _), read in zip(to_read, reads):
+            if read.get('deferred'):
+                # Keep the last read (and the best crop); the track stays due
+                deferred.add(track.track_id)
+                continue
+            if self.quality_gate is not None:
+                self.quality_gate.record(track.best_quality)
+                track.best_crop, track.best_quality, track.quality_frames = None, None, 0
+            track.result = read
+            track.frames_since_ocr = 0
+            self.ocr_calls += 1
+
+        results = []
+        for track in tracks:
+            # Tracks still waiting for a readable crop have no read yet
+            result = dict(track.result) if track.result else {'text': None, 'confidence': 0.0, 'valid': False}
+            result['deferred'] = track.track_id in deferred
+            result['coordinates'] = track.box
+            result['score'] = track.score
+            result['track_id'] = track.track_id
+            results.append(result)
+
+        return results
+
+    def _select_crops(self, frame: np.ndarray,
+                      due: List[PlateTrack]) -> List[Tuple[PlateTrack, Tuple[np.ndarray, Tuple[int, int, int, int]]]]:
+        """
+        Keep each due track's best crop over the quality window and pick the ones to read now
+
+        A track is read as soon as its best crop is sharp enough, or when the
+        window ends with a crop that passes the gate; a window of nothing but
+        unreadable crops is skipped and a new window starts. Picked tracks
+        keep their best crop until it is actually read (it may be deferred).
+        """
+        to_read = []
+        for track in due:
+            if track.misses > 0:
+                continue  # Predicted box only; wait for a real detection
+            quality = self.quality_gate.check(frame, track.box)
+            if track.best_quality is None or quality.rank() > track.best_quality.rank():
+                track.best_crop = extract_crop(frame, track.box)
+                track.best_quality = quality
+            track.quality_frames += 1
+
+            if self.quality_gate.is_good(track.best_quality) or \
+                    track.quality_frames >= self.quality_gate.settings.window_frames:
+                if track.best_quality.passed:
+                    to_read.append((track, track.best_crop))
+                else:
+                    self.quality_gate.record(track.best_quality)
+                    track.best_crop, track.best_quality, track.quality_frames = None, None, 0
+            else:
+                self.quality_gate.defer()
+
+        return to_read
+
+    def reset(self):
+        """Drop all tracks (e.g. after the camera restarts)"""
+        self.tracks = []
+        self.frame_index = 0
+
+    def get_statistics(self) -> dict:
+        """Get tracker statistics"""
+        return {
+            'frames': self.frame_index,
+            'active_tracks': len(self.tracks),
+            'full_detections': self.full_detections,
+            'window_detections': self.window_detections,
+            'ocr_calls': self.ocr_calls
+        }
@@ -0,0 +1,103 @@
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+from app.utils.config import UI_TICK_MS
+
+
+class UIDispatcher:
+    """
+    Hands updates from background threads to the Tk main thread. Every
+    update kind has one latest-value slot; a periodic main-thread tick runs
+    what is in the slots, so an update posted before the previous one of
+    its kind ran replaces it (and is counted as dropped) instead of queueing
+    """
+
+    def __init__(self, widget, interval_ms: int = UI_TICK_MS):
+        """
+        Args:
+            widget: Any Tk widget; its after() schedules the ticks
+            interval_ms: Milliseconds between ticks
+        """
+        self.widget = widget
+        self.interval_ms = max(1, interval_ms)
+        self.lock = threading.Lock()
+        self.slots: Dict[str, Tuple[Callable, tuple]] = {}
+        self.tick_id = None
+        self.running = False
+
+        # Statistics
+        self.posted: Dict[str, int] = {}
+        self.delivered: Dict[str, int] = {}
+        self.dropped: Dict[str, int] = {}
+        self.ticks = 0
+        self.tick_seconds = 0.0
+        self.max_tick_seconds = 0.0
+
+    def start(self):
+        """Start ticking (call on the main thread)"""
+        if not self.running:
+            self.running = True
+            self.tick_id = self.widget.after(self.interval_ms, self._tick)
+
+    def stop(self):
+        """Stop ticking and forget the updates not run yet (call on the main thread)"""
+        self.running = False
+        if self.tick_id is not None:
+            try:
+                self.widget.after_cancel(self.tick_id)
+            except Exception:
+                pass  # Widget already destroyed
+            self.tick_id = None
+        with self.lock:
+            self.slots.clear()
+
+    def post(self, kind: str, callback: Callable, *args: Any):
+        """
+        Run callback(*args) on the main thread at the next tick, from any
+        thread; replaces the update of the same kind still waiting
+        """
+        with self.lock:
+            self.posted[kind] = self.posted.get(kind, 0) + 1
+            if kind in self.slots:
+                self.dropped[kind] = self.dropped.get(kind, 0) + 1
+            self.slots[kind] = (callback, args)
+
+    def _tick(self):
+        """Main thread: run the waiting updates, then schedule the next tick"""
+        with self.lock:
+            slots, self.slots = self.slots, {}
+
+        start = time.perf_counter()
+        for kind, (callback, args) in slots.items():
+            try:
+                callback(*args)
+            except Exception as e:
+                print(f"❌ UI update '{kind}' error: {e}")
+        elapsed = time.perf_counter() - start
+
+        with self.lock:
+            for kind in slots:
+                self.delivered[kind] = self.delivered.get(kind, 0) + 1
+            self.ticks += 1
+            self.tick_seconds += elapsed
+            self.max_tick_seconds = max(self.max_tick_seconds, elapsed)
+        if self.running:
+            self.tick_id = self.widget.after(self.interval_ms, self._tick)
+
+    def get_dropped(self, kind: Optional[str] = None) -> int:
+        """Updates replaced before they ran, of one kind or of all kinds"""
+        with self.lock:
+            return self.dropped.get(kind, 0) if kind is not None else sum(self.dropped.values())
+
+    def get_statistics(self) -> dict:
+        """Posted, delivered and dropped updates per kind, and main-thread time per tick"""
+        with self.lock:
+            return {
+                'posted': dict(self.posted),
+                'delivered': dict(self.delivered),
+                'dropped': dict(self.dropped),
+                'waiting': len(self.slots),
+                'ticks': self.ticks,
+                'tick_ms': round(self.tick_seconds / self.ticks * 1000, 2) if self.ticks else 0.0,
+                'max_tick_ms': round(self.max_tick_seconds * 1000, 2)
+            }
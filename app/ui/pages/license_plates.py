@@ -1,14 +1,20 @@
 import customtkinter as ctk
 import cv2
-import numpy as np
-from PIL import Image, ImageTk
 import threading
 import time
 from tkinter import messagebox
 from app.ui.widget.gradient_button import GradientButton
 from app.ui.widget.data_table import DataTable
+from app.ui.widget.camera_preview import CameraPreview
+from app.ui.dispatcher import UIDispatcher
 from app.services.license_plate_service import LicensePlateService
-from app.services.plate.detector import plate_detector, detect_and_read_license_plates
+from app.services.plate.detector import get_plate_detector, start_model_warmup, detect_and_read_license_plates
+from app.services.plate.motion import get_motion_gate
+from app.services.plate.tracker import PlateTracker, PlateTrackerSettings
+from app.services.camera_manager import CameraManager, load_camera_configs
+from app.services.frame_sources import open_frame_source
+from app.utils.config import (MOTION_GATE_ENABLED, PLATE_TRACKING_ENABLED, PLATE_TRACKER_SETTINGS,
+                              TILED_DETECTION_ENABLED, MODEL_WARMUP_ENABLED, CAMERA_PIPELINE_ENABLED)
 from app.services.pagination import PaginationParams, PaginationService
 from app.services.detection_logger import detection_logger, start_detection_logging, stop_detection_logging
 
@@ -21,6 +27,31 @@ class LicensePlatesPage(ctk.CTkFrame):
         self.camera_running = False
         self.detection_thread = None
         
+        # Configured cameras; the panel shows the first one that opens (all of them are logged)
+        self.camera_configs = load_camera_configs()
+        self.camera_location = self.camera_configs[0].location if self.camera_configs else "Camera"
+        
+        # Optional motion gate: skip detection/OCR on static frames
+        self.motion_gate = get_motion_gate(self.camera_location) if MOTION_GATE_ENABLED else None
+        
+        # Optional tracker: full detection every N frames, tracked boxes in between
+        # (created by the camera loop once the detector is loaded)
+        self.plate_tracker = None
+        
+        # Crop quality gate and OCR budget of the loaded detector (set by the camera loop), for the status line
+        self.quality_gate = None
+        self.ocr_budget = None
+        
+        # Capture → detect → OCR → sink pipeline of the running cameras (CAMERA_PIPELINE_ENABLED)
+        self.camera_manager = None
+        self.pipeline = None
+        
+        # Camera threads post UI updates here; one main-thread tick applies the latest of each kind
+        self.ui_dispatcher = UIDispatcher(self)
+        
+        # Load cascades and the OCR reader in the background so the page opens immediately
+        self.model_warmup = start_model_warmup() if MODEL_WARMUP_ENABLED else None
+        
         # Pagination state
         self.current_pagination_params = PaginationService.create_params(
             page=1,
@@ -35,6 +66,7 @@ class LicensePlatesPage(ctk.CTkFrame):
         except Exception as e:
             print(f"❌ Error building license plates page: {e}")
             self._build_fallback()
+        self.ui_dispatcher.start()
     
     def _build(self):
         # Main container
@@ -135,6 +167,7 @@ class LicensePlatesPage(ctk.CTkFrame):
             justify="center"
         )
         self.camera_label.grid(row=1, column=0, sticky="nsew", padx=20, pady=(0, 20))
+        self.camera_preview = CameraPreview(self.camera_label, dispatcher=self.ui_dispatcher)
         
         # Detection status
         self.status_label = ctk.CTkLabel(
@@ -238,23 +271,57 @@ class LicensePlatesPage(ctk.CTkFrame):
     def _start_camera(self):
         """Start camera for license plate detection"""
         try:
-            self.camera = cv2.VideoCapture(0)
-            if not self.camera.isOpened():
-                messagebox.showerror("Error", "Cannot open camera!")
-                return
+            if CAMERA_PIPELINE_ENABLED:
+                # Every configured camera, sharing one pool of detect/OCR workers
+                self.camera_manager = CameraManager(
+                    self.camera_configs,
+                    on_frame=self._on_pipeline_frame,
+                    on_logged=lambda: self.ui_dispatcher.post("detection_stats", self._update_detection_stats),
+                    draw=False  # The preview draws on its own small buffer
+                )
+                opened = self.camera_manager.open()
+                if not opened:
+                    self.camera_manager = None
+                    messagebox.showerror("Error", "Cannot open camera!")
+                    return
+                self.camera_location = opened[0]
+                self.motion_gate = get_motion_gate(self.camera_location) if MOTION_GATE_ENABLED else None
+            else:
+                # Webcams grab on their own thread so detection always gets the newest frame
+                camera_config = self.camera_configs[0]
+                self.camera = open_frame_source(camera_config.source, camera_config.location)
+                if not self.camera.isOpened():
+                    self.camera.release()
+                    self.camera = None
+                    messagebox.showerror("Error", "Cannot open camera!")
+                    return
+                self.camera_location = camera_config.location
+            self.camera_preview.start()
             
             self.camera_running = True
             self.start_btn.configure(state="disabled")
             self.stop_btn.configure(state="normal")
             
-            self.status_label.configure(
-                text="🟢 Camera: Running - Fast logging enabled...",
-                text_color="#10b981"
-            )
+            if self.model_warmup and not self.model_warmup.done():
+                self.status_label.configure(
+                    text="🟡 Camera: Running - Loading detection models...",
+                    text_color="#f59e0b"
+                )
+            else:
+                self.status_label.configure(
+                    text="🟢 Camera: Running - Fast logging enabled...",
+                    text_color="#10b981"
+                )
             
             # Start fast detection logging system
             start_detection_logging()
             
+            # New background model for the new session
+            if self.motion_gate:
+                self.motion_gate.reset()
+            if self.plate_tracker:
+                self.plate_tracker.reset()
+            
             # Start detection thread
             self.detection_thread = threading.Thread(target=self._camera_loop, daemon=True)
             self.detection_thread.start()
@@ -269,6 +336,12 @@ class LicensePlatesPage(ctk.CTkFrame):
         """Stop camera"""
         self.camera_running = False
         
+        # Stop capturing and release the cameras; queued frames finish in the background
+        if self.camera_manager:
+            self.camera_manager.stop()
+            self.camera_manager = None
+            self.pipeline = None
+        
         # Stop fast logging system
         stop_detection_logging()
         
@@ -284,7 +357,8 @@ class LicensePlatesPage(ctk.CTkFrame):
             text_color="#ef4444"
         )
         
-        # Reset camera display
+        # Reset camera display (frames still on their way are not painted)
+        self.camera_preview.stop()
         self.camera_label.configure(
             text="📷\n\nCamera stopped\n\nClick 'Start Camera' to resume\nlicense plate detection",
             image=None
@@ -294,25 +368,50 @@ class LicensePlatesPage(ctk.CTkFrame):
     
     def _camera_loop(self):
         """Main camera loop with OCR-enabled detection"""
+        # Wait for the model warm-up on this thread, not the UI thread
+        if self.model_warmup and not self.model_warmup.done():
+            self.model_warmup.exception()  # Blocks until done; load errors surface on first use
+            self.ui_dispatcher.post("status", lambda: self.status_label.configure(
+                text="🟢 Camera: Running - Fast logging enabled...",
+                text_color="#10b981"
+            ))
+        
+        plate_detector = get_plate_detector()
+        self.quality_gate = plate_detector.quality_gate
+        self.ocr_budget = plate_detector.ocr_budget
+        
+        if CAMERA_PIPELINE_ENABLED:
+            self._run_pipeline()
+            return
+        
+        if PLATE_TRACKING_ENABLED and self.plate_tracker is None:
+            self.plate_tracker = PlateTracker(plate_detector, PlateTrackerSettings(**PLATE_TRACKER_SETTINGS),
+                                              camera=self.camera_location)
         
         while self.camera_running and self.camera:
             try:
-                ret, frame = self.camera.read()
-                if not ret:
+                latest = self.camera.read_latest()
+                if latest is None:
                     break
+                frame, captured_at = latest.frame, latest.timestamp
+                
+                # Resize frame for better performance (tiled mode keeps full resolution)
+                if not TILED_DETECTION_ENABLED:
+                    frame = cv2.resize(frame, (640, 480))
                 
-                # Resize frame for better performance
-                frame = cv2.resize(frame, (640, 480))
+                # Only run cascades/OCR where something moved (if motion gate enabled)
+                regions = self.motion_gate.check(frame) if self.motion_gate else None
                 
                 # Detect and read license plates with OCR
-                plate_results = detect_and_read_license_plates(frame)
+                if regions == []:
+                    plate_results = []  # Static frame - nothing new to read
+                elif self.plate_tracker:
+                    plate_results = self.plate_tracker.detect_and_read_plates(frame)
+                else:
+                    plate_results = detect_and_read_license_plates(frame, regions=regions, camera=self.camera_location)
                 
-                # Draw detection boxes with text
-                display_frame = frame.copy()
+                # Process each detected plate
                 if plate_results:
-                    display_frame = plate_detector.draw_plates_with_text(display_frame, plate_results)
-                    
-                    # Process each detected plate
                     for plate_info in plate_results:
                         coordinates = plate_info['coordinates']
                         plate_text = plate_info.get('text')
@@ -325,14 +424,14 @@ class LicensePlatesPage(ctk.CTkFrame):
                             logged = detection_logger.log_detection(
                                 plate_text=plate_text,  # Use actual OCR text
                                 confidence=confidence,   # Use actual OCR confidence
-                                location="Camera",
+                                location=self.camera_location,
                                 coordinates=coordinates
                             )
                             
                             if logged:
                                 print(f"🔤 Logged plate with OCR: '{plate_text}' (conf: {confidence:.2f})")
                                 # Update UI to show recent log activity
-                                self.after(0, self._update_detection_stats)
+                                self.ui_dispatcher.post("detection_stats", self._update_detection_stats)
                             break  # Only process the first valid plate per frame
                         else:
                             # Skip plates without valid OCR text
@@ -340,8 +439,8 @@ class LicensePlatesPage(ctk.CTkFrame):
                                 x, y, w, h = coordinates
                                 print(f"🔍 Plate detected at ({x},{y}) but OCR failed - skipped")
                 
-                # Update camera display in UI thread
-                self.after(0, lambda: self._update_camera_display(display_frame))
+                # Update camera display (throttled; drawn and painted by the preview)
+                self.camera_preview.submit(frame, plate_results, captured_at)
                 
                 # Control frame rate
                 time.sleep(0.1)  # ~10 FPS
@@ -352,28 +451,23 @@ class LicensePlatesPage(ctk.CTkFrame):
         
         print("📹 Camera loop ended")
     
-    def _update_camera_display(self, frame):
-        """Update camera display with current frame"""
-        try:
-            # Convert BGR to RGB
-            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            
-            # Convert to PIL Image
-            pil_image = Image.fromarray(rgb_frame)
-            
-            # Resize to fit display
-            display_size = (400, 300)
-            pil_image = pil_image.resize(display_size, Image.Resampling.LANCZOS)
-            
-            # Convert to CTkImage for better scaling on HighDPI displays
-            ctk_image = ctk.CTkImage(light_image=pil_image, dark_image=pil_image, size=display_size)
-            
-            # Update label
-            self.camera_label.configure(image=ctk_image, text="")
-            self.camera_label.image = ctk_image  # Keep reference
-            
-        except Exception as e:
-            print(f"❌ Display update error: {e}")
+    def _run_pipeline(self):
+        """Run every camera through the capture, detection, OCR and logging stages (slow OCR drops frames, never freezes capture)"""
+        manager = self.camera_manager
+        if not (self.camera_running and manager):
+            return
+        
+        manager.start()
+        self.pipeline = manager.pipeline
+        
+        # _stop_camera stops the cameras; cameras that all stop delivering frames end it
+        manager.join()
+        print(f"📹 Camera pipeline ended: {manager.format_statistics()}")
+    
+    def _on_pipeline_frame(self, item, display_frame):
+        """Show the panel's camera; frames of the other cameras are only logged"""
+        if item.camera == self.camera_location:
+            self.camera_preview.submit(item.frame, item.results, item.captured_at)
     
     def _load_plates_async(self):
         """Load license plates data asynchronously"""
@@ -536,10 +630,34 @@ class LicensePlatesPage(ctk.CTkFrame):
             today_count = detection_logger.get_today_detections_count()
             queue_size = detection_logger.logs_queue.qsize()
             
+            status_text = f"🟢 Camera: Running - {today_count} logged, {queue_size} queued"
+            if self.motion_gate:
+                skipped = self.motion_gate.get_statistics()['frames_skipped']
+                status_text += f", {skipped} static frames skipped"
+            if self.quality_gate:
+                skipped = self.quality_gate.get_statistics()['crops_skipped']
+                status_text += f", {skipped} unreadable crops skipped"
+            if self.ocr_budget:
+                budget_stats = self.ocr_budget.get_statistics()
+                status_text += f", {budget_stats['plates_deferred']} OCR deferred ({budget_stats['budget_overruns']} over budget)"
+            if self.camera_manager and len(self.camera_manager.captures) > 1:
+                status_text += f" | {self.camera_manager.format_statistics()}"
+            elif self.pipeline:
+                pipeline_stats = self.pipeline.get_statistics()
+                dropped = sum(stats.get('dropped', 0) for stats in pipeline_stats.values())
+                status_text += f", {dropped} frames dropped"
+            preview = self.camera_preview.get_statistics()
+            if preview['latency']['frames']:
+                status_text += (f", latency {preview['latency']['median_ms']:.0f} ms "
+                                f"(p95 {preview['latency']['p95_ms']:.0f} ms), preview {preview['paint_ms']:.1f} ms")
+            stale_updates = self.ui_dispatcher.get_dropped()
+            if stale_updates:
+                status_text += f", {stale_updates} stale UI updates skipped"
+            
             # Update the status label to show activity
             if hasattr(self, 'status_label'):
                 self.status_label.configure(
-                    text=f"🟢 Camera: Running - {today_count} logged, {queue_size} queued",
+                    text=status_text,
                     text_color="#10b981"
                 )
             
@@ -581,6 +699,7 @@ class LicensePlatesPage(ctk.CTkFrame):
         """Cleanup when page is destroyed"""
         if self.camera_running:
             self._stop_camera()
+        self.ui_dispatcher.stop()
         
         # Stop logging system
         stop_detection_logging()
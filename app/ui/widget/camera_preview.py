@@ -0,0 +1,167 @@
+import collections
+import threading
+import time
+import cv2
+import numpy as np
+from PIL import Image, ImageTk
+from typing import Dict, List, Optional, Tuple
+from app.services.camera_capture import LatencyMeter
+from app.services.plate.detector import get_plate_detector
+from app.utils.config import PREVIEW_SIZE, PREVIEW_MAX_FPS
+
+
+class CameraPreview:
+    """
+    Camera panel renderer: shrinks frames into reused buffers on the caller's
+    thread, draws the plate boxes on the small buffer and paints it into one
+    persistent PhotoImage on the UI thread, at most max_fps times a second
+    """
+
+    # Scaled frames: one being painted, one waiting to be painted, one being drawn
+    BUFFERS = 3
+
+    def __init__(self, label, size: Tuple[int, int] = PREVIEW_SIZE, max_fps: float = PREVIEW_MAX_FPS,
+                 dispatcher=None):
+        """
+        Args:
+            label: Label (CTkLabel / tk.Label) that shows the preview
+            size: Preview size (width, height)
+            max_fps: Preview updates per second at most (0 = every frame)
+            dispatcher: UIDispatcher that runs the paints; None = label.after()
+        """
+        self.label = label
+        self.dispatcher = dispatcher
+        self.size = tuple(size)
+        self.min_interval = 1.0 / max_fps if max_fps else 0.0
+        width, height = self.size
+        self.bgr_buffers = [np.zeros((height, width, 3), dtype=np.uint8) for _ in range(self.BUFFERS)]
+        self.rgb_buffers = [np.zeros((height, width, 3), dtype=np.uint8) for _ in range(self.BUFFERS)]
+        self.lock = threading.Lock()
+        self.pending: Optional[Tuple[int, Optional[float]]] = None  # (buffer, captured_at) waiting to be painted
+        self.painting: Optional[int] = None
+        self.paint_scheduled = False
+        self.last_render = 0.0
+        self.photo = None
+        self.attached = False
+        self.active = False
+        self.latency = LatencyMeter()
+        self._reset_statistics()
+
+    def _reset_statistics(self):
+        self.frames_submitted = 0
+        self.frames_rendered = 0
+        self.frames_painted = 0
+        self.paint_seconds = 0.0
+        self.max_paint_seconds = 0.0
+        self.paint_times = collections.deque(maxlen=30)
+
+    def start(self):
+        """Accept frames (camera started)"""
+        with self.lock:
+            self.active = True
+            self.attached = False
+            self.pending = None
+            self.last_render = 0.0
+            self._reset_statistics()
+        self.latency = LatencyMeter()
+
+    def stop(self):
+        """Ignore frames and paints still on their way (camera stopped)"""
+        with self.lock:
+            self.active = False
+            self.pending = None
+
+    def submit(self, frame: np.ndarray, plate_results: Optional[List[Dict]] = None,
+               captured_at: Optional[float] = None) -> bool:
+        """
+        Offer a frame from any thread; it is drawn only when a preview update
+        is due. The frame is read, never copied or modified.
+
+        Args:
+            frame: Full-size BGR frame the plates were detected on
+            plate_results: detect_and_read_plates dictionaries to draw
+            captured_at: perf_counter time the frame was grabbed (for the latency)
+
+        Returns:
+            True when the frame will be shown
+        """
+        now = time.perf_counter()
+        with self.lock:
+            if not self.active:
+                return False
+            self.frames_submitted += 1
+            if now - self.last_render < self.min_interval:
+                return False
+            self.last_render = now
+            busy = {self.painting, self.pending[0] if self.pending else None}
+            index = next(i for i in range(self.BUFFERS) if i not in busy)
+
+        bgr, rgb = self.bgr_buffers[index], self.rgb_buffers[index]
+        cv2.resize(frame, self.size, dst=bgr, interpolation=cv2.INTER_AREA)
+        if plate_results:
+            get_plate_detector().draw_plates_with_text(bgr, plate_results, scale=self.size[0] / frame.shape[1],
+                                                       in_place=True)
+        cv2.cvtColor(bgr, cv2.COLOR_BGR2RGB, dst=rgb)
+
+        with self.lock:
+            if not self.active:
+                return False
+            self.frames_rendered += 1
+            self.pending = (index, captured_at)
+            schedule = not self.paint_scheduled
+            self.paint_scheduled = True
+        if self.dispatcher is not None:
+            self.dispatcher.post("preview", self._paint)
+        elif schedule:
+            self.label.after(0, self._paint)
+        return True
+
+    def _paint(self):
+        """UI thread: copy the newest rendered buffer into the PhotoImage"""
+        with self.lock:
+            self.paint_scheduled = False
+            if not self.active or self.pending is None:
+                return
+            index, captured_at = self.pending
+            self.pending = None
+            self.painting = index
+
+        start = time.perf_counter()
+        try:
+            if self.photo is None:
+                self.photo = ImageTk.PhotoImage("RGB", self.size)
+            image = Image.frombuffer("RGB", self.size, self.rgb_buffers[index], "raw", "RGB", 0, 1)
+            self.photo.paste(image)
+            if not self.attached:
+                self.label.configure(image=self.photo, text="")
+                self.label.image = self.photo  # Keep reference
+                self.attached = True
+        except Exception as e:
+            print(f"❌ Display update error: {e}")
+        finally:
+            elapsed = time.perf_counter() - start
+            with self.lock:
+                self.painting = None
+                self.frames_painted += 1
+                self.paint_seconds += elapsed
+                self.max_paint_seconds = max(self.max_paint_seconds, elapsed)
+                self.paint_times.append(start)
+
+        if captured_at is not None:
+            self.latency.record(captured_at)
+
+    def get_statistics(self) -> dict:
+        """Preview fps, UI-thread cost per update and capture-to-display latency"""
+        with self.lock:
+            paint_times = list(self.paint_times)
+            stats = {
+                'frames_submitted': self.frames_submitted,
+                'frames_rendered': self.frames_rendered,
+                'frames_painted': self.frames_painted,
+                'paint_ms': round(self.paint_seconds / self.frames_painted * 1000, 2) if self.frames_painted else 0.0,
+                'max_paint_ms': round(self.max_paint_seconds * 1000, 2)
+            }
+        span = paint_times[-1] - paint_times[0] if len(paint_times) > 1 else 0.0
+        stats['preview_fps'] = round((len(paint_times) - 1) / span, 1) if span > 0 else 0.0
+        stats['latency'] = self.latency.get_statistics()
+        return stats
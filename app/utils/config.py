@@ -3,3 +3,121 @@ DB_HOST = "localhost"
 DB_USER = "root"
 DB_PASSWORD = ""
 DB_NAME = "license_plate_detection"
+
+# Bulk re-validation of stored plates (python migrate.py revalidate)
+PLATE_REVALIDATION_CHUNK_SIZE = 5000  # Rows read and committed per chunk
+PLATE_REVALIDATION_CHECKPOINT = "app/data/plate_revalidation.json"  # Resume point of an interrupted run
+
+# Motion gate: skip plate detection and OCR on static camera frames
+MOTION_GATE_ENABLED = False
+# Thresholds per camera location ("default" applies to every camera)
+# Keys: downscale_width, diff_threshold, min_motion_ratio, background_alpha,
+#       region_padding, full_frame_ratio, warmup_frames
+MOTION_GATE_SETTINGS = {
+    "default": {
+        "diff_threshold": 25,
+        "min_motion_ratio": 0.002
+    }
+}
+
+# Plate tracker: full-frame detection every N frames, search windows in between
+PLATE_TRACKING_ENABLED = False
+# Keys: full_detection_interval, search_margin, match_iou, max_misses,
+#       velocity_smoothing, ocr_interval
+PLATE_TRACKER_SETTINGS = {
+    "full_detection_interval": 5
+}
+
+# Batch (back-fill) detection process pool
+BATCH_DETECTION_WORKERS = None  # None = one worker per CPU core
+BATCH_DETECTION_CHUNK_SIZE = 4  # Frames handed to a worker per task
+
+# Tiled detection for high-resolution frames (1080p/4K cameras)
+TILED_DETECTION_ENABLED = False  # Detect at full camera resolution instead of 640x480
+TILE_SIZE = (640, 480)  # Tile width, height in pixels
+TILE_OVERLAP = 160  # Pixels shared by neighbouring tiles (>= largest expected plate height)
+TILE_WORKERS = None  # Threads for tiles (None = one per CPU core)
+
+# Plate scores (0-1, from cascade level weights); lower-scoring boxes skip OCR
+MIN_PLATE_SCORE = 0.0  # 0.0 = read every detected plate
+
+# Crop quality gate: skip blurry / tiny / low-contrast plate crops instead of reading them;
+# tracked plates wait up to window_frames for their sharpest crop
+CROP_QUALITY_GATE_ENABLED = False
+# Keys: min_sharpness, min_height, min_contrast, good_sharpness, window_frames
+CROP_QUALITY_SETTINGS = {
+    "min_sharpness": 150.0,
+    "window_frames": 5
+}
+
+# Per-frame OCR time budget: plates are read new-first, then by score and size; the rest wait a frame
+OCR_FRAME_BUDGET_ENABLED = False
+OCR_FRAME_BUDGET_MS = 150  # OCR time allowed per frame
+
+# Bordered-plate contour search: run its edge pass at most this wide (None = full resolution)
+BORDERED_EDGE_MAX_WIDTH = None
+
+# Load the plate detector and OCR reader on a background thread when the plates page opens
+MODEL_WARMUP_ENABLED = True
+
+# OCR: skip EasyOCR's text detector and recognize the whole plate crop as one line
+OCR_RECOGNIZER_ONLY = False
+
+# OCR preprocessing: scale plate crops so characters are about this many pixels tall
+OCR_TARGET_CHAR_HEIGHT = 48
+# Crops a camera's remembered threshold method is used for before it is chosen again
+OCR_THRESHOLD_RECHECK_INTERVAL = 50
+
+# Fast OCR path: segment the binarized crop and classify each character (kNN over HOG features);
+# reads that fail PlateValidator or score below the confidence fall back to EasyOCR.
+# Train with: python -m app.services.char_ocr <labelled crops dir>
+FAST_OCR_ENABLED = False
+FAST_OCR_MODEL_PATH = "app/models/plate_chars.npz"
+FAST_OCR_MIN_CONFIDENCE = 0.8  # Share of neighbours agreeing on the weakest character
+
+# OCR worker processes: EasyOCR runs outside the UI process; crops are passed through shared memory
+OCR_PROCESS_POOL_ENABLED = False
+OCR_POOL_WORKERS = 1  # Worker processes (each loads its own EasyOCR reader)
+OCR_POOL_TORCH_THREADS = 1  # torch threads per worker
+OCR_POOL_OPENCV_THREADS = 1  # OpenCV threads per worker
+
+# Batched OCR: plate crops from all frames/cameras share recognition passes
+OCR_BATCHING_ENABLED = False
+OCR_BATCH_SIZE = 8  # Crops per recognition pass
+OCR_BATCH_MAX_WAIT_MS = 10  # Longest a crop waits for a fuller batch
+
+# OCR result cache for repeated crops of the same plate (parked / slow cars)
+OCR_CACHE_SIZE = 64  # Cached reads (0 = disabled)
+OCR_CACHE_MAX_AGE_SECONDS = 5.0  # Re-read a plate at least this often
+OCR_CACHE_MAX_DISTANCE = 4  # Perceptual hash bits (of 64) two crops may differ in
+
+# Camera pipeline: capture, detection, OCR and logging/display run as separate stages joined by
+# bounded queues (oldest frame dropped when a queue is full), so a slow OCR call never stalls capture
+CAMERA_PIPELINE_ENABLED = True  # False = original single-thread camera loop
+PIPELINE_QUEUE_SIZE = 2  # Frames waiting in front of each stage
+PIPELINE_DETECT_WORKERS = 1  # Detection threads (with plate tracking: at most one per camera)
+PIPELINE_OCR_WORKERS = 1  # OCR threads
+PIPELINE_DETECT_PROCESSES = False  # Detect in worker processes instead of threads
+
+# Latest-frame capture: a thread drains the camera and keeps only the newest frame, so detection
+# always works on the current frame instead of one that waited in the driver's buffer
+LATEST_FRAME_CAPTURE_ENABLED = True
+CAPTURE_READ_TIMEOUT_SECONDS = 2.0  # Longest a reader waits for a new frame before the camera counts as gone
+CAPTURE_MAX_FAILED_READS = 50  # Failed reads in a row that end the capture
+
+# Cameras served by one process (one entry per lane). source: camera index or video file / stream URL;
+# location: name in the detection log. Their frames share the pipeline's detect and OCR workers.
+CAMERAS = [
+    {"source": 0, "location": "Camera"},
+    # {"source": 1, "location": "Lane 2"},
+    # {"source": "rtsp://192.168.1.20/stream1", "location": "Gate"},
+]
+
+# Camera panel preview: frames are shrunk into a reused buffer and painted into one PhotoImage,
+# at most PREVIEW_MAX_FPS times a second whatever the detection frame rate
+PREVIEW_SIZE = (400, 300)  # (width, height)
+PREVIEW_MAX_FPS = 15
+
+# UI dispatcher: background threads post camera-panel updates into latest-value slots that one
+# main-thread tick drains, so a busy UI skips stale updates instead of queueing them
+UI_TICK_MS = 33  # Main-thread tick interval (~30 updates per second at most)
@@ -4,7 +4,43 @@ Validates Philippine license plate formats with OCR error tolerance
 """
 
 import re
-from typing import Optional
+from functools import lru_cache
+from typing import Iterable, List, Optional
+
+# OCR confusions: the numeric group reads letters as digits, the letter group digits as letters
+NUMERIC_FIXES = str.maketrans('OISJGBZT', '01516827')
+ALPHA_FIXES = str.maketrans('01546827', 'OISAGBZT')
+
+# ### XXX (numeric_alpha) or XXX ### (alpha_numeric); ASCII only
+PLATE_PATTERN = re.compile(r'(?:([0-9]{3}) [A-Z]{3})|(?:[A-Z]{3} [0-9]{3})')
+
+# Distinct texts whose validation result is remembered (the same plate is read frame after frame)
+VALIDATION_CACHE_SIZE = 4096
+
+INVALID_RESULT = (False, None, "invalid")
+
+
+@lru_cache(maxsize=VALIDATION_CACHE_SIZE)
+def _validate_text(plate_text: str) -> tuple[bool, Optional[str], str]:
+    """
+    One decoding pass over a plate text: put it in "xxx xxx" form, then
+    accept it as is or with the OCR confusions of each group fixed
+    """
+    clean_text = plate_text.strip().upper()
+    
+    # "ABC123" gets its space; anything else must already be "xxx xxx"
+    if len(clean_text) == 6 and ' ' not in clean_text:
+        clean_text = f"{clean_text[:3]} {clean_text[3:]}"
+    elif len(clean_text) != 7 or clean_text[3] != ' ' or clean_text.count(' ') != 1:
+        return INVALID_RESULT
+    
+    for candidate in (clean_text, clean_text[:3].translate(NUMERIC_FIXES) + ' ' +
+                      clean_text[4:].translate(ALPHA_FIXES)):
+        match = PLATE_PATTERN.fullmatch(candidate)
+        if match:
+            return True, candidate, "numeric_alpha" if match.group(1) else "alpha_numeric"
+    
+    return INVALID_RESULT
 
 class PlateValidator:
     """License plate validator with OCR error tolerance"""
@@ -16,28 +52,28 @@ class PlateValidator:
         Returns: (is_valid, normalized_text, plate_type)
         """
         if not plate_text or not isinstance(plate_text, str):
-            return False, None, "invalid"
-        
-        # Clean input
-        clean_text = plate_text.strip().upper()
-        
-        # Basic length check
-        if len(clean_text) < 6 or len(clean_text) > 7:
-            return False, None, "invalid"
-        
-        # Try multiple correction strategies
-        candidates = [
-            clean_text,  # Original
-            cls._fix_spacing(clean_text),  # Fix spacing
-            cls._fix_ocr_errors(clean_text),  # Fix OCR errors
-            cls._fix_ocr_errors(cls._fix_spacing(clean_text))  # Both
-        ]
-        
-        for candidate in candidates:
-            if cls._is_valid_format(candidate):
-                return True, candidate, cls._get_plate_type(candidate)
-        
-        return False, None, "invalid"
+            return INVALID_RESULT
+        return _validate_text(plate_text)
+    
+    @classmethod
+    def validate_many(cls, plate_texts: Iterable[str]) -> List[tuple[bool, Optional[str], str]]:
+        """
+        Validate and normalize many plate texts at once (e.g. a chunk of database rows)
+        Each distinct text is decoded once; results come back in input order.
+        Returns: [(is_valid, normalized_text, plate_type), ...]
+        """
+        decoded = {}
+        results = []
+        for plate_text in plate_texts:
+            if not plate_text or not isinstance(plate_text, str):
+                results.append(INVALID_RESULT)
+                continue
+            result = decoded.get(plate_text)
+            if result is None:
+                # Uncached engine: a bulk pass would only evict the live reads from the LRU
+                result = decoded[plate_text] = _validate_text.__wrapped__(plate_text)
+            results.append(result)
+        return results
     
     @classmethod
     def _fix_spacing(cls, text: str) -> str:
@@ -50,101 +86,25 @@ class PlateValidator:
     
     @classmethod
     def _fix_ocr_errors(cls, text: str) -> str:
-        """Fix common OCR errors"""
-        if ' ' not in text:
-            return text
-        
+        """Fix common OCR errors (first group toward digits, second toward letters)"""
         parts = text.split(' ')
         if len(parts) != 2 or len(parts[0]) != 3 or len(parts[1]) != 3:
             return text
         
-        part1, part2 = parts
-        
-        # Fix first part to be more numeric
-        part1_fixed = ""
-        for char in part1:
-            if char == 'O':
-                part1_fixed += '0'  # O -> 0
-            elif char == 'I':
-                part1_fixed += '1'  # I -> 1
-            elif char == 'S':
-                part1_fixed += '5'  # S -> 5
-            elif char == 'J':
-                part1_fixed += '1'  # J -> 1 (common OCR error)
-            elif char == 'G':
-                part1_fixed += '6'  # G -> 6
-            elif char == 'B':
-                part1_fixed += '8'  # B -> 8
-            elif char == 'Z':
-                part1_fixed += '2'  # Z -> 2
-            elif char == 'T':
-                part1_fixed += '7'  # T -> 7
-            else:
-                part1_fixed += char
-        
-        # Fix second part to be more alphabetic
-        part2_fixed = ""
-        for char in part2:
-            if char == '0':
-                part2_fixed += 'O'  # 0 -> O
-            elif char == '1':
-                part2_fixed += 'I'  # 1 -> I
-            elif char == '5':
-                part2_fixed += 'S'  # 5 -> S
-            elif char == '4':
-                part2_fixed += 'A'  # 4 -> A (common OCR error)
-            elif char == '6':
-                part2_fixed += 'G'  # 6 -> G
-            elif char == '8':
-                part2_fixed += 'B'  # 8 -> B
-            elif char == '2':
-                part2_fixed += 'Z'  # 2 -> Z
-            elif char == '7':
-                part2_fixed += 'T'  # 7 -> T
-            else:
-                part2_fixed += char
-        
-        return f"{part1_fixed} {part2_fixed}"
+        return f"{parts[0].translate(NUMERIC_FIXES)} {parts[1].translate(ALPHA_FIXES)}"
     
     @classmethod
     def _is_valid_format(cls, text: str) -> bool:
         """Check if text matches valid Philippine license plate format"""
-        if not text or ' ' not in text:
-            return False
-        
-        parts = text.split(' ')
-        if len(parts) != 2:
-            return False
-        
-        part1, part2 = parts
-        if len(part1) != 3 or len(part2) != 3:
-            return False
-        
-        # Check for invalid characters (no dashes, underscores, etc.)
-        if re.search(r'[^A-Z0-9\s]', text):
-            return False
-        
-        # Must match either ### XXX or XXX ### format
-        pattern1 = r'^[0-9]{3}\s[A-Z]{3}$'  # 123 ABC
-        pattern2 = r'^[A-Z]{3}\s[0-9]{3}$'  # ABC 123
-        
-        return bool(re.match(pattern1, text) or re.match(pattern2, text))
+        return bool(text) and PLATE_PATTERN.fullmatch(text) is not None
     
     @classmethod
     def _get_plate_type(cls, text: str) -> str:
         """Get plate type"""
-        if not cls._is_valid_format(text):
+        match = PLATE_PATTERN.fullmatch(text) if text else None
+        if not match:
             return "invalid"
-        
-        parts = text.split(' ')
-        part1, part2 = parts
-        
-        if re.match(r'^[0-9]{3}$', part1) and re.match(r'^[A-Z]{3}$', part2):
-            return "numeric_alpha"  # 123 ABC
-        elif re.match(r'^[A-Z]{3}$', part1) and re.match(r'^[0-9]{3}$', part2):
-            return "alpha_numeric"  # ABC 123
-        else:
-            return "unknown"
+        return "numeric_alpha" if match.group(1) else "alpha_numeric"
 
 # Convenience functions for backward compatibility
 def is_valid_plate(plate_text: str) -> bool:
@@ -0,0 +1,47 @@
+"""
+Benchmark: sequential detect_plates vs process-pool batch detection
+
+Usage (from the repository root):
+    python -m benchmarks.bench_batch [--frames 40] [--workers 1 2 4] [--chunk-size 4]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import time
+from benchmarks.common import make_plate_frames, measure_fps
+from app.services.plate.batch import BatchPlateDetector
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--frames", type=int, default=40)
+    parser.add_argument("--workers", type=int, nargs="+", default=None)
+    parser.add_argument("--chunk-size", type=int, default=4)
+    args = parser.parse_args()
+
+    cpu_count = os.cpu_count() or 1
+    worker_counts = args.workers or sorted({1, max(1, cpu_count // 2), cpu_count})
+    frames = make_plate_frames(args.frames)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        from app.services.plate.detector import plate_detector
+        sequential_fps = measure_fps(plate_detector.detect_plates, frames)
+
+    print(f"📐 {len(frames)} synthetic 640x480 frames, {cpu_count} CPU cores, chunk size {args.chunk_size}")
+    print(f"Sequential (UI process): {sequential_fps:7.2f} fps")
+
+    for workers in worker_counts:
+        with contextlib.redirect_stdout(io.StringIO()):
+            with BatchPlateDetector(workers=workers, chunk_size=args.chunk_size) as batch_detector:
+                batch_detector.detect_plates_batch(frames[:workers])  # Start and warm the workers
+                start = time.perf_counter()
+                batch_detector.detect_plates_batch(frames)
+                elapsed = time.perf_counter() - start
+        fps = len(frames) / elapsed
+        print(f"Batch, {workers:2d} worker(s):    {fps:7.2f} fps   ({fps / sequential_fps:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Benchmark: per-ROI Canny bordered-plate search vs one edge map + integral image
+
+Usage (from the repository root):
+    python -m benchmarks.bench_bordered [--frames 10] [--width 1280] [--height 720] [--clutter 400]
+"""
+
+import argparse
+import cv2
+import numpy as np
+from benchmarks.common import make_plate_frame, measure_fps
+from app.services.plate.bordered import find_bordered_plates
+from app.services.plate.nms import iou_matrix
+
+
+def legacy_bordered_plates(gray_frame):
+    """Original PlateDetector._detect_bordered_plates (second Canny pass per candidate)"""
+    edges = cv2.Canny(gray_frame, 50, 150, apertureSize=3)
+    kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (3, 3))
+    edges = cv2.morphologyEx(edges, cv2.MORPH_CLOSE, kernel)
+    contours, _ = cv2.findContours(edges, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+
+    plate_candidates = []
+    for contour in contours:
+        x, y, w, h = cv2.boundingRect(contour)
+        aspect_ratio = w / h if h > 0 else 0
+        area = w * h
+        if 2.0 <= aspect_ratio <= 5.0 and 1000 <= area <= 50000 and w >= 80 and h >= 20:
+            roi = gray_frame[y:y+h, x:x+w]
+            if roi.size > 0:
+                roi_edges = cv2.Canny(roi, 50, 150)
+                if cv2.countNonZero(roi_edges) > (w * h * 0.05):
+                    plate_candidates.append((x, y, w, h))
+
+    plate_candidates.sort(key=lambda p: p[2] * p[3], reverse=True)
+    return plate_candidates
+
+
+def make_cluttered_frame(width: int, height: int, clutter: int, seed: int) -> np.ndarray:
+    """Plate frame with up to `clutter` extra bordered, text-filled boxes on a grid (many separate contours)"""
+    rng = np.random.default_rng(seed)
+    # Smooth background; sensor noise would merge every box into one frame-sized contour
+    frame = cv2.GaussianBlur(make_plate_frame(width, height, plates=0, seed=seed), (9, 9), 0)
+    cell_w, cell_h = 110, 44
+    cells = [(cx, cy) for cy in range(0, height - cell_h, cell_h) for cx in range(0, width - cell_w, cell_w)]
+    for i in rng.permutation(len(cells))[:clutter]:
+        cx, cy = cells[i]
+        # Mix of plate-sized boxes and small junk boxes that fail the size filters
+        w = int(rng.integers(40, cell_w - 10))
+        h = int(rng.integers(14, cell_h - 8))
+        x, y = cx + 4, cy + 4
+        shade = int(rng.integers(150, 250))
+        cv2.rectangle(frame, (x, y), (x + w, y + h), (shade, shade, shade), -1)
+        cv2.rectangle(frame, (x, y), (x + w, y + h), (20, 20, 20), 2)
+        cv2.putText(frame, f"{i:03d}", (x + 4, y + h - 4), cv2.FONT_HERSHEY_SIMPLEX,
+                    h / 40.0, (10, 10, 10), 1)
+    return frame
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--frames", type=int, default=10)
+    parser.add_argument("--width", type=int, default=1280)
+    parser.add_argument("--height", type=int, default=720)
+    parser.add_argument("--clutter", type=int, default=400)
+    parser.add_argument("--edge-width", type=int, default=640, help="Width for the downscaled edge pass")
+    args = parser.parse_args()
+
+    frames = [cv2.cvtColor(make_cluttered_frame(args.width, args.height, args.clutter, seed), cv2.COLOR_BGR2GRAY)
+              for seed in range(args.frames)]
+    contours = np.mean([
+        len(cv2.findContours(cv2.morphologyEx(cv2.Canny(gray, 50, 150), cv2.MORPH_CLOSE, np.ones((3, 3), np.uint8)),
+                             cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)[0])
+        for gray in frames
+    ])
+    print(f"📐 {len(frames)} cluttered frames at {args.width}x{args.height}, ~{contours:.0f} contours per frame")
+
+    legacy_fps = measure_fps(legacy_bordered_plates, frames)
+    integral_fps = measure_fps(lambda gray: find_bordered_plates(gray, max_candidates=None), frames)
+    downscaled_fps = measure_fps(lambda gray: find_bordered_plates(gray, args.edge_width, max_candidates=None), frames)
+
+    # Candidate agreement with the per-ROI Canny version (all candidates, not just the top 3)
+    same = total = top_same = down_matched = down_total = 0
+    for gray in frames:
+        before = set(legacy_bordered_plates(gray))
+        after_list, _ = find_bordered_plates(gray, max_candidates=None)
+        after = set(after_list)
+        same += len(before & after)
+        total += len(before | after)
+        top_same += legacy_bordered_plates(gray)[:3] == after_list[:3]
+
+        # Downscaled boxes are rescaled, so compare by IoU
+        downscaled, _ = find_bordered_plates(gray, args.edge_width, max_candidates=None)
+        down_total += len(before)
+        if before and downscaled:
+            ious = iou_matrix(np.array(list(before) + downscaled))[:len(before), len(before):]
+            down_matched += int((ious.max(axis=1) >= 0.5).sum())
+
+    print(f"Per-ROI Canny:             {legacy_fps:7.2f} fps")
+    print(f"Edge map + integral image: {integral_fps:7.2f} fps   ({integral_fps / legacy_fps:.2f}x)")
+    print(f"Downscaled edges ({args.edge_width}px):  {downscaled_fps:7.2f} fps   ({downscaled_fps / legacy_fps:.2f}x)")
+    print(f"Identical candidates: {same}/{total}, identical top 3: {top_same}/{len(frames)} frames")
+    print(f"Downscaled pass finds {down_matched}/{down_total} full-resolution candidates (IoU >= 0.5)")
+
+
+if __name__ == "__main__":
+    main()
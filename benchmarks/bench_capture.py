@@ -0,0 +1,118 @@
+"""
+Benchmark: frame staleness with direct cv2.VideoCapture reads vs LatestFrameCapture
+
+A simulated camera produces a frame every 1/--camera-fps seconds into a
+driver buffer of --buffer frames (like V4L2/DirectShow); read() returns the
+oldest buffered frame. The consumer spends --work-ms per frame (detection
+and OCR). Reports how old each frame is when the consumer gets it and when
+it has been "displayed".
+
+Usage (from the repository root):
+    python -m benchmarks.bench_capture [--seconds 5] [--camera-fps 30] [--work-ms 200] [--buffer 32]
+"""
+
+import argparse
+import collections
+import contextlib
+import io
+import threading
+import time
+import numpy as np
+from benchmarks.common import make_plate_frame
+from app.services.camera_capture import LatestFrameCapture, LatencyMeter
+
+
+class BufferedCamera:
+    """cv2.VideoCapture stand-in: frames arrive at a fixed rate into a bounded FIFO driver buffer"""
+
+    def __init__(self, fps: float, buffer: int):
+        self.interval = 1.0 / fps
+        self.buffer = collections.deque(maxlen=buffer)
+        self.condition = threading.Condition()
+        self.frame = make_plate_frame(seed=3)
+        self.running = True
+        threading.Thread(target=self._produce, daemon=True).start()
+
+    def _produce(self):
+        next_time = time.perf_counter()
+        while self.running:
+            next_time += self.interval
+            time.sleep(max(0.0, next_time - time.perf_counter()))
+            with self.condition:
+                self.buffer.append(time.perf_counter())  # Exposure time of the frame
+                self.condition.notify_all()
+
+    def read(self):
+        with self.condition:
+            if not self.condition.wait_for(lambda: self.buffer or not self.running, 1.0) or not self.buffer:
+                return False, None
+            self.last_exposure = self.buffer.popleft()
+        return True, self.frame
+
+    def isOpened(self):
+        return True
+
+    def release(self):
+        self.running = False
+
+
+def run(latest: bool, args) -> dict:
+    """Consume for args.seconds; returns exposure-to-pickup and exposure-to-display ages (ms)"""
+    camera = BufferedCamera(args.camera_fps, args.buffer)
+    # Exposure time of each frame the capture thread grabbed, by frame id
+    exposures = {}
+    if latest:
+        original_read = camera.read
+
+        def read_and_record():
+            ret, frame = original_read()
+            if ret:
+                exposures[capture.frames_grabbed + 1] = camera.last_exposure
+            return ret, frame
+        camera.read = read_and_record
+        capture = LatestFrameCapture(camera, "Bench").start()
+
+    pickup_ms, meter = [], LatencyMeter(window=10000)
+    end = time.perf_counter() + args.seconds
+    while time.perf_counter() < end:
+        if latest:
+            item = capture.read_latest()
+            if item is None:
+                break
+            exposure = exposures.get(item.frame_id, item.timestamp)
+        else:
+            ret, _ = camera.read()
+            if not ret:
+                break
+            exposure = camera.last_exposure
+        pickup_ms.append((time.perf_counter() - exposure) * 1000.0)
+        time.sleep(args.work_ms / 1000.0)
+        meter.record(exposure)
+
+    if latest:
+        capture.release()
+    else:
+        camera.release()
+    return {'pickup_ms': np.array(pickup_ms), 'display': meter.get_statistics()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--camera-fps", type=float, default=30.0)
+    parser.add_argument("--work-ms", type=float, default=200.0, help="Detection + OCR time per frame")
+    parser.add_argument("--buffer", type=int, default=32, help="Driver buffer (frames)")
+    args = parser.parse_args()
+
+    print(f"📐 {args.seconds:.0f} s, {args.camera_fps:.0f} fps camera, {args.buffer}-frame buffer, "
+          f"{args.work_ms:.0f} ms per frame")
+    for label, latest in (("Direct", False), ("Latest", True)):
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = run(latest, args)
+        pickup, display = result['pickup_ms'], result['display']
+        print(f"{label:7s} frame age at pickup: median {np.median(pickup):7.1f} ms, max {pickup.max():7.1f} ms   "
+              f"capture-to-display: median {display['median_ms']:7.1f} ms, p95 {display['p95_ms']:7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
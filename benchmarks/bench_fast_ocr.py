@@ -0,0 +1,122 @@
+"""
+Benchmark: fast character-classifier OCR path vs EasyOCR
+
+Trains the character classifier on synthetic labelled plate crops (the
+OpenCV Hershey font stands in for the plate font), then reads held-out
+crops, clean and degraded, through LicensePlateOCR.extract_text. Reports
+the share of reads served by the fast path, how many of those were right,
+and the latency of each path. EasyOCR numbers need the model files;
+without them the crops the fast path rejects stay unread.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_fast_ocr [--train 150] [--test 60]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import tempfile
+import time
+import cv2
+import numpy as np
+from typing import List, Tuple
+from benchmarks.bench_ocr_recognizer import make_plate_crop
+from app.services.char_ocr import CharacterClassifier, FastPlateReader, collect_training_samples
+
+LETTERS = "ABCDEFGHJKLMNPRSTUVWXYZ"
+DIGITS = "0123456789"
+
+
+def random_plate_text(rng: np.random.Generator) -> str:
+    """A plate number in one of the ### XXX / XXX ### formats"""
+    letters = ''.join(rng.choice(list(LETTERS), 3))
+    digits = ''.join(rng.choice(list(DIGITS), 3))
+    return f"{letters} {digits}" if rng.random() < 0.5 else f"{digits} {letters}"
+
+
+def degrade(crop: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """Motion blur, low contrast or a small, upscaled crop"""
+    kind = int(rng.integers(0, 3))
+    if kind == 0:
+        length = int(rng.integers(7, 13))
+        kernel = np.zeros((length, length), np.float32)
+        kernel[length // 2, :] = 1.0 / length
+        return cv2.filter2D(crop, -1, kernel)
+    if kind == 1:
+        return (crop.astype(np.float32) * 0.35 + 110).astype(np.uint8)
+    small = cv2.resize(crop, (crop.shape[1] // 3, crop.shape[0] // 3), interpolation=cv2.INTER_AREA)
+    return cv2.resize(small, (crop.shape[1], crop.shape[0]), interpolation=cv2.INTER_LINEAR)
+
+
+def make_test_set(count: int, seed: int) -> List[Tuple[np.ndarray, str, bool]]:
+    """Held-out crops: (crop, text, degraded); every third crop is degraded"""
+    rng = np.random.default_rng(seed)
+    crops = []
+    for i in range(count):
+        text = random_plate_text(rng)
+        crop = make_plate_crop(text, seed + i)
+        degraded = i % 3 == 2
+        crops.append((degrade(crop, rng) if degraded else crop, text, degraded))
+    return crops
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--train", type=int, default=150, help="Labelled training crops")
+    parser.add_argument("--test", type=int, default=60, help="Held-out crops")
+    args = parser.parse_args()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        from app.services.ocr_service import LicensePlateOCR
+        ocr = LicensePlateOCR(process_pool=False, cache_size=0, fast_path=False)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        crop_dir = os.path.join(workdir, "crops")
+        os.makedirs(crop_dir)
+        rng = np.random.default_rng(1)
+        for i in range(args.train):
+            text = random_plate_text(rng)
+            cv2.imwrite(os.path.join(crop_dir, f"{text.replace(' ', '')}_{i:04d}.png"), make_plate_crop(text, 1000 + i))
+
+        start = time.perf_counter()
+        masks, labels, used, skipped = collect_training_samples(crop_dir, ocr)
+        classifier = CharacterClassifier.train(masks, labels)
+        model_path = os.path.join(workdir, "plate_chars.npz")
+        classifier.save(model_path)
+        print(f"📐 Trained on {len(masks)} characters from {used} crops ({skipped} skipped) "
+              f"in {time.perf_counter() - start:.1f} s")
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            ocr.fast_reader = FastPlateReader.load(model_path)
+
+    test_set = make_test_set(args.test, 5000)
+    per_kind = {False: [0, 0, 0], True: [0, 0, 0]}  # crops, fast reads, correct fast reads
+    fallback_seconds = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for crop, text, degraded in test_set:
+            fast_reads = ocr.fast_reads
+            start = time.perf_counter()
+            result, _ = ocr.extract_text(crop, (0, 0, crop.shape[1], crop.shape[0]))
+            seconds = time.perf_counter() - start
+            per_kind[degraded][0] += 1
+            if ocr.fast_reads > fast_reads:
+                per_kind[degraded][1] += 1
+                per_kind[degraded][2] += result == text
+            elif ocr.reader is not None:
+                fallback_seconds.append(seconds)
+
+    stats = ocr.get_statistics()
+    for degraded, (crops, fast, correct) in per_kind.items():
+        label = "Degraded" if degraded else "Clean"
+        print(f"{label:9s} {crops:3d} crops: fast path read {fast:3d} ({fast / max(1, crops) * 100:5.1f}%), "
+              f"{correct} correct")
+    print(f"Fast path: {stats['fast_path_share']}% of reads, {stats['fast_path_avg_ms']} ms per attempt")
+    if fallback_seconds:
+        print(f"EasyOCR fallback: {len(fallback_seconds)} reads, {np.mean(fallback_seconds) * 1000:.1f} ms per read")
+    else:
+        print("⚠️ EasyOCR reader unavailable - rejected crops were not read")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Benchmark: several cameras sharing one pool of detect/OCR workers
+
+--cameras simulated cameras; the first one delivers --busy-fps, the rest
+--camera-fps. Runs the plate pipeline with one shared FIFO queue per stage
+and with per-camera lanes (FairFrameQueue), and reports frames shown,
+latency and drops per camera. Without the EasyOCR model files each read is
+simulated as --ocr-ms of work.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_multicamera [--cameras 3] [--seconds 5] [--busy-fps 60] [--ocr-workers 2]
+"""
+
+import argparse
+import contextlib
+import io
+import time
+from unittest import mock
+from benchmarks.common import make_plate_frames
+from app.services import pipeline as pipeline_module
+from app.services.plate import detector as detector_module
+from app.services.pipeline import PlateFrame, build_plate_pipeline
+
+
+class SimulatedCamera:
+    """Pipeline source returning synthetic PlateFrames of one camera at a fixed rate for `seconds`"""
+
+    def __init__(self, location: str, frames, fps: float, seconds: float):
+        self.location = location
+        self.frames = frames
+        self.interval = 1.0 / fps
+        self.end = time.perf_counter() + seconds
+        self.next_time = time.perf_counter()
+        self.frame_id = 0
+
+    def __call__(self):
+        delay = self.next_time - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        self.next_time += self.interval
+        if time.perf_counter() >= self.end:
+            return None
+        self.frame_id += 1
+        return PlateFrame(self.frame_id, self.location, time.perf_counter(), self.frames[self.frame_id % len(self.frames)])
+
+
+def run(args, frames, fair: bool) -> dict:
+    cameras = [SimulatedCamera(f"Lane {i + 1}", frames, args.busy_fps if i == 0 else args.camera_fps, args.seconds)
+               for i in range(args.cameras)]
+    queue_class = pipeline_module.FairFrameQueue if fair else pipeline_module.FrameQueue
+    with mock.patch.object(pipeline_module, 'FairFrameQueue', queue_class):
+        pipeline = build_plate_pipeline(cameras, ocr_workers=args.ocr_workers, log=False)
+    pipeline.start()
+    pipeline.join()
+    sink = pipeline.stages[-1].handler
+    return {camera.location: dict(sink.get_camera_statistics().get(camera.location, {'frames': 0, 'latency_ms': 0.0}),
+                                  captured=camera.frame_id)
+            for camera in cameras}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cameras", type=int, default=3)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--camera-fps", type=float, default=15.0)
+    parser.add_argument("--busy-fps", type=float, default=60.0, help="Frame rate of the first camera")
+    parser.add_argument("--ocr-ms", type=float, default=40, help="Simulated read time without EasyOCR")
+    parser.add_argument("--ocr-workers", type=int, default=2)
+    args = parser.parse_args()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        ocr_available = detector_module.is_ocr_available()
+    if not ocr_available:
+        print(f"⚠️ EasyOCR reader unavailable - simulating {args.ocr_ms:.0f} ms per read")
+
+        def simulated_read(image, plate_coords, camera=None):
+            time.sleep(args.ocr_ms / 1000.0)
+            return None, 0.0
+        detector_module.is_ocr_available = lambda: True
+        detector_module.extract_plate_text = simulated_read
+
+    frames = make_plate_frames(20)
+    with contextlib.redirect_stdout(io.StringIO()):
+        pipeline_module.get_plate_detector().detect_plates_with_scores(frames[0])
+    print(f"📐 {args.cameras} cameras ({args.busy_fps:.0f} fps + {args.camera_fps:.0f} fps), "
+          f"{args.ocr_workers} OCR worker(s), {args.seconds:.0f} s")
+
+    for label, fair in (("Shared FIFO", False), ("Per-camera", True)):
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = run(args, frames, fair)
+        print(label)
+        for location, stats in result.items():
+            print(f"  {location:8s} shown {stats['frames']:4d}/{stats['captured']:4d} frames   "
+                  f"latency {stats['latency_ms']:7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
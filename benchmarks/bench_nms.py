@@ -0,0 +1,77 @@
+"""
+Benchmark: per-pair IoU loop NMS vs vectorized NMS at 10, 100 and 1000 boxes
+
+Usage (from the repository root):
+    python -m benchmarks.bench_nms
+"""
+
+import numpy as np
+from benchmarks.common import time_call
+from app.services.plate.nms import nms_indices
+
+
+def calculate_iou(box1, box2) -> float:
+    """Original PlateDetector._calculate_iou"""
+    x1, y1, w1, h1 = box1
+    x2, y2, w2, h2 = box2
+    x_left, y_top = max(x1, x2), max(y1, y2)
+    x_right, y_bottom = min(x1 + w1, x2 + w2), min(y1 + h1, y2 + h2)
+    if x_right < x_left or y_bottom < y_top:
+        return 0.0
+    intersection = (x_right - x_left) * (y_bottom - y_top)
+    union = w1 * h1 + w2 * h2 - intersection
+    return intersection / union if union > 0 else 0.0
+
+
+def legacy_nms(plates, overlap_threshold=0.3):
+    """Original PlateDetector._filter_overlapping_plates (Python per-pair loop)"""
+    if len(plates) <= 1:
+        return plates
+    boxes = np.array(plates)
+    areas = boxes[:, 2] * boxes[:, 3]
+    indices = np.argsort(areas)[::-1]
+    keep = []
+    while len(indices) > 0:
+        current = indices[0]
+        keep.append(current)
+        if len(indices) == 1:
+            break
+        remaining = indices[1:]
+        ious = np.array([calculate_iou(boxes[current], boxes[idx]) for idx in remaining])
+        indices = remaining[ious < overlap_threshold]
+    return [plates[i] for i in keep]
+
+
+def vectorized_nms(plates, overlap_threshold=0.3):
+    if len(plates) <= 1:
+        return plates
+    return [plates[i] for i in nms_indices(plates, overlap_threshold)]
+
+
+def make_boxes(count: int, seed: int = 0):
+    """Clustered cascade-like hits: jittered copies around a few plate locations"""
+    rng = np.random.default_rng(seed)
+    centers = rng.integers(50, 550, size=(max(1, count // 20), 2))
+    boxes = []
+    for i in range(count):
+        cx, cy = centers[i % len(centers)]
+        w = int(rng.integers(60, 200))
+        h = max(15, w // 3 + int(rng.integers(-5, 5)))
+        boxes.append((int(cx + rng.integers(-15, 15)), int(cy + rng.integers(-10, 10)), w, h))
+    return boxes
+
+
+def main():
+    print(f"{'boxes':>6} | {'loop (ms)':>10} | {'vectorized (ms)':>15} | {'speedup':>7} | same output")
+    print("-" * 62)
+    for count in (10, 100, 1000):
+        boxes = make_boxes(count)
+        repeats = 200 if count < 1000 else 5
+        legacy_ms = time_call(lambda: legacy_nms(boxes), repeats)
+        fast_ms = time_call(lambda: vectorized_nms(boxes), repeats)
+        same = legacy_nms(boxes) == vectorized_nms(boxes)
+        print(f"{count:>6} | {legacy_ms:>10.3f} | {fast_ms:>15.3f} | {legacy_ms / fast_ms:>6.1f}x | {same}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Benchmark: one EasyOCR call per plate vs batched recognition passes
+
+Needs the EasyOCR model files (downloaded on first use).
+
+Usage (from the repository root):
+    python -m benchmarks.bench_ocr_batch [--plates 4] [--frames 10] [--batch-size 8] [--max-wait-ms 10]
+"""
+
+import argparse
+import contextlib
+import io
+import time
+from benchmarks.common import PLATE_TEXTS
+from benchmarks.bench_ocr_recognizer import make_plate_crop
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--plates", type=int, default=4, help="Plates per frame")
+    parser.add_argument("--frames", type=int, default=10)
+    parser.add_argument("--batch-size", type=int, default=8)
+    parser.add_argument("--max-wait-ms", type=float, default=10)
+    args = parser.parse_args()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        from app.services.ocr_service import get_ocr_service
+        from app.services.ocr_batcher import OCRBatcher
+        ocr = get_ocr_service()
+    if not ocr.is_available():
+        print("⚠️ EasyOCR reader unavailable - are the model files downloaded?")
+        return
+
+    batcher = OCRBatcher(ocr, max_batch_size=args.batch_size, max_wait_ms=args.max_wait_ms)
+    frames = [
+        [make_plate_crop(PLATE_TEXTS[(f + p) % len(PLATE_TEXTS)], f * args.plates + p) for p in range(args.plates)]
+        for f in range(args.frames)
+    ]
+
+    def full(crop):
+        return (0, 0, crop.shape[1], crop.shape[0])
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        ocr.extract_text(frames[0][0], full(frames[0][0]))  # Warm-up
+        batcher.submit(frames[0][0], full(frames[0][0])).result()
+
+        start = time.perf_counter()
+        sequential = [[ocr.extract_text(crop, full(crop))[0] for crop in crops] for crops in frames]
+        sequential_ms = (time.perf_counter() - start) * 1000.0
+
+        start = time.perf_counter()
+        batched = []
+        for crops in frames:
+            pending = [batcher.submit(crop, full(crop)) for crop in crops]
+            batched.append([future.result()[0] for future in pending])
+        batched_ms = (time.perf_counter() - start) * 1000.0
+
+        # Single-plate frames: what the max-wait bound costs when there is nothing to batch with
+        single = frames[0][0]
+        start = time.perf_counter()
+        for _ in range(args.frames):
+            ocr.extract_text(single, full(single))
+        single_sequential_ms = (time.perf_counter() - start) * 1000.0 / args.frames
+        start = time.perf_counter()
+        for _ in range(args.frames):
+            batcher.submit(single, full(single)).result()
+        single_batched_ms = (time.perf_counter() - start) * 1000.0 / args.frames
+
+    plates = args.frames * args.plates
+    same = sum(1 for a, b in zip(sequential, batched) for x, y in zip(a, b) if x == y)
+    print(f"📐 {args.frames} frames x {args.plates} plates, batch size {args.batch_size}, "
+          f"max wait {args.max_wait_ms:g} ms")
+    print(f"Per-plate calls: {sequential_ms / plates:7.1f} ms/plate")
+    print(f"Batched:         {batched_ms / plates:7.1f} ms/plate   ({sequential_ms / batched_ms:.2f}x)   "
+          f"{batcher.get_statistics()}")
+    print(f"Single-plate frame latency: {single_sequential_ms:.1f} ms -> {single_batched_ms:.1f} ms")
+    print(f"Identical reads: {same}/{plates}")
+
+
+if __name__ == "__main__":
+    main()
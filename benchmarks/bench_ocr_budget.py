@@ -0,0 +1,115 @@
+"""
+Benchmark: per-frame OCR latency with and without the OCR budget
+
+A clip where two plates are in view and, at frame 10, a row of parked cars
+(--crowd plates) comes into view at once. Reports per-frame OCR time, frames
+over the budget and how many frames it takes until every plate has been
+read. Plate boxes are fed to detect_and_read_plates directly, so the
+cascades do not decide how many plates there are. Without the EasyOCR model
+files each read is simulated as --ocr-ms of work.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_ocr_budget [--crowd 10] [--budget-ms 150] [--ocr-ms 60]
+"""
+
+import argparse
+import contextlib
+import io
+import time
+import cv2
+import numpy as np
+from typing import List, Tuple
+from benchmarks.common import PLATE_TEXTS, make_plate_frame
+from app.services.plate import detector as detector_module
+from app.services.plate.budget import OCRBudget
+from app.services.plate.detector import PlateDetector
+
+CROWD_FRAME = 10
+
+
+def make_scene(crowd: int, width: int = 1280, height: int = 720) -> Tuple[np.ndarray, List[Tuple[int, int, int, int]]]:
+    """Frame with 2 + `crowd` plates in a grid; returns the frame and the plate boxes"""
+    frame = make_plate_frame(width, height, plates=0, seed=7)
+    boxes = []
+    columns = 4
+    for i in range(2 + crowd):
+        plate_w = 160 + 20 * (i % 3)
+        plate_h = plate_w // 4
+        x = 40 + (i % columns) * (width // columns)
+        y = 60 + (i // columns) * 150
+        cv2.rectangle(frame, (x, y), (x + plate_w, y + plate_h), (235, 235, 235), -1)
+        cv2.rectangle(frame, (x, y), (x + plate_w, y + plate_h), (20, 20, 20), 2)
+        text = PLATE_TEXTS[i % len(PLATE_TEXTS)]
+        scale = plate_h / 30.0
+        text_size = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, scale, 2)[0]
+        cv2.putText(frame, text, (x + (plate_w - text_size[0]) // 2, y + (plate_h + text_size[1]) // 2),
+                    cv2.FONT_HERSHEY_SIMPLEX, scale, (10, 10, 10), 2)
+        boxes.append((x, y, plate_w, plate_h))
+    return frame, boxes
+
+
+def run(frame: np.ndarray, boxes: List[Tuple[int, int, int, int]], frames: int, budget_ms: float) -> dict:
+    """Run the clip once; returns per-frame OCR milliseconds and frames until every plate was read"""
+    detector = PlateDetector()
+    detector.ocr_budget = OCRBudget(budget_ms) if budget_ms else None
+    rng = np.random.default_rng(0)
+    scores = [float(score) for score in rng.uniform(0.6, 0.95, len(boxes))]
+
+    frame_ms = []
+    read_once = set()
+    all_read_frame = None
+    for index in range(frames):
+        visible = 2 if index < CROWD_FRAME else len(boxes)
+        detector.detect_plates_with_scores = lambda *args, **kwargs: (boxes[:visible], scores[:visible])
+
+        start = time.perf_counter()
+        results = detector.detect_and_read_plates(frame)
+        frame_ms.append((time.perf_counter() - start) * 1000.0)
+
+        read_once.update(result['coordinates'] for result in results if not result['deferred'])
+        if all_read_frame is None and index >= CROWD_FRAME and len(read_once) == len(boxes):
+            all_read_frame = index - CROWD_FRAME
+
+    stats = detector.ocr_budget.get_statistics() if detector.ocr_budget else None
+    return {'frame_ms': np.array(frame_ms), 'all_read_frames': all_read_frame, 'stats': stats}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--crowd", type=int, default=10)
+    parser.add_argument("--frames", type=int, default=40)
+    parser.add_argument("--budget-ms", type=float, default=150)
+    parser.add_argument("--ocr-ms", type=float, default=60, help="Simulated read time without EasyOCR")
+    args = parser.parse_args()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        ocr_available = detector_module.is_ocr_available()
+    if not ocr_available:
+        print(f"⚠️ EasyOCR reader unavailable - simulating {args.ocr_ms:.0f} ms per read")
+
+        def simulated_read(image, plate_coords, camera=None):
+            time.sleep(args.ocr_ms / 1000.0)
+            return None, 0.0
+        detector_module.is_ocr_available = lambda: True
+        detector_module.extract_plate_text = simulated_read
+
+    frame, boxes = make_scene(args.crowd)
+    print(f"📐 {args.frames} frames, 2 plates then {len(boxes)} from frame {CROWD_FRAME}, "
+          f"budget {args.budget_ms:.0f} ms")
+
+    for label, budget_ms in (("No budget", None), ("Budget", args.budget_ms)):
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = run(frame, boxes, args.frames, budget_ms)
+        frame_ms = result['frame_ms']
+        over = int(np.sum(frame_ms > args.budget_ms))
+        print(f"{label:10s} OCR per frame: median {np.median(frame_ms):7.1f} ms, max {frame_ms.max():7.1f} ms   "
+              f"frames over {args.budget_ms:.0f} ms: {over:3d}   "
+              f"every plate read after {result['all_read_frames']} frame(s)")
+        if result['stats']:
+            stats = result['stats']
+            print(f"{'':10s} deferred {stats['plates_deferred']}, overruns {stats['budget_overruns']} "
+                  f"(max {stats['max_overrun_ms']} ms), estimated {stats['estimated_plate_ms']} ms/plate")
+
+
+if __name__ == "__main__":
+    main()
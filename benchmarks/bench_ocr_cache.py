@@ -0,0 +1,91 @@
+"""
+Benchmark: perceptual-hash OCR result cache on parked and slow-moving plates
+
+Measures the cache layer itself (no EasyOCR models needed): how many OCR
+calls the cache absorbs when crops come from real PlateDetector boxes on
+noisy frames, false hits between different plates, and the cost of a
+hash + lookup.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_ocr_cache [--frames 60]
+"""
+
+import argparse
+import contextlib
+import io
+import time
+import numpy as np
+from benchmarks.common import PLATE_TEXTS, make_plate_frame, make_moving_plate_frames
+from benchmarks.bench_ocr_recognizer import make_plate_crop
+from app.services.ocr_cache import OCRResultCache
+from app.utils.config import OCR_CACHE_SIZE, OCR_CACHE_MAX_AGE_SECONDS, OCR_CACHE_MAX_DISTANCE
+
+
+def run_scene(name, frames, detector, ocr, rng):
+    """Feed every detected crop through a fresh cache; misses stand in for OCR calls"""
+    cache = OCRResultCache(OCR_CACHE_SIZE, OCR_CACHE_MAX_AGE_SECONDS, OCR_CACHE_MAX_DISTANCE)
+    lookup_seconds = 0.0
+    lookups = 0
+
+    for frame in frames:
+        # Sensor noise: consecutive frames are never pixel-identical
+        noisy = np.clip(frame + rng.normal(0, 4, frame.shape), 0, 255).astype(np.uint8)
+        with contextlib.redirect_stdout(io.StringIO()):
+            plates = detector.detect_plates(noisy)
+        for plate in plates:
+            plate_region = ocr.extract_plate_region(noisy, plate)
+            start = time.perf_counter()
+            key = cache.key(plate_region)
+            cached = cache.get(key)
+            lookup_seconds += time.perf_counter() - start
+            lookups += 1
+            if cached is None:
+                cache.put(key, ("ABC 123", 0.9))  # Stands in for the OCR read
+
+    stats = cache.get_statistics()
+    per_lookup = lookup_seconds * 1e6 / lookups if lookups else 0
+    print(f"{name:28s} {lookups:4d} crops   hit rate {stats['cache_hit_rate']:5.1f}%   "
+          f"OCR calls {stats['cache_misses']:3d}   hash + lookup {per_lookup:4.0f} µs")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--frames", type=int, default=60)
+    args = parser.parse_args()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        from app.services.ocr_service import LicensePlateOCR
+        from app.services.plate.detector import get_plate_detector
+        ocr = LicensePlateOCR(load_reader=False)  # Only extract_plate_region is used
+        detector = get_plate_detector()
+
+    rng = np.random.default_rng(0)
+    print(f"📐 {args.frames} noisy frames per scene, cache size {OCR_CACHE_SIZE}, "
+          f"tolerance {OCR_CACHE_MAX_DISTANCE} bits")
+    run_scene("Parked car", [make_plate_frame(seed=1)] * args.frames, detector, ocr, rng)
+    run_scene("Slow car (1 px/frame)", make_moving_plate_frames(args.frames, speed=1), detector, ocr, rng)
+
+    # Different plates must never share a read
+    keys = []
+    for text in PLATE_TEXTS:
+        for seed in range(3):
+            crop = make_plate_crop(text, seed)
+            plate_region = ocr.extract_plate_region(crop, (0, 0, crop.shape[1], crop.shape[0]))
+            keys.append((text, OCRResultCache().key(plate_region)))
+    distances = [bin(a ^ b).count("1") for i, (text_a, a) in enumerate(keys)
+                 for text_b, b in keys[i + 1:] if text_a != text_b]
+    print(f"Hash distance between different plates: min {min(distances)} bits, "
+          f"false hits {sum(d <= OCR_CACHE_MAX_DISTANCE for d in distances)}/{len(distances)} pairs")
+
+    # Worst case lookup: a miss against a full cache scans every entry
+    full = OCRResultCache(OCR_CACHE_SIZE, OCR_CACHE_MAX_AGE_SECONDS, OCR_CACHE_MAX_DISTANCE)
+    for _ in range(OCR_CACHE_SIZE):
+        full.put(int(rng.integers(0, 2 ** 62)), ("XXX 000", 0.5))
+    start = time.perf_counter()
+    for _ in range(1000):
+        full.get(keys[0][1])
+    print(f"Miss against a full cache: {(time.perf_counter() - start) * 1e3:.0f} µs")
+
+
+if __name__ == "__main__":
+    main()
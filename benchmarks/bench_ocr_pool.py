@@ -0,0 +1,97 @@
+"""
+Benchmark: in-process OCR vs the OCR worker process pool
+
+Reports how late a 10 ms "UI" timer fires while plates are being read (the
+stall the customtkinter loop sees), plate throughput, and the cost of handing
+a crop to a worker through shared memory vs pickling it. The OCR parts need
+the EasyOCR model files.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_ocr_pool [--crops 24] [--workers 2]
+"""
+
+import argparse
+import contextlib
+import io
+import pickle
+import threading
+import time
+import numpy as np
+from multiprocessing import shared_memory
+from benchmarks.common import PLATE_TEXTS, time_call
+from benchmarks.bench_ocr_recognizer import make_plate_crop
+
+
+def measure_ui_lateness(work) -> dict:
+    """Run `work()` while a 10 ms timer ticks on another thread; returns timer lateness and work time"""
+    lateness = []
+    stop = threading.Event()
+
+    def tick():
+        while not stop.is_set():
+            expected = time.perf_counter() + 0.010
+            time.sleep(0.010)
+            lateness.append(max(0.0, time.perf_counter() - expected) * 1000.0)
+
+    ticker = threading.Thread(target=tick, daemon=True)
+    ticker.start()
+    start = time.perf_counter()
+    work()
+    seconds = time.perf_counter() - start
+    stop.set()
+    ticker.join()
+
+    return {'seconds': seconds, 'max_late_ms': max(lateness, default=0.0),
+            'p95_late_ms': float(np.percentile(lateness, 95)) if lateness else 0.0}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--crops", type=int, default=24)
+    parser.add_argument("--workers", type=int, default=2)
+    args = parser.parse_args()
+
+    crops = [make_plate_crop(PLATE_TEXTS[i % len(PLATE_TEXTS)], i) for i in range(args.crops)]
+    boxes = [(0, 0, crop.shape[1], crop.shape[0]) for crop in crops]
+
+    # Hand-over cost of one grayscale plate region
+    region = np.ascontiguousarray(crops[0][:, :, 0])
+    slot = shared_memory.SharedMemory(create=True, size=region.nbytes)
+    shm_us = time_call(lambda: np.ndarray(region.shape, dtype=np.uint8, buffer=slot.buf).__setitem__(..., region),
+                       repeats=2000) * 1000
+    pickle_us = time_call(lambda: pickle.loads(pickle.dumps(region, protocol=pickle.HIGHEST_PROTOCOL)),
+                          repeats=2000) * 1000
+    slot.close()
+    slot.unlink()
+    print(f"📐 {args.crops} plate crops, {args.workers} OCR worker(s)")
+    print(f"Crop hand-over ({region.shape[1]}x{region.shape[0]}): shared memory {shm_us:.1f} µs, "
+          f"pickle round trip {pickle_us:.1f} µs")
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        from app.services.ocr_service import LicensePlateOCR
+        from app.services import ocr_pool
+        local = LicensePlateOCR(process_pool=False, cache_size=0)
+    if not local.is_available():
+        print("⚠️ EasyOCR reader unavailable - are the model files downloaded?")
+        return
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        pooled = LicensePlateOCR(process_pool=False, cache_size=0)
+        pooled.pool = ocr_pool.OCRProcessPool(args.workers)
+        pooled.is_available()  # Start the workers and load their readers
+
+        local.extract_text(crops[0], boxes[0])  # Warm-up
+        in_process = measure_ui_lateness(
+            lambda: [local.extract_text(crop, box) for crop, box in zip(crops, boxes)])
+        pool = measure_ui_lateness(
+            lambda: [future.result() for future in
+                     [pooled.submit_text(crop, box) for crop, box in zip(crops, boxes)]])
+    pooled.pool.shutdown()
+
+    for label, result in (("In-process", in_process), ("Process pool", pool)):
+        print(f"{label:13s} {result['seconds'] * 1000.0 / args.crops:7.1f} ms/plate   "
+              f"UI timer late: p95 {result['p95_late_ms']:6.1f} ms, max {result['max_late_ms']:6.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
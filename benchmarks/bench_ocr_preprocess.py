@@ -0,0 +1,114 @@
+"""
+Benchmark: fixed 4x OCR preprocessing vs target-character-height scaling
+with the threshold method chosen on a thumbnail and remembered per camera
+
+Measures preprocess_plate_image only (no EasyOCR models needed).
+
+Usage (from the repository root):
+    python -m benchmarks.bench_ocr_preprocess [--crops 40]
+"""
+
+import argparse
+import contextlib
+import io
+import cv2
+import numpy as np
+from benchmarks.common import PLATE_TEXTS, time_call
+from benchmarks.bench_ocr_recognizer import make_plate_crop
+
+
+def legacy_preprocess(image, coordinates):
+    """Original preprocess_plate_image (4x INTER_CUBIC, three full-size thresholds per crop); returns (image, method)"""
+    x, y, w, h = coordinates
+    padding = 5
+    x1, y1 = max(0, x - padding), max(0, y - padding)
+    x2, y2 = min(image.shape[1], x + w + padding), min(image.shape[0], y + h + padding)
+    plate_region = image[y1:y2, x1:x2]
+
+    scale_factor = 4.0
+    new_width = int(plate_region.shape[1] * scale_factor)
+    new_height = int(plate_region.shape[0] * scale_factor)
+    plate_region = cv2.resize(plate_region, (new_width, new_height), interpolation=cv2.INTER_CUBIC)
+    if len(plate_region.shape) == 3:
+        plate_region = cv2.cvtColor(plate_region, cv2.COLOR_BGR2GRAY)
+    plate_region = cv2.GaussianBlur(plate_region, (3, 3), 0)
+
+    thresh1 = cv2.adaptiveThreshold(plate_region, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 11, 2)
+    _, thresh2 = cv2.threshold(plate_region, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+    _, thresh3 = cv2.threshold(plate_region, 127, 255, cv2.THRESH_BINARY_INV)
+    thresh3 = cv2.bitwise_not(thresh3)
+
+    total_pixels = thresh1.shape[0] * thresh1.shape[1]
+    white_ratios = [cv2.countNonZero(t) / total_pixels for t in (thresh1, thresh2, thresh3)]
+    best_idx = 0
+    best_score = float('inf')
+    for i, ratio in enumerate(white_ratios):
+        score = abs(ratio - 0.5)
+        if 0.2 <= ratio <= 0.8 and score < best_score:
+            best_score = score
+            best_idx = i
+
+    plate_region = [thresh1, thresh2, thresh3][best_idx]
+    plate_region = cv2.morphologyEx(plate_region, cv2.MORPH_CLOSE, np.ones((1, 1), np.uint8))
+    plate_region = cv2.morphologyEx(plate_region, cv2.MORPH_OPEN, np.ones((2, 2), np.uint8))
+    return plate_region, best_idx
+
+
+def make_camera_crops(count: int, width: int, brightness: int, seed: int):
+    """Plate crops of one camera: same lighting, slightly varying size"""
+    crops = []
+    for i in range(count):
+        crop = make_plate_crop(PLATE_TEXTS[i % len(PLATE_TEXTS)], seed + i)
+        crop_width = int(width * (0.9 + 0.2 * (i % 5) / 4))
+        crop = cv2.resize(crop, (crop_width, max(8, crop_width // 4)), interpolation=cv2.INTER_AREA)
+        crops.append(np.clip(crop.astype(np.int16) + brightness, 0, 255).astype(np.uint8))
+    return crops
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--crops", type=int, default=40, help="Crops per camera")
+    args = parser.parse_args()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        from app.services.ocr_service import LicensePlateOCR
+        ocr = LicensePlateOCR(load_reader=False)  # Only preprocess_plate_image is used
+
+    cameras = {
+        "Near, daylight": make_camera_crops(args.crops, 300, 0, 0),
+        "Mid, daylight": make_camera_crops(args.crops, 160, 0, 100),
+        "Far, dusk": make_camera_crops(args.crops, 90, -90, 200),
+        "Near, glare": make_camera_crops(args.crops, 260, 60, 300)
+    }
+
+    print(f"📐 {args.crops} crops per camera")
+    for name, crops in cameras.items():
+        boxes = [(0, 0, crop.shape[1], crop.shape[0]) for crop in crops]
+
+        def run_legacy():
+            for crop, box in zip(crops, boxes):
+                legacy_preprocess(crop, box)
+
+        def run_adaptive():
+            for crop, box in zip(crops, boxes):
+                ocr.preprocess_plate_image(crop, box, camera=name)
+
+        legacy_ms = time_call(run_legacy, repeats=3) / len(crops)
+        adaptive_ms = time_call(run_adaptive, repeats=3) / len(crops)
+
+        # Output agreement: the adaptive result scaled to the legacy size vs the legacy result
+        agreement = []
+        for crop, box in zip(crops, boxes):
+            legacy_image, _ = legacy_preprocess(crop, box)
+            adaptive_image = ocr.preprocess_plate_image(crop, box, camera=name)
+            scaled = cv2.resize(adaptive_image, (legacy_image.shape[1], legacy_image.shape[0]),
+                                interpolation=cv2.INTER_NEAREST)
+            agreement.append(np.mean(scaled == legacy_image))
+        print(f"{name:16s} crop {crops[0].shape[1]:3d}x{crops[0].shape[0]:<3d} "
+              f"legacy {legacy_ms:6.2f} ms -> {legacy_image.shape[1]:4d}x{legacy_image.shape[0]:<4d}   "
+              f"adaptive {adaptive_ms:6.2f} ms -> {adaptive_image.shape[1]:4d}x{adaptive_image.shape[0]:<4d}   "
+              f"({legacy_ms / adaptive_ms:4.1f}x)   same pixels {np.mean(agreement) * 100:5.1f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Benchmark: EasyOCR readtext (CRAFT detector + recognizer) vs recognizer-only OCR
+
+Each mode runs in a fresh interpreter so resident memory is measured in isolation.
+Needs the EasyOCR model files (downloaded on first use).
+
+Usage (from the repository root):
+    python -m benchmarks.bench_ocr_recognizer [--crops 30]
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import subprocess
+import sys
+import time
+import cv2
+import numpy as np
+from benchmarks.common import PLATE_TEXTS
+
+
+def rss_mb() -> float:
+    """Current resident set size in MB (Linux /proc; peak RSS elsewhere)"""
+    try:
+        with open("/proc/self/status") as status:
+            for line in status:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024.0
+    except OSError:
+        pass
+    import resource
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0
+
+
+def make_plate_crop(text: str, seed: int) -> np.ndarray:
+    """A tightly localized plate crop, like the ones PlateDetector hands to OCR"""
+    rng = np.random.default_rng(seed)
+    width = int(rng.integers(120, 240))
+    height = max(30, width // 4)
+    crop = np.full((height, width, 3), 235, dtype=np.uint8)
+    cv2.rectangle(crop, (0, 0), (width - 1, height - 1), (20, 20, 20), 2)
+    scale = height / 36.0
+    text_size = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, scale, 2)[0]
+    origin = ((width - text_size[0]) // 2, (height + text_size[1]) // 2)
+    cv2.putText(crop, text, origin, cv2.FONT_HERSHEY_SIMPLEX, scale, (10, 10, 10), 2)
+    noise = rng.normal(0, 6, crop.shape)
+    return np.clip(crop + noise, 0, 255).astype(np.uint8)
+
+
+def run_mode(recognizer_only: bool, crops: int) -> dict:
+    """Load one OCR mode and time extract_text over synthetic crops (runs in the child process)"""
+    baseline = rss_mb()
+    with contextlib.redirect_stdout(io.StringIO()):
+        from app.services.ocr_service import LicensePlateOCR
+        start = time.perf_counter()
+        ocr = LicensePlateOCR(recognizer_only=recognizer_only)
+        load_seconds = time.perf_counter() - start
+    if not ocr.is_available():
+        return {"available": False}
+    loaded = rss_mb()
+
+    samples = [(PLATE_TEXTS[i % len(PLATE_TEXTS)], make_plate_crop(PLATE_TEXTS[i % len(PLATE_TEXTS)], i))
+               for i in range(crops)]
+    with contextlib.redirect_stdout(io.StringIO()):
+        ocr.extract_text(samples[0][1], (0, 0, samples[0][1].shape[1], samples[0][1].shape[0]))  # Warm-up
+        texts = []
+        start = time.perf_counter()
+        for _, crop in samples:
+            texts.append(ocr.extract_text(crop, (0, 0, crop.shape[1], crop.shape[0]))[0])
+        elapsed = time.perf_counter() - start
+
+    return {
+        "available": True,
+        "load_seconds": load_seconds,
+        "model_rss_mb": loaded - baseline,
+        "peak_rss_mb": rss_mb(),
+        "ms_per_plate": elapsed * 1000.0 / len(samples),
+        "correct": sum(1 for (truth, _), text in zip(samples, texts) if text == truth),
+        "texts": texts
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--crops", type=int, default=30)
+    parser.add_argument("--mode", choices=["readtext", "recognizer"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        print(json.dumps(run_mode(args.mode == "recognizer", args.crops)))
+        return
+
+    results = {}
+    for mode, label in (("readtext", "readtext (CRAFT + recognizer)"), ("recognizer", "Recognizer only")):
+        child = subprocess.run([sys.executable, "-m", "benchmarks.bench_ocr_recognizer",
+                                "--mode", mode, "--crops", str(args.crops)],
+                               capture_output=True, text=True)
+        if child.returncode != 0:
+            print(f"{label:30s} failed:\n{child.stderr.strip()[-500:]}")
+            return
+        result = json.loads(child.stdout.strip().splitlines()[-1])
+        if not result["available"]:
+            print(f"⚠️ EasyOCR reader unavailable ({label}) - are the model files downloaded?")
+            return
+        results[mode] = result
+        print(f"{label:30s} load {result['load_seconds']:5.2f} s   models +{result['model_rss_mb']:6.0f} MB RSS   "
+              f"{result['ms_per_plate']:7.1f} ms/plate   correct {result['correct']}/{args.crops}")
+
+    before, after = results["readtext"], results["recognizer"]
+    same = sum(1 for a, b in zip(before["texts"], after["texts"]) if a == b)
+    print(f"Speedup: {before['ms_per_plate'] / after['ms_per_plate']:.2f}x   "
+          f"memory saved: {before['model_rss_mb'] - after['model_rss_mb']:.0f} MB   "
+          f"identical reads: {same}/{args.crops}")
+
+
+if __name__ == "__main__":
+    main()
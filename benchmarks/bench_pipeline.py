@@ -0,0 +1,118 @@
+"""
+Benchmark: serial camera loop vs the staged capture → detect → OCR → sink pipeline
+
+A simulated camera delivers synthetic frames at --camera-fps. The serial
+loop reads, detects and OCRs each frame in one thread (like the original
+_camera_loop); the pipeline runs each step as its own stage. Reports frames
+shown per second, capture-to-display latency and frames dropped. Without the
+EasyOCR model files each read is simulated as --ocr-ms of work.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_pipeline [--seconds 5] [--camera-fps 30] [--ocr-ms 80] [--ocr-workers 2]
+"""
+
+import argparse
+import contextlib
+import io
+import time
+import numpy as np
+from benchmarks.common import make_plate_frames
+from app.services import pipeline as pipeline_module
+from app.services.plate import detector as detector_module
+from app.services.pipeline import PlateFrame, build_plate_pipeline
+
+
+class SimulatedCamera:
+    """Pipeline source returning synthetic PlateFrames at a fixed frame rate for `seconds`"""
+
+    def __init__(self, frames, fps: float, seconds: float):
+        self.frames = frames
+        self.interval = 1.0 / fps
+        self.end = time.perf_counter() + seconds
+        self.next_time = time.perf_counter()
+        self.frame_id = 0
+
+    def __call__(self):
+        delay = self.next_time - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        self.next_time += self.interval
+        if time.perf_counter() >= self.end:
+            return None
+        self.frame_id += 1
+        frame = self.frames[self.frame_id % len(self.frames)]
+        return PlateFrame(self.frame_id, "Bench", time.perf_counter(), frame)
+
+
+def run_serial(camera: SimulatedCamera) -> dict:
+    """One thread: read, detect, OCR, 'display'; frames arriving meanwhile are missed"""
+    detector = detector_module.get_plate_detector()
+    latencies = []
+    started = time.perf_counter()
+    while True:
+        item = camera()
+        if item is None:
+            break
+        plates, scores = detector.detect_plates_with_scores(item.frame)
+        detector.read_detected_plates(item.frame, plates, scores, item.camera)
+        latencies.append(time.perf_counter() - item.captured_at)
+    elapsed = time.perf_counter() - started
+    return {'shown': len(latencies), 'fps': len(latencies) / elapsed, 'latency_ms': np.array(latencies) * 1000.0,
+            'captured': camera.frame_id}
+
+
+def run_pipeline(camera: SimulatedCamera, ocr_workers: int) -> dict:
+    latencies = []
+    pipeline = build_plate_pipeline(
+        camera, on_frame=lambda item, display_frame: latencies.append(time.perf_counter() - item.captured_at),
+        ocr_workers=ocr_workers, log=False)
+    started = time.perf_counter()
+    pipeline.start()
+    pipeline.join()
+    elapsed = time.perf_counter() - started
+    stats = pipeline.get_statistics()
+    return {'shown': len(latencies), 'fps': len(latencies) / elapsed, 'latency_ms': np.array(latencies) * 1000.0,
+            'captured': stats['capture']['captured'],
+            'dropped': sum(stage.get('dropped', 0) for stage in stats.values()),
+            'summary': pipeline.format_statistics()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--camera-fps", type=float, default=30.0)
+    parser.add_argument("--ocr-ms", type=float, default=80, help="Simulated read time without EasyOCR")
+    parser.add_argument("--ocr-workers", type=int, default=1)
+    args = parser.parse_args()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        ocr_available = detector_module.is_ocr_available()
+    if not ocr_available:
+        print(f"⚠️ EasyOCR reader unavailable - simulating {args.ocr_ms:.0f} ms per read")
+
+        def simulated_read(image, plate_coords, camera=None):
+            time.sleep(args.ocr_ms / 1000.0)
+            return None, 0.0
+        detector_module.is_ocr_available = lambda: True
+        detector_module.extract_plate_text = simulated_read
+
+    frames = make_plate_frames(20)
+    # Load the cascades before timing either loop
+    with contextlib.redirect_stdout(io.StringIO()):
+        pipeline_module.get_plate_detector().detect_plates_with_scores(frames[0])
+    print(f"📐 {args.seconds:.0f} s at {args.camera_fps:.0f} fps camera, {args.ocr_workers} OCR worker(s)")
+
+    for label in ("Serial", "Pipeline"):
+        camera = SimulatedCamera(frames, args.camera_fps, args.seconds)
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = run_serial(camera) if label == "Serial" else run_pipeline(camera, args.ocr_workers)
+        latency_ms = result['latency_ms']
+        print(f"{label:9s} shown {result['shown']:4d}/{result['captured']:4d} frames ({result['fps']:5.1f} fps)   "
+              f"latency median {np.median(latency_ms):7.1f} ms, max {latency_ms.max():7.1f} ms"
+              + (f"   dropped {result['dropped']}" if 'dropped' in result else ""))
+        if 'summary' in result:
+            print(f"{'':9s} {result['summary']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Benchmark: camera panel preview cost per update
+
+Old path (all on the UI thread): copy the frame, draw the plates, BGR→RGB
+on the full frame, PIL LANCZOS resize to 400x300 and a new CTkImage.
+New path (CameraPreview): cv2.resize into a reused buffer and drawing on
+that buffer on the pipeline thread; the UI thread only pastes the buffer
+into one PhotoImage. The PhotoImage paste needs a display; without one only
+the buffer wrapping is timed.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_preview [--width 1280] [--height 720] [--repeats 200]
+"""
+
+import argparse
+import time
+import cv2
+import numpy as np
+from PIL import Image
+from benchmarks.common import make_plate_frame
+from app.services.plate.detector import get_plate_detector
+from app.utils.config import PREVIEW_SIZE
+
+
+class FakeLabel:
+    """Stands in for the CTkLabel: runs scheduled paints when asked"""
+
+    def __init__(self):
+        self.callbacks = []
+
+    def after(self, delay, callback):
+        self.callbacks.append(callback)
+
+    def configure(self, **kwargs):
+        pass
+
+
+def old_update(frame: np.ndarray, results) -> Image.Image:
+    """The original sink + _update_camera_display work (without the Tk widget update)"""
+    display_frame = get_plate_detector().draw_plates_with_text(frame.copy(), results)
+    rgb_frame = cv2.cvtColor(display_frame, cv2.COLOR_BGR2RGB)
+    pil_image = Image.fromarray(rgb_frame)
+    return pil_image.resize(PREVIEW_SIZE, Image.Resampling.LANCZOS)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--width", type=int, default=1280)
+    parser.add_argument("--height", type=int, default=720)
+    parser.add_argument("--repeats", type=int, default=200)
+    args = parser.parse_args()
+
+    frame = make_plate_frame(args.width, args.height, plates=2, seed=1)
+    results = [{'coordinates': (100, 200, 240, 60), 'text': 'ABC 123', 'confidence': 0.91, 'valid': True},
+               {'coordinates': (700, 400, 200, 50), 'text': None, 'confidence': 0.0, 'valid': False}]
+
+    try:
+        import tkinter as tk
+        root = tk.Tk()
+        root.withdraw()
+    except Exception:
+        root = None
+        print("⚠️ No display - PhotoImage paste not timed")
+
+    from app.ui.widget.camera_preview import CameraPreview
+    if root is None:
+        import app.ui.widget.camera_preview as preview_module
+
+        class NullPhoto:
+            def __init__(self, *args):
+                pass
+
+            def paste(self, image):
+                image.load()
+        preview_module.ImageTk.PhotoImage = NullPhoto
+
+    print(f"📐 {args.width}x{args.height} frame → {PREVIEW_SIZE[0]}x{PREVIEW_SIZE[1]} preview, {args.repeats} updates")
+
+    start = time.perf_counter()
+    for _ in range(args.repeats):
+        old_update(frame, results)
+    old_ms = (time.perf_counter() - start) * 1000.0 / args.repeats
+    print(f"Old      UI thread {old_ms:7.2f} ms per update")
+
+    label = FakeLabel()
+    preview = CameraPreview(label, max_fps=0)
+    preview.start()
+    render_seconds = 0.0
+    for _ in range(args.repeats):
+        start = time.perf_counter()
+        preview.submit(frame, results, time.perf_counter())
+        render_seconds += time.perf_counter() - start
+        for callback in label.callbacks:
+            callback()
+        label.callbacks.clear()
+    stats = preview.get_statistics()
+    print(f"Preview  pipeline thread {render_seconds * 1000.0 / args.repeats:7.2f} ms, "
+          f"UI thread {stats['paint_ms']:7.2f} ms per update (max {stats['max_paint_ms']:.2f} ms)")
+
+    if root is not None:
+        root.destroy()
+
+
+if __name__ == "__main__":
+    main()
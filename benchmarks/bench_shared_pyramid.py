@@ -0,0 +1,71 @@
+"""
+Benchmark: per-parameter-set detectMultiScale vs shared image pyramid
+
+Usage (from the repository root):
+    python -m benchmarks.bench_shared_pyramid [--frames 20] [--width 640] [--height 480]
+"""
+
+import argparse
+import contextlib
+import io
+import cv2
+from benchmarks.common import make_plate_frames, measure_fps
+from app.services.plate.detector import PlateDetector
+
+
+def cascade_only(detector: PlateDetector, frame):
+    """Cascade stage of detect_plates (bordered-plate pass excluded)"""
+    gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+    names = list(detector.cascade_models.keys())
+    if detector.use_shared_pyramid:
+        return detector._detect_with_shared_pyramid(gray, names)[0]
+    plates = []
+    for name in names:
+        plates.extend(detector._detect_with_model(gray, detector.cascade_models[name], name)[0])
+    return plates
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--frames", type=int, default=20)
+    parser.add_argument("--width", type=int, default=640)
+    parser.add_argument("--height", type=int, default=480)
+    args = parser.parse_args()
+
+    frames = make_plate_frames(args.frames, args.width, args.height)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        legacy = PlateDetector(use_shared_pyramid=False)
+        shared = PlateDetector(use_shared_pyramid=True)
+
+    print(f"📐 {len(frames)} synthetic frames at {args.width}x{args.height}, "
+          f"models: {', '.join(legacy.get_available_models())}")
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        legacy_fps = measure_fps(lambda f: cascade_only(legacy, f), frames)
+        shared_fps = measure_fps(lambda f: cascade_only(shared, f), frames)
+        legacy_full = measure_fps(legacy.detect_plates, frames)
+        shared_full = measure_fps(shared.detect_plates, frames)
+
+        # Box agreement on the final detect_plates output
+        matched = total = 0
+        for frame in frames:
+            before = legacy.detect_plates(frame)
+            after = shared.detect_plates(frame)
+            total += max(len(before), len(after))
+            matched += sum(
+                1 for box in before
+                if any(legacy._calculate_iou(box, other) >= 0.5 for other in after)
+            )
+
+    print(f"Cascade stage   before: {legacy_fps:7.2f} fps   after: {shared_fps:7.2f} fps   "
+          f"({shared_fps / legacy_fps:.2f}x)")
+    print(f"detect_plates   before: {legacy_full:7.2f} fps   after: {shared_full:7.2f} fps   "
+          f"({shared_full / legacy_full:.2f}x)")
+    print(f"Shared pyramid: {shared.pyramid_engine.last_level_count} levels, "
+          f"{shared.pyramid_engine.last_cascade_passes} cascade passes on the last frame")
+    print(f"Boxes matching the per-parameter-set output (IoU >= 0.5): {matched}/{total}")
+
+
+if __name__ == "__main__":
+    main()
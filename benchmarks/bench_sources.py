@@ -0,0 +1,56 @@
+"""
+Benchmark: end-to-end plate pipeline on a synthetic camera
+
+Feeds SyntheticPlateSource frames (plates in PlateValidator formats moving
+across the frame at --fps) through the same CameraSource and
+build_plate_pipeline code the UI uses, and reports throughput, latency,
+drops and how many of the rendered plates were read correctly.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_sources [--seconds 10] [--fps 15] [--plates 2] [--ocr-workers 1]
+"""
+
+import argparse
+import contextlib
+import io
+import time
+from app.services.frame_sources import SyntheticPlateSource
+from app.services.pipeline import CameraSource, build_plate_pipeline
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--fps", type=float, default=15.0)
+    parser.add_argument("--plates", type=int, default=2)
+    parser.add_argument("--detect-workers", type=int, default=1)
+    parser.add_argument("--ocr-workers", type=int, default=1)
+    args = parser.parse_args()
+
+    synthetic = SyntheticPlateSource("Synthetic", fps=args.fps, plates=args.plates,
+                                     frames=int(args.seconds * args.fps))
+    rendered, read_correctly = set(), set()
+
+    def on_frame(item, display_frame):
+        rendered.update(text for text, _ in item.labels or [])
+        texts = {result.get('text') for result in item.results or [] if result.get('valid')}
+        read_correctly.update(text for text, _ in item.labels or [] if text in texts)
+
+    pipeline = build_plate_pipeline(CameraSource(synthetic, "Synthetic"), on_frame=on_frame,
+                                    detect_workers=args.detect_workers, ocr_workers=args.ocr_workers, log=False)
+    print(f"📐 {args.seconds:.0f} s synthetic camera at {args.fps:.0f} fps, {args.plates} plate(s) in view")
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        pipeline.start()
+        pipeline.join()
+    elapsed = time.perf_counter() - started
+
+    stats = pipeline.get_statistics()
+    print(f"Captured {stats['capture']['captured']} frames in {elapsed:.1f} s, "
+          f"end-to-end latency {stats['sink']['latency_ms']:.0f} ms")
+    print(pipeline.format_statistics())
+    print(f"Plates read correctly: {len(read_correctly)}/{len(rendered)}")
+
+
+if __name__ == "__main__":
+    main()
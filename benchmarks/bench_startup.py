@@ -0,0 +1,75 @@
+"""
+Benchmark: import-time cost of the detection stack with lazy model loading
+
+Each measurement runs in a fresh interpreter so nothing is cached between them.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_startup [--skip-ui]
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+
+MEASURE = """
+import contextlib, io, json, sys, time
+start = time.perf_counter()
+with contextlib.redirect_stdout(io.StringIO()):
+{body}
+print(json.dumps({{"seconds": time.perf_counter() - start, "torch": "torch" in sys.modules}}))
+"""
+
+CASES = [
+    ("import app.services.plate.detector",
+     "    import app.services.plate.detector"),
+    ("import app.ui.pages.license_plates",
+     "    import app.ui.pages.license_plates"),
+    ("detector + OCR reader loaded (old import-time cost)",
+     "    from app.services.plate.detector import get_plate_detector\n"
+     "    from app.services.ocr_service import get_ocr_service\n"
+     "    get_plate_detector(); get_ocr_service()"),
+    ("start_model_warmup() returns",
+     "    from app.services.plate.detector import start_model_warmup\n"
+     "    future = start_model_warmup()"),
+    ("start_model_warmup() future done",
+     "    from app.services.plate.detector import start_model_warmup\n"
+     "    start_model_warmup().exception()"),
+]
+
+
+def measure(body: str):
+    """Run one snippet in a fresh interpreter; returns (seconds, torch imported) or None on failure"""
+    result = subprocess.run([sys.executable, "-c", MEASURE.format(body=body)],
+                            capture_output=True, text=True)
+    if result.returncode != 0:
+        return None
+    data = json.loads(result.stdout.strip().splitlines()[-1])
+    return data["seconds"], data["torch"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--skip-ui", action="store_true", help="Skip the UI page import (needs customtkinter)")
+    args = parser.parse_args()
+
+    timings = {}
+    for label, body in CASES:
+        if args.skip_ui and "app.ui" in body:
+            continue
+        measured = measure(body)
+        if measured is None:
+            print(f"{label:55s}   failed (missing dependency?)")
+            continue
+        seconds, torch_loaded = measured
+        timings[label] = seconds
+        print(f"{label:55s} {seconds:7.2f} s   torch loaded: {'yes' if torch_loaded else 'no'}")
+
+    lazy = timings.get(CASES[0][0])
+    eager = timings.get(CASES[2][0])
+    if lazy is not None and eager is not None:
+        print(f"Startup cost moved off the import path: {eager - lazy:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Benchmark: 640x480 downscale vs full-resolution vs tiled detection on large frames
+
+Usage (from the repository root):
+    python -m benchmarks.bench_tiled [--frames 4] [--width 1920] [--height 1080] [--workers 4]
+"""
+
+import argparse
+import contextlib
+import io
+import cv2
+from benchmarks.common import make_plate_frames, measure_fps
+from app.services.plate.detector import PlateDetector
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--frames", type=int, default=4)
+    parser.add_argument("--width", type=int, default=1920)
+    parser.add_argument("--height", type=int, default=1080)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--tile", type=int, nargs=2, default=None, metavar=("W", "H"))
+    parser.add_argument("--overlap", type=int, default=None)
+    args = parser.parse_args()
+
+    # Distant plates: small relative to the frame, lost when downscaling to 640x480
+    frames = make_plate_frames(args.frames, args.width, args.height, plate_width=(120, 240))
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        full = PlateDetector(use_tiling=False)
+        tiled = PlateDetector(use_tiling=True)
+        if args.workers:
+            tiled.tile_workers = args.workers
+        if args.tile:
+            tiled.tile_size = tuple(args.tile)
+        if args.overlap is not None:
+            tiled.tile_overlap = args.overlap
+
+        downscaled_fps = measure_fps(lambda f: full.detect_plates(cv2.resize(f, (640, 480))), frames)
+        full_fps = measure_fps(full.detect_plates, frames)
+        tiled_fps = measure_fps(tiled.detect_plates, frames)
+
+        found = {"downscaled": 0, "full": 0, "tiled": 0}
+        for frame in frames:
+            found["downscaled"] += len(full.detect_plates(cv2.resize(frame, (640, 480))))
+            found["full"] += len(full.detect_plates(frame))
+            found["tiled"] += len(tiled.detect_plates(frame))
+
+    print(f"📐 {len(frames)} synthetic frames at {args.width}x{args.height}, tiles {tiled.tile_size} "
+          f"overlap {tiled.tile_overlap}px, {tiled.tile_workers} worker thread(s)")
+    print(f"Downscaled 640x480:     {downscaled_fps:6.2f} fps   plates found: {found['downscaled']}")
+    print(f"Full resolution:        {full_fps:6.2f} fps   plates found: {found['full']}")
+    print(f"Tiled full resolution:  {tiled_fps:6.2f} fps   plates found: {found['tiled']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""
+Benchmark: full detection on every frame vs PlateTracker
+(full-frame detection every N frames, search windows in between)
+
+Usage (from the repository root):
+    python -m benchmarks.bench_tracker [--frames 60] [--interval 5]
+"""
+
+import argparse
+import contextlib
+import io
+from benchmarks.common import make_moving_plate_frames, measure_fps
+from app.services.plate.detector import PlateDetector
+from app.services.plate.tracker import PlateTracker, PlateTrackerSettings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--frames", type=int, default=60)
+    parser.add_argument("--interval", type=int, default=5, help="full_detection_interval")
+    args = parser.parse_args()
+
+    frames = make_moving_plate_frames(args.frames)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        detector = PlateDetector()
+        tracker = PlateTracker(detector, PlateTrackerSettings(full_detection_interval=args.interval))
+
+        every_frame_fps = measure_fps(detector.detect_plates, frames)
+        tracked_fps = measure_fps(tracker.update, frames)
+
+    stats = tracker.get_statistics()
+    print(f"📐 {len(frames)} synthetic frames, one moving plate, full detection every {args.interval} frames")
+    print(f"Detect every frame: {every_frame_fps:7.2f} fps")
+    print(f"Tracker:            {tracked_fps:7.2f} fps   ({tracked_fps / every_frame_fps:.2f}x)")
+    print(f"Full-frame passes: {stats['full_detections']}, window passes: {stats['window_detections']}, "
+          f"tracks created: {tracker.next_track_id - 1}")
+
+
+if __name__ == "__main__":
+    main()
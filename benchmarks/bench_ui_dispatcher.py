@@ -0,0 +1,101 @@
+"""
+Benchmark: per-frame after(0, ...) callbacks vs the coalescing UIDispatcher
+
+A camera thread posts a preview update for every frame at --fps while the
+main thread needs --ui-ms per update (a slow or busy Tk main loop). With
+after(0, ...) every update is queued; with UIDispatcher only the newest one
+of each kind waits. Reports the backlog, how old the shown frames are and
+how many updates were dropped. Runs without a display (simulated Tk loop).
+
+Usage (from the repository root):
+    python -m benchmarks.bench_ui_dispatcher [--seconds 5] [--fps 30] [--ui-ms 50]
+"""
+
+import argparse
+import threading
+import time
+import numpy as np
+from app.ui.dispatcher import UIDispatcher
+
+
+class SimulatedTk:
+    """Single-threaded event loop with after()/after_cancel() like Tk's"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.events = []  # (due time, id, callback)
+        self.next_id = 0
+        self.max_backlog = 0
+
+    def after(self, delay_ms, callback):
+        with self.lock:
+            self.next_id += 1
+            self.events.append((time.perf_counter() + delay_ms / 1000.0, self.next_id, callback))
+            self.max_backlog = max(self.max_backlog, len(self.events))
+            return self.next_id
+
+    def after_cancel(self, event_id):
+        with self.lock:
+            self.events = [event for event in self.events if event[1] != event_id]
+
+    def run(self, until: float):
+        while time.perf_counter() < until:
+            with self.lock:
+                due = [event for event in self.events if event[0] <= time.perf_counter()]
+                event = min(due, key=lambda e: (e[0], e[1])) if due else None
+                if event:
+                    self.events.remove(event)
+            if event:
+                event[2]()
+            else:
+                time.sleep(0.001)
+
+
+def run(args, coalesce: bool) -> dict:
+    tk = SimulatedTk()
+    dispatcher = UIDispatcher(tk)
+    ages = []
+
+    def show(captured_at):
+        time.sleep(args.ui_ms / 1000.0)
+        ages.append((time.perf_counter() - captured_at) * 1000.0)
+
+    def camera(end):
+        while time.perf_counter() < end:
+            captured_at = time.perf_counter()
+            if coalesce:
+                dispatcher.post("preview", show, captured_at)
+            else:
+                tk.after(0, lambda captured_at=captured_at: show(captured_at))
+            time.sleep(1.0 / args.fps)
+
+    end = time.perf_counter() + args.seconds
+    if coalesce:
+        dispatcher.start()
+    thread = threading.Thread(target=camera, args=(end,), daemon=True)
+    thread.start()
+    tk.run(end)
+    thread.join()
+    backlog = len(tk.events) if not coalesce else dispatcher.get_statistics()['waiting']
+    return {'ages': np.array(ages), 'shown': len(ages), 'backlog': backlog, 'max_backlog': tk.max_backlog,
+            'dropped': dispatcher.get_dropped()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--fps", type=float, default=30.0)
+    parser.add_argument("--ui-ms", type=float, default=50.0, help="Main-thread time per preview update")
+    args = parser.parse_args()
+
+    print(f"📐 {args.seconds:.0f} s, {args.fps:.0f} updates/s posted, {args.ui_ms:.0f} ms per update on the UI thread")
+    for label, coalesce in (("after(0)", False), ("Dispatcher", True)):
+        result = run(args, coalesce)
+        ages = result['ages']
+        print(f"{label:10s} shown {result['shown']:4d}   frame age median {np.median(ages):7.1f} ms, "
+              f"max {ages.max():7.1f} ms   backlog at end {result['backlog']:4d} (max {result['max_backlog']})   "
+              f"dropped {result['dropped']}")
+
+
+if __name__ == "__main__":
+    main()
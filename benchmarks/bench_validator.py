@@ -0,0 +1,60 @@
+"""
+Benchmark: original PlateValidator vs the compiled, cached engine
+
+Validates a stream of OCR-like reads: the same few plates read frame after
+frame (cache hits), with OCR confusions and missing spaces, plus unique
+junk reads. The original implementation is the copy kept by
+test_plate_validator_equivalence.py.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_validator [--reads 50000]
+"""
+
+import argparse
+import random
+from benchmarks.common import time_call
+from app.utils.plate_validator import PlateValidator, _validate_text
+from test_plate_validator_equivalence import LegacyPlateValidator
+
+READ_VARIANTS = ["518 UOZ", "5I8 U0Z", "518UOZ", "ABC 123", "ABC123", "J00 OO4", "O12 ABC", "518-UOZ"]
+
+
+def make_reads(count: int, unique_share: float, seed: int = 0):
+    """OCR reads: repeated plate variants with `unique_share` random 6-7 character strings"""
+    rng = random.Random(seed)
+    alphabet = "ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789 "
+    reads = []
+    for _ in range(count):
+        if rng.random() < unique_share:
+            reads.append(''.join(rng.choice(alphabet) for _ in range(rng.randint(6, 7))))
+        else:
+            reads.append(rng.choice(READ_VARIANTS))
+    return reads
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--reads", type=int, default=50000)
+    args = parser.parse_args()
+
+    print(f"📐 {args.reads} reads per stream")
+    for label, unique_share in (("Repeated plates", 0.0), ("20% unique reads", 0.2), ("All unique", 1.0)):
+        reads = make_reads(args.reads, unique_share)
+
+        def run_legacy():
+            for text in reads:
+                LegacyPlateValidator.validate_and_normalize(text)
+
+        def run_compiled():
+            for text in reads:
+                PlateValidator.validate_and_normalize(text)
+
+        legacy_us = time_call(run_legacy, repeats=3) * 1000 / len(reads)
+        _validate_text.cache_clear()
+        compiled_us = time_call(run_compiled, repeats=3) * 1000 / len(reads)
+        print(f"{label:17s} original {legacy_us:5.2f} µs/read   compiled {compiled_us:5.2f} µs/read   "
+              f"({legacy_us / compiled_us:4.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Shared helpers for benchmark scripts
+Synthetic frames with plate-like regions so benchmarks run without a camera
+"""
+
+import time
+import cv2
+import numpy as np
+from typing import List, Tuple, Callable
+
+PLATE_TEXTS = ["ABC 123", "518 UOZ", "NNN 101", "CNN 101", "XYZ 789"]
+
+
+def make_plate_frame(width: int = 640, height: int = 480, plates: int = 2,
+                     seed: int = 0, plate_width: Tuple[int, int] = None) -> np.ndarray:
+    """
+    Render a BGR frame with `plates` bordered plate-like regions on a noisy background
+
+    plate_width: (min, max) plate width in pixels (default: 1/6 to 1/3 of the frame)
+    """
+    rng = np.random.default_rng(seed)
+
+    # Gradient + noise background with a few random rectangles (scene clutter)
+    gradient = np.linspace(60, 160, width, dtype=np.float32)[None, :].repeat(height, axis=0)
+    noise = rng.normal(0, 12, (height, width)).astype(np.float32)
+    gray = np.clip(gradient + noise, 0, 255).astype(np.uint8)
+    frame = cv2.cvtColor(gray, cv2.COLOR_GRAY2BGR)
+
+    for _ in range(8):
+        x, y = int(rng.integers(0, width - 40)), int(rng.integers(0, height - 40))
+        w, h = int(rng.integers(20, 120)), int(rng.integers(20, 80))
+        color = tuple(int(c) for c in rng.integers(0, 255, 3))
+        cv2.rectangle(frame, (x, y), (x + w, y + h), color, -1)
+
+    for i in range(plates):
+        low, high = plate_width or (width // 6, width // 3)
+        plate_w = int(rng.integers(low, high))
+        plate_h = max(20, plate_w // 4)
+        x = int(rng.integers(0, max(1, width - plate_w)))
+        y = int(rng.integers(0, max(1, height - plate_h)))
+        cv2.rectangle(frame, (x, y), (x + plate_w, y + plate_h), (235, 235, 235), -1)
+        cv2.rectangle(frame, (x, y), (x + plate_w, y + plate_h), (20, 20, 20), 2)
+
+        text = PLATE_TEXTS[(seed + i) % len(PLATE_TEXTS)]
+        scale = plate_h / 30.0
+        text_size = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, scale, 2)[0]
+        text_x = x + max(2, (plate_w - text_size[0]) // 2)
+        text_y = y + (plate_h + text_size[1]) // 2
+        cv2.putText(frame, text, (text_x, text_y), cv2.FONT_HERSHEY_SIMPLEX, scale, (10, 10, 10), 2)
+
+    return frame
+
+
+def make_plate_frames(count: int, width: int = 640, height: int = 480,
+                      plate_width: Tuple[int, int] = None) -> List[np.ndarray]:
+    """Render `count` deterministic synthetic frames"""
+    return [make_plate_frame(width, height, plates=1 + i % 3, seed=i, plate_width=plate_width)
+            for i in range(count)]
+
+
+def measure_fps(func: Callable, frames: List[np.ndarray], repeats: int = 1) -> float:
+    """Call `func(frame)` over all frames `repeats` times and return frames/sec"""
+    start = time.perf_counter()
+    for _ in range(repeats):
+        for frame in frames:
+            func(frame)
+    elapsed = time.perf_counter() - start
+    return (len(frames) * repeats) / elapsed if elapsed > 0 else float('inf')
+
+
+def time_call(func: Callable, repeats: int = 100) -> float:
+    """Return mean milliseconds per call of `func()`"""
+    start = time.perf_counter()
+    for _ in range(repeats):
+        func()
+    return (time.perf_counter() - start) * 1000.0 / repeats
+
+
+def make_moving_plate_frames(count: int, width: int = 640, height: int = 480,
+                             speed: int = 6, seed: int = 0) -> List[np.ndarray]:
+    """Static synthetic scene with one plate crossing it `speed` px per frame"""
+    background = make_plate_frame(width, height, plates=0, seed=seed)
+    plate_w, plate_h = width // 4, max(20, width // 16)
+    frames = []
+
+    for i in range(count):
+        frame = background.copy()
+        x = (20 + i * speed) % max(1, width - plate_w)
+        y = height // 2
+        cv2.rectangle(frame, (x, y), (x + plate_w, y + plate_h), (235, 235, 235), -1)
+        cv2.rectangle(frame, (x, y), (x + plate_w, y + plate_h), (20, 20, 20), 2)
+        scale = plate_h / 30.0
+        text_size = cv2.getTextSize(PLATE_TEXTS[0], cv2.FONT_HERSHEY_SIMPLEX, scale, 2)[0]
+        cv2.putText(frame, PLATE_TEXTS[0], (x + (plate_w - text_size[0]) // 2, y + (plate_h + text_size[1]) // 2),
+                    cv2.FONT_HERSHEY_SIMPLEX, scale, (10, 10, 10), 2)
+        frames.append(frame)
+
+    return frames
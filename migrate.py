@@ -6,6 +6,7 @@ Usage:
     python migrate.py migrate    # Run migrations
     python migrate.py seed       # Run seeders  
     python migrate.py fresh      # Drop, migrate, and seed
+    python migrate.py revalidate # Re-validate stored plate numbers (--dry-run, --restart)
 """
 
 import sys
@@ -32,6 +33,10 @@ def main():
             print("✨ Running fresh migration with seeders...")
             DatabaseService.fresh()
 
+        elif command == "revalidate":
+            print("🔎 Re-validating stored license plates...")
+            DatabaseService.revalidate_plates(restart="--restart" in sys.argv, dry_run="--dry-run" in sys.argv)
+
         else:
             print(f"❌ Unknown command: {command}")
             print(__doc__)
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Behaviour tests for OCRResultCache: hits and misses, Hamming-distance
+tolerance, LRU and age eviction, and that failed reads are never cached
+"""
+
+import sys
+import time
+import numpy as np
+from app.services.ocr_cache import OCRResultCache, difference_hash
+
+READ = ("ABC 123", 0.91)
+
+
+def test_hit_and_miss():
+    cache = OCRResultCache(max_size=4, max_distance=0)
+    assert cache.get(0b1010) is None
+    cache.put(0b1010, READ)
+    assert cache.get(0b1010) == READ
+    stats = cache.get_statistics()
+    assert stats['cache_hits'] == 1 and stats['cache_misses'] == 1
+
+
+def test_hamming_tolerance():
+    """Keys within max_distance bits share a read; further ones do not"""
+    cache = OCRResultCache(max_size=4, max_distance=2)
+    key = 0b1111_0000_1111_0000
+    cache.put(key, READ)
+    assert cache.get(key ^ 0b1) == READ
+    assert cache.get(key ^ 0b11) == READ
+    assert cache.get(key ^ 0b111) is None
+
+
+def test_closest_key_wins():
+    cache = OCRResultCache(max_size=4, max_distance=4)
+    cache.put(0b0000, ("AAA 111", 0.9))
+    cache.put(0b1110, ("BBB 222", 0.9))
+    assert cache.get(0b1100) == ("BBB 222", 0.9)
+
+
+def test_lru_eviction():
+    """The least recently used entry goes first; a hit refreshes an entry"""
+    cache = OCRResultCache(max_size=2, max_distance=0)
+    cache.put(1, ("AAA 111", 0.9))
+    cache.put(2, ("BBB 222", 0.9))
+    assert cache.get(1) is not None  # 2 is now least recently used
+    cache.put(4, ("CCC 333", 0.9))
+    assert cache.get(2) is None
+    assert cache.get(1) == ("AAA 111", 0.9)
+    assert cache.get(4) == ("CCC 333", 0.9)
+    assert cache.get_statistics()['cache_size'] == 2
+
+
+def test_age_eviction():
+    cache = OCRResultCache(max_size=4, max_age_seconds=0.05, max_distance=0)
+    cache.put(7, READ)
+    assert cache.get(7) == READ
+    time.sleep(0.1)
+    assert cache.get(7) is None
+    assert cache.get_statistics()['cache_size'] == 0  # Expired entries are removed
+
+
+def test_failed_reads_are_not_cached():
+    """A read without text must not block the next near-identical crop"""
+    cache = OCRResultCache(max_size=4, max_distance=4)
+    cache.put(5, (None, 0.0))
+    assert cache.get(5) is None
+    assert cache.get_statistics()['cache_size'] == 0
+
+    # A failed read does not replace a good one either
+    cache.put(5, READ)
+    cache.put(5, (None, 0.0))
+    assert cache.get(5) == READ
+
+
+def test_disabled_cache():
+    cache = OCRResultCache(max_size=0)
+    cache.put(1, READ)
+    assert cache.get(1) is None
+
+
+def test_difference_hash_is_stable():
+    """Noise-level changes keep the hash within tolerance; a different crop does not"""
+    rng = np.random.default_rng(0)
+    crop = np.tile(np.linspace(0, 255, 160, dtype=np.uint8), (40, 1))
+    crop[:, 40:60] = 0
+    noisy = np.clip(crop.astype(np.int16) + rng.integers(-3, 4, crop.shape), 0, 255).astype(np.uint8)
+    other = crop[:, ::-1].copy()
+    distance = lambda a, b: bin(difference_hash(a) ^ difference_hash(b)).count("1")
+    assert distance(crop, noisy) <= 4
+    assert distance(crop, other) > 4
+
+
+if __name__ == "__main__":
+    print("🧪 Testing OCR result cache...")
+    tests = (test_hit_and_miss, test_hamming_tolerance, test_closest_key_wins, test_lru_eviction,
+             test_age_eviction, test_failed_reads_are_not_cached, test_disabled_cache,
+             test_difference_hash_is_stable)
+    for test in tests:
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+        except AssertionError as e:
+            print(f"❌ {test.__name__}: {e}")
+            sys.exit(1)
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Behaviour tests for the camera pipeline building blocks: bounded frame
+queues (drop-oldest, blocking, close/drain), per-camera fair lanes, the
+sink's stale-frame check and several detect workers matching one
+"""
+
+import contextlib
+import io
+import sys
+import threading
+import time
+from app.services.frame_sources import SyntheticPlateSource
+from app.services.pipeline import (FrameQueue, FairFrameQueue, PlateFrame, PlateSink, Pipeline, PipelineStage,
+                                   detect_frame)
+from app.services.plate.detector import PlateDetector
+
+
+def make_frame(frame_id: int, camera: str = "Camera") -> PlateFrame:
+    return PlateFrame(frame_id, camera, time.perf_counter(), None, results=[])
+
+
+def test_drop_oldest_when_full():
+    """A full drop-oldest queue discards its oldest item and counts it"""
+    queue = FrameQueue(maxsize=2)
+    for item in (1, 2, 3, 4):
+        assert queue.put(item)
+    assert len(queue) == 2
+    assert queue.dropped == 2
+    assert queue.max_depth == 2
+    assert queue.get(timeout=0) == 3
+    assert queue.get(timeout=0) == 4
+
+
+def test_blocking_put_without_drop():
+    """With drop_oldest=False put() waits for room instead of dropping"""
+    queue = FrameQueue(maxsize=1, drop_oldest=False)
+    assert queue.put(1)
+    assert not queue.put(2, timeout=0.05)  # No room came up
+    assert queue.dropped == 0
+
+    results = []
+    putter = threading.Thread(target=lambda: results.append(queue.put(3, timeout=2.0)))
+    putter.start()
+    time.sleep(0.05)
+    assert putter.is_alive()  # Still waiting for room
+    assert queue.get(timeout=0) == 1
+    putter.join(2.0)
+    assert results == [True]
+    assert queue.get(timeout=0) == 3
+    assert queue.dropped == 0
+
+
+def test_close_drains_then_returns_none():
+    """After close() get() hands out what is left, then None; put() is refused"""
+    queue = FrameQueue(maxsize=3)
+    queue.put(1)
+    queue.put(2)
+    queue.close()
+    assert not queue.put(3)
+    assert queue.get(timeout=0) == 1
+    assert queue.get(timeout=0) == 2
+    assert queue.get(timeout=0) is None
+    assert queue.get() is None  # Does not block once closed and empty
+
+
+def test_close_wakes_blocked_get():
+    queue = FrameQueue(maxsize=1)
+    results = []
+    getter = threading.Thread(target=lambda: results.append(queue.get(timeout=2.0)))
+    getter.start()
+    time.sleep(0.05)
+    queue.close()
+    getter.join(2.0)
+    assert not getter.is_alive()
+    assert results == [None]
+
+
+def test_fair_queue_round_robin():
+    """Lanes are served in turn, whatever order the frames arrived in"""
+    queue = FairFrameQueue(maxsize=3)
+    for frame_id in (1, 2, 3):
+        queue.put(make_frame(frame_id, "Lane 1"))
+    queue.put(make_frame(1, "Lane 2"))
+    queue.put(make_frame(2, "Lane 2"))
+
+    order = []
+    while len(queue):
+        item = queue.get(timeout=0)
+        order.append((item.camera, item.frame_id))
+    assert order == [("Lane 1", 1), ("Lane 2", 1), ("Lane 1", 2), ("Lane 2", 2), ("Lane 1", 3)]
+
+
+def test_fair_queue_busy_lane_drops_only_its_own_frames():
+    queue = FairFrameQueue(maxsize=2)
+    queue.put(make_frame(1, "Quiet"))
+    for frame_id in range(1, 11):
+        queue.put(make_frame(frame_id, "Busy"))
+
+    assert queue.dropped == 8
+    assert queue.dropped_by_key == {"Quiet": 0, "Busy": 8}
+    items = [queue.get(timeout=0) for _ in range(len(queue))]
+    assert [(item.camera, item.frame_id) for item in items] == [("Quiet", 1), ("Busy", 9), ("Busy", 10)]
+
+
+def test_fair_queue_close_drains():
+    queue = FairFrameQueue(maxsize=2)
+    queue.put(make_frame(1, "A"))
+    queue.put(make_frame(1, "B"))
+    queue.close()
+    assert not queue.put(make_frame(2, "A"))
+    assert queue.get(timeout=0) is not None
+    assert queue.get(timeout=0) is not None
+    assert queue.get(timeout=0) is None
+
+
+def test_fair_queue_pinned_lanes():
+    """With pinned lanes a worker only gets the lanes dealt to it"""
+    queue = FairFrameQueue(maxsize=3)
+    queue.pin_lanes(2)
+    for camera in ("A", "B", "C"):
+        queue.put(make_frame(1, camera))
+        queue.put(make_frame(2, camera))
+
+    assert queue.waiting(0) == 4 and queue.waiting(1) == 2
+    assert [queue.get(timeout=0, worker=1).camera for _ in range(2)] == ["B", "B"]
+    assert queue.get(timeout=0, worker=1) is None
+    assert sorted(queue.get(timeout=0, worker=0).camera for _ in range(4)) == ["A", "A", "C", "C"]
+
+
+def test_pinned_stage_keeps_camera_order():
+    """Each camera stays on one worker, in frame order, while the cameras run in parallel"""
+    handled = []
+    lock = threading.Lock()
+
+    def handler(item):
+        time.sleep(0.01)
+        with lock:
+            handled.append((item.camera, item.frame_id, threading.current_thread().name))
+
+    stage = PipelineStage("detect", handler, 2, queue=FairFrameQueue(10, drop_oldest=False), pin_lanes=True)
+    stage.start(None)
+    for frame_id in range(1, 11):
+        for camera in ("A", "B"):
+            stage.queue.put(make_frame(frame_id, camera))
+    stage.queue.close()
+    stage.join(5.0)
+
+    for camera in ("A", "B"):
+        frames = [(frame_id, thread) for name, frame_id, thread in handled if name == camera]
+        assert [frame_id for frame_id, _ in frames] == list(range(1, 11))
+        assert len({thread for _, thread in frames}) == 1
+    assert len({thread for _, _, thread in handled}) == 2
+
+
+def test_sink_discards_stale_frames():
+    """A frame finishing after a newer one of the same camera is not shown"""
+    shown = []
+    sink = PlateSink(on_frame=lambda item, display_frame: shown.append((item.camera, item.frame_id)),
+                     log=False, draw=False)
+    for frame_id, camera in ((1, "A"), (3, "A"), (2, "A"), (1, "B"), (4, "A")):
+        sink(make_frame(frame_id, camera))
+
+    assert shown == [("A", 1), ("A", 3), ("B", 1), ("A", 4)]
+    assert sink.stale_frames == 1
+    cameras = sink.get_camera_statistics()
+    assert cameras["A"]["stale_frames"] == 1 and cameras["A"]["frames"] == 3
+    assert cameras["B"]["stale_frames"] == 0 and cameras["B"]["frames"] == 1
+
+
+def test_detect_workers_match_serial():
+    """Four detect threads find exactly the boxes one detector finds frame by frame"""
+    source = SyntheticPlateSource(fps=None, plates=2, speed=12, frames=48, seed=3)
+    frames = []
+    while True:
+        captured = source.read_latest()
+        if captured is None:
+            break
+        frames.append(captured.frame)
+
+    detected = {}
+    with contextlib.redirect_stdout(io.StringIO()):
+        serial = PlateDetector()
+        expected = {frame_id: serial.detect_plates_with_scores(frame)
+                    for frame_id, frame in enumerate(frames, 1)}
+
+        pending = iter(enumerate(frames, 1))
+        source = lambda: next((PlateFrame(frame_id, "Camera", time.perf_counter(), frame)
+                               for frame_id, frame in pending), None)
+        pipeline = Pipeline(source, [
+            PipelineStage("detect", detect_frame, 4, len(frames), drop_oldest=False),
+            PipelineStage("sink", lambda item: detected.__setitem__(item.frame_id, (item.plates, item.scores)),
+                          1, len(frames), drop_oldest=False)
+        ])
+        pipeline.start()
+        pipeline.join(60.0)
+
+    assert len(detected) == len(frames)
+    assert any(plates for plates, _ in expected.values())  # The cascades found something to compare
+    assert detected == expected
+
+
+if __name__ == "__main__":
+    print("🧪 Testing pipeline queues and sink...")
+    tests = (test_drop_oldest_when_full, test_blocking_put_without_drop, test_close_drains_then_returns_none,
+             test_close_wakes_blocked_get, test_fair_queue_round_robin,
+             test_fair_queue_busy_lane_drops_only_its_own_frames, test_fair_queue_close_drains,
+             test_fair_queue_pinned_lanes, test_pinned_stage_keeps_camera_order, test_sink_discards_stale_frames,
+             test_detect_workers_match_serial)
+    for test in tests:
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+        except AssertionError as e:
+            print(f"❌ {test.__name__}: {e}")
+            sys.exit(1)
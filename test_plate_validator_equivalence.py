@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Property test: the compiled, cached PlateValidator (and SimplePlateValidator,
+which shares its engine) gives exactly the results of the original
+four-candidate implementation
+
+Every 6- and 7-character string over an alphabet with one representative of
+each character class the validator treats differently is checked, plus
+random strings over a wider alphabet (lowercase, padding whitespace,
+punctuation, non-ASCII letters and digits).
+"""
+
+import itertools
+import random
+import re
+import sys
+import time
+from typing import Optional
+from app.utils.plate_validator import PlateValidator
+from app.utils.plate_validator_simple import SimplePlateValidator
+
+# One character per behaviour: a letter fixed toward a digit (O) and one left alone (A),
+# a digit fixed toward a letter (0) and one left alone (3), the separator, an invalid
+# character, a lowercase letter and a non-ASCII digit
+EXHAUSTIVE_ALPHABET = "OA03 -o\u0663"
+RANDOM_ALPHABET = ("ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789" "abcdefghijklmnopqrstuvwxyz"
+                   " \t\n-_.\u00df\u00e9\u0131\u0663\uff21")
+
+
+class LegacyPlateValidator:
+    """PlateValidator before the compiled engine (four candidate strings, if/elif fixes, uncompiled regexes)"""
+    
+    @classmethod
+    def validate_and_normalize(cls, plate_text: str) -> tuple[bool, Optional[str], str]:
+        """
+        Complete validation and normalization with OCR error correction
+        Returns: (is_valid, normalized_text, plate_type)
+        """
+        if not plate_text or not isinstance(plate_text, str):
+            return False, None, "invalid"
+        
+        # Clean input
+        clean_text = plate_text.strip().upper()
+        
+        # Basic length check
+        if len(clean_text) < 6 or len(clean_text) > 7:
+            return False, None, "invalid"
+        
+        # Try multiple correction strategies
+        candidates = [
+            clean_text,  # Original
+            cls._fix_spacing(clean_text),  # Fix spacing
+            cls._fix_ocr_errors(clean_text),  # Fix OCR errors
+            cls._fix_ocr_errors(cls._fix_spacing(clean_text))  # Both
+        ]
+        
+        for candidate in candidates:
+            if cls._is_valid_format(candidate):
+                return True, candidate, cls._get_plate_type(candidate)
+        
+        return False, None, "invalid"
+    
+    @classmethod
+    def _fix_spacing(cls, text: str) -> str:
+        """Add space if missing"""
+        if ' ' in text or len(text) != 6:
+            return text
+        
+        # Try ### XXX format
+        return f"{text[:3]} {text[3:]}"
+    
+    @classmethod
+    def _fix_ocr_errors(cls, text: str) -> str:
+        """Fix common OCR errors"""
+        if ' ' not in text:
+            return text
+        
+        parts = text.split(' ')
+        if len(parts) != 2 or len(parts[0]) != 3 or len(parts[1]) != 3:
+            return text
+        
+        part1, part2 = parts
+        
+        # Fix first part to be more numeric
+        part1_fixed = ""
+        for char in part1:
+            if char == 'O':
+                part1_fixed += '0'  # O -> 0
+            elif char == 'I':
+                part1_fixed += '1'  # I -> 1
+            elif char == 'S':
+                part1_fixed += '5'  # S -> 5
+            elif char == 'J':
+                part1_fixed += '1'  # J -> 1 (common OCR error)
+            elif char == 'G':
+                part1_fixed += '6'  # G -> 6
+            elif char == 'B':
+                part1_fixed += '8'  # B -> 8
+            elif char == 'Z':
+                part1_fixed += '2'  # Z -> 2
+            elif char == 'T':
+                part1_fixed += '7'  # T -> 7
+            else:
+                part1_fixed += char
+        
+        # Fix second part to be more alphabetic
+        part2_fixed = ""
+        for char in part2:
+            if char == '0':
+                part2_fixed += 'O'  # 0 -> O
+            elif char == '1':
+                part2_fixed += 'I'  # 1 -> I
+            elif char == '5':
+                part2_fixed += 'S'  # 5 -> S
+            elif char == '4':
+                part2_fixed += 'A'  # 4 -> A (common OCR error)
+            elif char == '6':
+                part2_fixed += 'G'  # 6 -> G
+            elif char == '8':
+                part2_fixed += 'B'  # 8 -> B
+            elif char == '2':
+                part2_fixed += 'Z'  # 2 -> Z
+            elif char == '7':
+                part2_fixed += 'T'  # 7 -> T
+            else:
+                part2_fixed += char
+        
+        return f"{part1_fixed} {part2_fixed}"
+    
+    @classmethod
+    def _is_valid_format(cls, text: str) -> bool:
+        """Check if text matches valid Philippine license plate format"""
+        if not text or ' ' not in text:
+            return False
+        
+        parts = text.split(' ')
+        if len(parts) != 2:
+            return False
+        
+        part1, part2 = parts
+        if len(part1) != 3 or len(part2) != 3:
+            return False
+        
+        # Check for invalid characters (no dashes, underscores, etc.)
+        if re.search(r'[^A-Z0-9\s]', text):
+            return False
+        
+        # Must match either ### XXX or XXX ### format
+        pattern1 = r'^[0-9]{3}\s[A-Z]{3}$'  # 123 ABC
+        pattern2 = r'^[A-Z]{3}\s[0-9]{3}$'  # ABC 123
+        
+        return bool(re.match(pattern1, text) or re.match(pattern2, text))
+    
+    @classmethod
+    def _get_plate_type(cls, text: str) -> str:
+        """Get plate type"""
+        if not cls._is_valid_format(text):
+            return "invalid"
+        
+        parts = text.split(' ')
+        part1, part2 = parts
+        
+        if re.match(r'^[0-9]{3}$', part1) and re.match(r'^[A-Z]{3}$', part2):
+            return "numeric_alpha"  # 123 ABC
+        elif re.match(r'^[A-Z]{3}$', part1) and re.match(r'^[0-9]{3}$', part2):
+            return "alpha_numeric"  # ABC 123
+        else:
+            return "unknown"
+
+
+def check(text: str) -> Optional[str]:
+    """Return a failure message when the validators disagree on `text`"""
+    expected = LegacyPlateValidator.validate_and_normalize(text)
+    for validator in (PlateValidator, SimplePlateValidator):
+        actual = validator.validate_and_normalize(text)
+        if actual != expected:
+            return f"{validator.__name__}({text!r}) = {actual}, expected {expected}"
+    return None
+
+
+def test_exhaustive_short_inputs():
+    """All 6- and 7-character strings over EXHAUSTIVE_ALPHABET"""
+    for length in (6, 7):
+        for characters in itertools.product(EXHAUSTIVE_ALPHABET, repeat=length):
+            failure = check(''.join(characters))
+            assert failure is None, failure
+
+
+def test_random_inputs():
+    """Random strings of 0-10 characters over RANDOM_ALPHABET, plus non-string inputs"""
+    rng = random.Random(0)
+    for _ in range(200000):
+        text = ''.join(rng.choice(RANDOM_ALPHABET) for _ in range(rng.randint(0, 10)))
+        failure = check(text)
+        assert failure is None, failure
+
+    for value in (None, 123, b"ABC 123", ""):
+        assert PlateValidator.validate_and_normalize(value) == LegacyPlateValidator.validate_and_normalize(value)
+
+
+def test_private_helpers():
+    """_fix_spacing / _fix_ocr_errors / _is_valid_format / _get_plate_type keep their results"""
+    samples = ["J00 OO4", "5I8 U0Z", "AB0 I23", "ABC123", "518-UOZ", "O12 ABC", "ABC 123", "123 ABC", "", "A B"]
+    for text in samples:
+        for name in ("_fix_spacing", "_fix_ocr_errors", "_is_valid_format"):
+            assert getattr(PlateValidator, name)(text) == getattr(LegacyPlateValidator, name)(text), (name, text)
+        if text:
+            assert PlateValidator._get_plate_type(text) == LegacyPlateValidator._get_plate_type(text), text
+
+
+if __name__ == "__main__":
+    print("🧪 Checking PlateValidator against the original implementation...")
+    for test in (test_exhaustive_short_inputs, test_random_inputs, test_private_helpers):
+        start = time.perf_counter()
+        try:
+            test()
+            print(f"✅ {test.__name__} ({time.perf_counter() - start:.1f} s)")
+        except AssertionError as e:
+            print(f"❌ {test.__name__}: {e}")
+            sys.exit(1)
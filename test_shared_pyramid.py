@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Equivalence test for SharedPyramidEngine: the shared pyramid must return
+the same raw boxes as one detectMultiScale call per cascade and parameter set
+"""
+
+import contextlib
+import io
+import sys
+import cv2
+from app.services.frame_sources import SyntheticPlateSource
+from app.services.plate.detector import PlateDetector
+
+
+def synthetic_gray_frames(count, size, seed):
+    source = SyntheticPlateSource(fps=None, plates=3, frames=count, seed=seed, size=size, speed=17)
+    return [cv2.cvtColor(source.read_latest().frame, cv2.COLOR_BGR2GRAY) for _ in range(count)]
+
+
+def test_shared_pyramid_matches_detect_multiscale():
+    """Odd frame sizes included, so level rounding and the last (window-sized) level are covered"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        detector = PlateDetector(use_shared_pyramid=True, use_tiling=False)
+    engine = detector.pyramid_engine
+    frames = (synthetic_gray_frames(20, (640, 480), seed=1) + synthetic_gray_frames(8, (800, 600), seed=2)
+              + synthetic_gray_frames(4, (333, 251), seed=3))
+
+    for gray in frames:
+        shared = engine.detect_with_scores(gray)
+        for name, cascade in detector.cascade_models.items():
+            expected = []
+            for params in detector._get_parameter_sets(name):
+                boxes, _, _ = cascade.detectMultiScale3(
+                    gray, scaleFactor=params['scaleFactor'], minNeighbors=params['minNeighbors'],
+                    minSize=params['minSize'], maxSize=params['maxSize'],
+                    flags=cv2.CASCADE_SCALE_IMAGE, outputRejectLevels=True)
+                expected.extend(tuple(int(v) for v in box) for box in boxes)
+            got = [tuple(box) for box in shared.get(name, ([], []))[0]]
+            assert sorted(got) == sorted(expected), f"{name} on {gray.shape}: {sorted(got)} != {sorted(expected)}"
+
+
+if __name__ == "__main__":
+    print("🧪 Testing shared pyramid...")
+    tests = (test_shared_pyramid_matches_detect_multiscale,)
+    for test in tests:
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+        except AssertionError as e:
+            print(f"❌ {test.__name__}: {e}")
+            sys.exit(1)
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Behaviour tests for PlateTracker: track identity across frames, the
+full-detection schedule, track expiry and OCR reuse, against a scripted
+detector instead of the cascades
+"""
+
+import sys
+import numpy as np
+from app.services.plate.tracker import PlateTracker, PlateTrackerSettings
+
+FRAME = np.zeros((480, 640, 3), dtype=np.uint8)
+
+
+class FakeDetector:
+    """Returns scripted boxes (only those inside a search window between full passes) and records every call"""
+
+    def __init__(self, boxes_per_frame):
+        self.boxes_per_frame = boxes_per_frame
+        self.frame = 0
+        self.calls = []  # 'full' or 'window' per frame
+        self.reads = 0
+
+    def detect_plates_with_scores(self, frame, regions=None):
+        boxes = self.boxes_per_frame[self.frame] if self.frame < len(self.boxes_per_frame) else []
+        self.frame += 1
+        self.calls.append('full' if regions is None else 'window')
+        if regions is not None:
+            # Only boxes inside a search window are found between full detections
+            boxes = [box for box in boxes if any(inside(box, region) for region in regions)]
+        return list(boxes), [0.9] * len(boxes)
+
+    def read_plate_crops(self, crops, scores=None, camera=None, new_plates=None):
+        self.reads += len(crops)
+        return [{'coordinates': coords, 'text': "ABC 123", 'confidence': 0.9, 'valid': True, 'deferred': False}
+                for _, coords in crops]
+
+
+def inside(box, region):
+    x, y, w, h = box
+    rx, ry, rw, rh = region
+    return x >= rx and y >= ry and x + w <= rx + rw and y + h <= ry + rh
+
+
+def moving_plate(frames, start=(100, 200), step=(6, 2), size=(120, 40)):
+    return [[(start[0] + step[0] * i, start[1] + step[1] * i) + size] for i in range(frames)]
+
+
+def test_identity_carries_over():
+    """A moving plate keeps its track id; a second plate gets its own"""
+    first = moving_plate(10)
+    second = moving_plate(10, start=(400, 100), step=(-5, 0))
+    detector = FakeDetector([a + b for a, b in zip(first, second)])
+    tracker = PlateTracker(detector, PlateTrackerSettings(full_detection_interval=5))
+
+    ids = []
+    for index in range(10):
+        tracks = tracker.update(FRAME)
+        assert len(tracks) == 2
+        assert [track.box for track in tracks] == [first[index][0], second[index][0]]
+        ids.append([track.track_id for track in tracks])
+    assert all(frame_ids == ids[0] for frame_ids in ids)
+    assert len(set(ids[0])) == 2
+
+
+def test_full_detection_every_interval():
+    detector = FakeDetector(moving_plate(12))
+    tracker = PlateTracker(detector, PlateTrackerSettings(full_detection_interval=4))
+    for _ in range(12):
+        tracker.update(FRAME)
+    assert detector.calls == ['full', 'window', 'window', 'window'] * 3
+    stats = tracker.get_statistics()
+    assert stats['full_detections'] == 3 and stats['window_detections'] == 9
+
+
+def test_new_plates_wait_for_full_detection():
+    """A plate appearing between full detections starts a track only at the next full pass"""
+    boxes = [[], [(50, 50, 120, 40)], [(50, 50, 120, 40)], [(50, 50, 120, 40)]]
+    tracker = PlateTracker(FakeDetector(boxes), PlateTrackerSettings(full_detection_interval=3))
+    counts = [len(tracker.update(FRAME)) for _ in boxes]
+    assert counts == [0, 0, 0, 1]
+
+
+def test_lost_track_expires():
+    """A track survives max_misses frames without a match, coasting on its prediction, then goes"""
+    boxes = moving_plate(3) + [[]] * 5
+    tracker = PlateTracker(FakeDetector(boxes), PlateTrackerSettings(full_detection_interval=100, max_misses=3))
+    for _ in range(3):
+        tracker.update(FRAME)
+    track = tracker.tracks[0]
+    assert track.velocity != (0.0, 0.0)
+
+    for misses in range(1, 4):
+        predicted = track.predict()
+        tracks = tracker.update(FRAME)
+        assert tracks == [track] and track.misses == misses
+        assert track.box == predicted
+    assert tracker.update(FRAME) == []
+
+
+def test_read_is_reused_until_ocr_interval():
+    """OCR runs for a new track, then again only every ocr_interval matched frames"""
+    detector = FakeDetector(moving_plate(12))
+    tracker = PlateTracker(detector, PlateTrackerSettings(full_detection_interval=5, ocr_interval=5))
+    results = [tracker.detect_and_read_plates(FRAME) for _ in range(12)]
+    assert detector.reads == 3  # Frames 0, 5 and 10
+    assert all(result[0]['text'] == "ABC 123" and result[0]['track_id'] == 1 for result in results)
+
+
+if __name__ == "__main__":
+    print("🧪 Testing plate tracker...")
+    tests = (test_identity_carries_over, test_full_detection_every_interval, test_new_plates_wait_for_full_detection,
+             test_lost_track_expires, test_read_is_reused_until_ocr_interval)
+    for test in tests:
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+        except AssertionError as e:
+            print(f"❌ {test.__name__}: {e}")
+            sys.exit(1)
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Behaviour tests for UIDispatcher: latest-value slots per update kind,
+one run per kind and tick, error isolation and stop()
+"""
+
+import sys
+from app.ui.dispatcher import UIDispatcher
+
+
+class FakeWidget:
+    """Records after() calls instead of running a Tk main loop"""
+
+    def __init__(self):
+        self.scheduled = {}
+        self.cancelled = []
+        self.next_id = 0
+
+    def after(self, delay_ms, callback):
+        self.next_id += 1
+        self.scheduled[self.next_id] = (delay_ms, callback)
+        return self.next_id
+
+    def after_cancel(self, event_id):
+        self.cancelled.append(event_id)
+        self.scheduled.pop(event_id, None)
+
+
+def test_post_replaces_waiting_update():
+    """A second post of the same kind replaces the first and counts a drop"""
+    dispatcher = UIDispatcher(FakeWidget())
+    calls = []
+    dispatcher.post("preview", calls.append, 1)
+    dispatcher.post("preview", calls.append, 2)
+    dispatcher.post("status", calls.append, "ready")
+    assert dispatcher.get_dropped("preview") == 1
+    assert dispatcher.get_dropped("status") == 0
+    assert dispatcher.get_statistics()['waiting'] == 2
+
+    dispatcher._tick()
+    assert sorted(calls, key=str) == [2, "ready"]
+
+
+def test_tick_runs_each_kind_once():
+    dispatcher = UIDispatcher(FakeWidget())
+    calls = []
+    for value in range(5):
+        dispatcher.post("preview", calls.append, value)
+    dispatcher._tick()
+    dispatcher._tick()  # Nothing new was posted
+    assert calls == [4]
+    stats = dispatcher.get_statistics()
+    assert stats['posted'] == {"preview": 5}
+    assert stats['delivered'] == {"preview": 1}
+    assert stats['dropped'] == {"preview": 4}
+    assert stats['ticks'] == 2 and stats['waiting'] == 0
+
+
+def test_tick_survives_raising_callback():
+    dispatcher = UIDispatcher(FakeWidget())
+    calls = []
+
+    def fail():
+        raise RuntimeError("widget destroyed")
+
+    dispatcher.post("broken", fail)
+    dispatcher.post("preview", calls.append, 1)
+    dispatcher._tick()
+    assert calls == [1]
+    assert dispatcher.get_statistics()['delivered'] == {"broken": 1, "preview": 1}
+
+
+def test_start_and_tick_reschedule():
+    widget = FakeWidget()
+    dispatcher = UIDispatcher(widget, interval_ms=16)
+    dispatcher.start()
+    dispatcher.start()  # Already running: no second tick chain
+    assert len(widget.scheduled) == 1
+    event_id, (delay_ms, callback) = next(iter(widget.scheduled.items()))
+    assert delay_ms == 16
+    widget.scheduled.pop(event_id)
+    callback()
+    assert len(widget.scheduled) == 1  # Next tick scheduled
+
+
+def test_stop_clears_waiting_updates():
+    widget = FakeWidget()
+    dispatcher = UIDispatcher(widget)
+    dispatcher.start()
+    calls = []
+    dispatcher.post("preview", calls.append, 1)
+    dispatcher.stop()
+    assert widget.cancelled == [1]
+    assert not widget.scheduled
+    assert dispatcher.get_statistics()['waiting'] == 0
+
+    dispatcher._tick()  # A tick already on its way runs nothing and does not reschedule
+    assert calls == []
+    assert not widget.scheduled
+
+
+if __name__ == "__main__":
+    print("🧪 Testing UI dispatcher...")
+    tests = (test_post_replaces_waiting_update, test_tick_runs_each_kind_once, test_tick_survives_raising_callback,
+             test_start_and_tick_reschedule, test_stop_clears_waiting_updates)
+    for test in tests:
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+        except AssertionError as e:
+            print(f"❌ {test.__name__}: {e}")
+            sys.exit(1)